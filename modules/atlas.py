@@ -0,0 +1,176 @@
+import os
+import threading
+import pygame as pg
+import modules.variables as var
+import modules.imagenes as img
+import modules.cartas as cartas
+
+# Tamaños usados en la pantalla de combate
+TAMAÑO_REVERSO = (130, 180)
+BOTONES_COMBATE = [
+    (var.PLAY_HAND, (100, 45)),
+    (var.WISH_HEAL, (100, 35)),
+    (var.WISH_SHIELD, (100, 35)),
+]
+
+# Atlas de combate compartido (se arma una sola vez, en el hilo de precarga
+# o en el principal; el lock evita que se arme dos veces a la vez)
+_atlas_combate = None
+_lock_combate = threading.Lock()
+
+
+def crear_atlas(entradas: list, ancho: int = 1024, alto_max: int = 1024, convertir: bool = True) -> dict:
+    """Empaqueta varias imagenes en una o mas hojas usando filas (shelf packing).
+
+    Las imagenes se ordenan por alto descendente y se van ubicando de izquierda
+    a derecha; cuando no entran en la fila se abre una nueva, y cuando la hoja
+    supera alto_max se abre una nueva hoja.
+
+    Args:
+        entradas (list): Lista de tuplas (ruta, tamaño). La clave de cada region es la misma tupla.
+        ancho (int, optional): Ancho de cada hoja.
+        alto_max (int, optional): Alto maximo de cada hoja.
+        convertir (bool, optional): False para no convertir las hojas al formato de
+            pantalla (fuera del hilo principal); se hace despues con convertir_hojas.
+
+    Returns:
+        dict: {"hojas": [pg.Surface], "regiones": {clave: (indice_hoja, pg.Rect)}, "subs": {},
+        "convertidas": bool}
+    """
+    ordenadas = sorted(set(entradas), key=lambda e: e[1][1], reverse=True)
+
+    # Primera pasada: calcular posiciones
+    ubicaciones = []
+    altos = []
+    hoja, x, y, alto_fila = 0, 0, 0, 0
+    for clave in ordenadas:
+        w, h = clave[1]
+        if x + w > ancho:
+            x, y = 0, y + alto_fila
+            alto_fila = 0
+        if y + h > alto_max:
+            altos.append(y)
+            hoja, x, y, alto_fila = hoja + 1, 0, 0, 0
+        ubicaciones.append((clave, hoja, pg.Rect(x, y, w, h)))
+        x += w
+        alto_fila = max(alto_fila, h)
+    altos.append(y + alto_fila)
+
+    # Segunda pasada: dibujar cada imagen en su hoja
+    hojas = [pg.Surface((ancho, alto), pg.SRCALPHA) for alto in altos]
+    regiones = {}
+    for clave, indice, rect in ubicaciones:
+        hojas[indice].blit(img.decodificar(clave[0], clave[1]), rect)
+        regiones[clave] = (indice, rect)
+
+    atlas = {"hojas": hojas, "regiones": regiones, "subs": {}, "convertidas": False}
+    if convertir:
+        convertir_hojas(atlas)
+    return atlas
+
+
+def convertir_hojas(atlas: dict) -> None:
+    """Convierte las hojas al formato de pantalla si hay un display y no se hizo antes.
+
+    Args:
+        atlas (dict): Atlas creado con crear_atlas.
+    """
+    if atlas["convertidas"] or pg.display.get_surface() is None:
+        return
+    atlas["hojas"] = [h.convert_alpha() for h in atlas["hojas"]]
+    # Las subsuperficies apuntaban a las hojas sin convertir
+    atlas["subs"].clear()
+    atlas["convertidas"] = True
+
+
+def obtener_region(atlas: dict, path: str, size: tuple):
+    """Devuelve la hoja y el rect donde esta una imagen dentro del atlas.
+
+    Args:
+        atlas (dict): Atlas creado con crear_atlas.
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño con el que se empaqueto.
+
+    Returns:
+        tuple|None: (pg.Surface hoja, pg.Rect area) o None si no esta en el atlas.
+    """
+    region = atlas["regiones"].get((path, tuple(size)))
+    if region is None:
+        return None
+    return atlas["hojas"][region[0]], region[1]
+
+
+def obtener_subsuperficie(atlas: dict, path: str, size: tuple):
+    """Devuelve una subsuperficie del atlas que comparte pixeles con la hoja.
+
+    Args:
+        atlas (dict): Atlas creado con crear_atlas.
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño con el que se empaqueto.
+
+    Returns:
+        pg.Surface|None: Subsuperficie o None si no esta en el atlas.
+    """
+    clave = (path, tuple(size))
+    sub = atlas["subs"].get(clave)
+    if sub is None:
+        region = obtener_region(atlas, path, size)
+        if region is None:
+            return None
+        sub = region[0].subsurface(region[1])
+        atlas["subs"][clave] = sub
+    return sub
+
+
+def armar_atlas_combate(convertir: bool = True) -> dict:
+    """Arma el atlas de combate si todavia no existe.
+
+    El hilo de precarga lo llama con convertir=False; si el hilo principal lo
+    pide mientras se esta armando, espera a que termine en lugar de armarlo otra vez.
+
+    Args:
+        convertir (bool, optional): False para dejar las hojas sin convertir.
+
+    Returns:
+        dict: Atlas de combate.
+    """
+    global _atlas_combate
+    with _lock_combate:
+        if _atlas_combate is None:
+            todas = cartas.obtener_repositorio(var.JSON_CARDS)["cartas"]
+            entradas = [(c.ruta_reverso, TAMAÑO_REVERSO) for c in todas]
+            entradas.extend(BOTONES_COMBATE)
+            # Las imagenes que no estan en disco quedan fuera y se cargan aparte
+            entradas = [e for e in entradas if os.path.exists(e[0])]
+            _atlas_combate = crear_atlas(entradas, convertir=convertir)
+        return _atlas_combate
+
+
+def obtener_atlas_combate() -> dict:
+    """Devuelve el atlas con todos los reversos y botones de la pantalla de combate.
+
+    Se arma la primera vez que se pide (o lo deja armado la precarga) y se
+    reutiliza en las siguientes partidas. Solo se llama desde el hilo principal.
+
+    Returns:
+        dict: Atlas de combate.
+    """
+    atlas = armar_atlas_combate()
+    convertir_hojas(atlas)
+    return atlas
+
+
+def imagen_combate(path: str, size: tuple) -> pg.Surface:
+    """Devuelve una imagen de combate desde el atlas, o desde el cache si no esta empaquetada.
+
+    Args:
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño (ancho, alto).
+
+    Returns:
+        pg.Surface: Superficie lista para dibujar.
+    """
+    sub = obtener_subsuperficie(obtener_atlas_combate(), path, size)
+    if sub is None:
+        return img.cargar_imagen(path, size)
+    return sub
@@ -1,7 +1,59 @@
 import pygame as pg
 import modules.variables as var
 import modules.sonido as so
-import os
+import modules.ranking as ranking
+from collections import OrderedDict
+
+# Cache de textos renderizados: (font, texto, color, antialias) -> pg.Surface
+_cache_texto = OrderedDict()
+_stats_texto = {"hits": 0, "misses": 0}
+
+
+def render_text(font: pg.font.Font, text: str, color: tuple, antialias: bool = True) -> pg.Surface:
+    """Renderiza un texto usando un cache LRU acotado por var.TEXT_CACHE_MAX.
+
+    Si la misma fuente ya renderizo el mismo texto con el mismo color se
+    devuelve la superficie guardada en lugar de volver a rasterizar.
+
+    Args:
+        font (pg.font.Font): Fuente a utilizar.
+        text (str): Texto a renderizar.
+        color (tuple): Color del texto (R, G, B).
+        antialias (bool, optional): Suavizado de bordes. Por defecto True.
+
+    Returns:
+        pg.Surface: Superficie con el texto.
+    """
+    key = (font, text, tuple(color), antialias)
+
+    surf = _cache_texto.get(key)
+    if surf is not None:
+        _cache_texto.move_to_end(key)
+        _stats_texto["hits"] += 1
+        return surf
+
+    _stats_texto["misses"] += 1
+    surf = font.render(text, antialias, color)
+    _cache_texto[key] = surf
+    if len(_cache_texto) > var.TEXT_CACHE_MAX:
+        _cache_texto.popitem(last=False)
+    return surf
+
+
+def get_text_cache_stats() -> dict:
+    """Devuelve los contadores del cache de textos.
+
+    Returns:
+        dict: {"hits", "misses", "entradas", "hit_rate"}
+    """
+    total = _stats_texto["hits"] + _stats_texto["misses"]
+    return {
+        "hits": _stats_texto["hits"],
+        "misses": _stats_texto["misses"],
+        "entradas": len(_cache_texto),
+        "hit_rate": _stats_texto["hits"] / total if total else 0.0,
+    }
+
 
 def create_label(text: str, font: pg.font.Font, color: tuple, x: int, y: int) -> dict:
     """Crea una label con el texto y color dados en las coordenadas indicadas.
@@ -16,7 +68,7 @@ def create_label(text: str, font: pg.font.Font, color: tuple, x: int, y: int) ->
     Returns:
         dict: Diccionario que representa la label, con su superficie, rect, texto y fuente.
     """
-    surf = font.render(text, True, color)
+    surf = render_text(font, text, color)
     rect = surf.get_rect(topleft=(x, y))
 
     return {
@@ -32,23 +84,28 @@ def create_label(text: str, font: pg.font.Font, color: tuple, x: int, y: int) ->
 def draw_label(screen: pg.Surface, label: dict) -> None:
     """Dibuja la label en la pantalla.
 
+    La superficie ya esta renderizada: solo se vuelve a generar en update_label.
+
     Args:
         screen (pg.Surface): Superficie donde dibujar la label.
         label (dict): Label a dibujar.
     """
-    label["surface"] = label["font"].render(label["text"], True, label["color"])
     screen.blit(label["surface"], label["rect"])
 
 
 def update_label(label: dict, texto: str) -> None:
     """Actualiza el texto de una label y su superficie.
 
+    Si el texto no cambio no se vuelve a renderizar.
+
     Args:
         label (dict): Label a actualizar.
         texto (str): Nuevo texto
     """
+    if label["text"] == texto:
+        return
     label["text"] = texto
-    label["surface"] = label["font"].render(label["text"], True, label["color"])
+    label["surface"] = render_text(label["font"], texto, label["color"])
 
 
 
@@ -70,7 +127,7 @@ def create_button(text: str, font: pg.font.Font, txt_color: tuple, bg_color: tup
         dict: Diccionario que representa el boton
     """
     rect = pg.Rect(x, y, w, h)
-    surf_text = font.render(text, True, txt_color)
+    surf_text = render_text(font, text, txt_color)
     text_rect = surf_text.get_rect(center=rect.center)
 
     return {
@@ -86,17 +143,22 @@ def create_button(text: str, font: pg.font.Font, txt_color: tuple, bg_color: tup
     }
 
 
-def update_button_hover(button: dict, mouse_pos: tuple) -> None:
+def update_button_hover(button: dict, mouse_pos: tuple) -> bool:
     """Actualiza el color del boton si el mouse está sobre él.
 
     Args:
         button (dict): boton a actualizar.
         mouse_pos (tuple): Posicion actual del mouse.
+
+    Returns:
+        bool: True si el color cambio respecto al frame anterior.
     """
+    anterior = button["current_color"]
     if button["rect"].collidepoint(mouse_pos):
         button["current_color"] = button["hover_color"]
     else:
         button["current_color"] = button["bg_color"]
+    return button["current_color"] != anterior
 
 
 def draw_button(screen: pg.Surface, button: dict):
@@ -110,6 +172,67 @@ def draw_button(screen: pg.Surface, button: dict):
     screen.blit(button["text_surface"], button["text_rect"])
 
 
+def redraw_button(ctx: dict, fondo: pg.Surface, button: dict) -> None:
+    """Redibuja solo el area de un boton (fondo + boton) y la marca como sucia.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+        fondo (pg.Surface): Fondo del form, del mismo tamaño que la pantalla.
+        button (dict): boton a redibujar.
+    """
+    screen = ctx["screen"]
+    screen.blit(fondo, button["rect"], button["rect"])
+    draw_button(screen, button)
+    marcar_region(ctx, button["rect"])
+
+
+def invalidar_pantalla(ctx: dict) -> None:
+    """Pide que el proximo frame redibuje y presente la pantalla completa.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    ctx["render"]["completo"] = True
+
+
+def marcar_region(ctx: dict, rect: pg.Rect) -> None:
+    """Agrega una region modificada para presentar en el proximo frame.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+        rect (pg.Rect): Region de la pantalla que cambio.
+    """
+    ctx["render"]["rects"].append(pg.Rect(rect))
+
+
+def redibujo_completo(ctx: dict) -> bool:
+    """Indica si el form tiene que dibujar la pantalla completa en este frame.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+
+    Returns:
+        bool: True si hay que redibujar todo, False si alcanza con las regiones sucias.
+    """
+    return ctx["render"]["completo"] or not var.DIRTY_RECTS
+
+
+def draw_barra_progreso(ctx: dict, valor: float) -> None:
+    """Dibuja una barra de progreso fina al pie de la pantalla y marca su region.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+        valor (float): Avance de 0.0 a 1.0.
+    """
+    screen = ctx["screen"]
+    ancho, alto = screen.get_size()
+    rect = pg.Rect(0, alto - 4, ancho, 4)
+
+    pg.draw.rect(screen, var.COLORS["bg"], rect)
+    pg.draw.rect(screen, var.COLORS["hover"], (0, alto - 4, int(ancho * valor), 4))
+    marcar_region(ctx, rect)
+
+
 def button_is_clicked(button: dict, mouse_pos: tuple, mouse_pressed: tuple) -> bool:
     """Devuelve True si el boton fue clickeado.
 
@@ -151,6 +274,26 @@ def create_image_button(img_path: str, x: int, y: int, w: int, h: int) -> dict:
     }
 
 
+def create_surface_button(image: pg.Surface, x: int, y: int) -> dict:
+    """Crea un boton de imagen a partir de una superficie ya cargada (por ejemplo, de un atlas).
+
+    Args:
+        image (pg.Surface): Superficie a mostrar.
+        x (int): posicion horizontal.
+        y (int): posicion vertical.
+
+    Returns:
+        dict: Diccionario que representa el boton de imagen
+    """
+    rect = image.get_rect(topleft=(x, y))
+
+    return {
+        "type": "image_button",
+        "image": image,
+        "rect": rect
+    }
+
+
 def draw_image_button(screen: pg.Surface, button: dict) -> None:
     """Dibuja un boton de imagen en la pantalla
 
@@ -191,25 +334,9 @@ def read_scores_csv(path: str) -> list:
     archivo = open(path, "r", encoding="utf-8")
 
     for linea in archivo:
-        linea = linea.strip()  # limpia saltos de linea
-        if linea != "":
-            partes = linea.split(",")
-
-            nombre = partes[0].strip()
-            puntaje_str = partes[1].strip()
-
-            puntaje = 0
-            es_numero = True
-
-            for c in puntaje_str:
-                if c < "0" or c > "9":
-                    es_numero = False
-                    break
-
-            if es_numero:
-                puntaje = int(puntaje_str)
-
-            lista.append((nombre, puntaje))
+        fila = ranking.parsear_linea(linea)
+        if fila is not None:
+            lista.append(fila)
 
     archivo.close()
     return lista
@@ -242,17 +369,14 @@ def selection_sort_scores(lista: list) -> list:
 def guardar_puntaje_csv(path: str, nombre: str, puntaje: int) -> None:
     """Agrega un nuevo puntaje al CSV, creando el archivo si no existe.
 
+    Despues de escribir pone al dia el indice del ranking con la linea nueva.
+
     Args:
         path (str): Ruta del archivo CSV.
         nombre (str): Nombre del jugador.
         puntaje (int): Puntaje obtenido.
     """
-    if not os.path.exists(path):
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("Nombre,Puntaje\n")
-
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(f"{nombre},{puntaje}\n")
+    ranking.agregar_filas(path, [(nombre, puntaje)])
 
 
 def nombre_valido(nombre: str) -> bool:
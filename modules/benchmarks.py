@@ -0,0 +1,448 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import pygame as pg
+import modules.variables as var
+import modules.auxiliar as aux
+import modules.cartas as cartas
+import modules.motor_combate as motor
+import modules.ranking as ranking
+import modules.puntajes_sqlite as db
+import modules.perfil as perfil
+
+# Benchmarks de los caminos calientes del juego, sin ventana ni audio
+# (drivers dummy de SDL) y con semillas fijas. Cada benchmark se calibra
+# para que una ronda dure al menos var.BENCH_MIN_SEG y se toma la mediana de
+# var.BENCH_RONDAS rondas como tiempo por iteracion.
+#   python -m modules.benchmarks --guardar     -> escribe la linea de base
+#   python -m modules.benchmarks               -> compara contra la linea de base
+# Sale con codigo 1 si algun benchmark es mas lento que la base por mas del umbral.
+
+SEMILLA = 1234
+
+# Tamaños de los CSV de puntajes sinteticos
+TAMAÑOS_CSV = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+
+
+def crear_csv_puntajes(path: str, filas: int, semilla: int = SEMILLA) -> None:
+    """Escribe un CSV de puntajes sintetico y reproducible.
+
+    Args:
+        path (str): Ruta del archivo.
+        filas (int): Cantidad de filas.
+        semilla (int, optional): Semilla de los nombres y puntajes.
+    """
+    rng = random.Random(semilla)
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(filas):
+            nombre = "".join(rng.choices(letras, k=rng.randint(3, 12)))
+            file.write(f"{nombre},{rng.randint(0, 20000)}\n")
+
+
+def _mazos(por_serie: dict, cantidad: int) -> list:
+    """Genera pares de mazos con una semilla fija.
+
+    Args:
+        por_serie (dict): Cartas agrupadas por serie.
+        cantidad (int): Cantidad de estados.
+
+    Returns:
+        list: Estados de combate recien creados.
+    """
+    return [motor.crear_partida(por_serie, SEMILLA + i) for i in range(cantidad)]
+
+
+def _preparar_resolver(por_serie: dict) -> list:
+    """Crea estados con la primera carta de cada mazo ya robada.
+
+    Args:
+        por_serie (dict): Cartas agrupadas por serie.
+
+    Returns:
+        list: Estados listos para resolver_mano.
+    """
+    estados = _mazos(por_serie, 64)
+    for estado in estados:
+        motor.robar_carta(estado)
+    return estados
+
+
+def _resolver_manos(estados: list) -> None:
+    """Resuelve una mano en cada estado, restaurando las vidas para que sea repetible.
+
+    Args:
+        estados (list): Estados con cartas robadas.
+    """
+    for estado in estados:
+        hp_p = estado.hp_player
+        hp_r = estado.hp_rival
+        motor.resolver_mano(estado)
+        estado.hp_player = hp_p
+        estado.hp_rival = hp_r
+        estado.shield_activo = False
+        estado.eventos.clear()
+
+
+def _preparar_draw_combate(carpeta: str) -> dict:
+    """Inicia el form de combate en una pantalla dummy con una semilla fija.
+
+    Args:
+        carpeta (str): Carpeta temporal del benchmark (no se usa).
+
+    Returns:
+        dict: Contexto del juego listo para dibujar.
+    """
+    import modules.forms.form_game as fgame
+
+    screen = pg.display.set_mode(var.ASPECT_RATIO)
+    ctx = {
+        "screen": screen,
+        "clock": pg.time.Clock(),
+        "form": "juego",
+        "render": {"completo": True, "rects": []},
+        "pacing": {"ultimo_evento": 0},
+        "perfil": perfil.crear(),
+        "forms": {},
+    }
+
+    semilla = var.SEMILLA_PARTIDA
+    var.SEMILLA_PARTIDA = SEMILLA
+    try:
+        fgame.cargar(ctx)
+        fgame.entrar(ctx)
+    finally:
+        var.SEMILLA_PARTIDA = semilla
+
+    # Con cartas en la mesa, como en una partida en curso
+    motor.robar_carta(ctx["forms"]["combat"]["estado"])
+    return ctx
+
+
+def _draw_combate(ctx: dict) -> None:
+    """Dibuja un frame completo del form de combate.
+
+    Args:
+        ctx (dict): Contexto del juego.
+    """
+    import modules.forms.form_game as fgame
+
+    fgame.draw(ctx)
+    ctx["render"]["rects"] = []
+
+
+def _preparar_csv(tamaño: str):
+    """Devuelve una funcion de preparacion que crea el CSV sintetico del tamaño dado.
+
+    Args:
+        tamaño (str): Clave de TAMAÑOS_CSV.
+
+    Returns:
+        function: (carpeta) -> ruta del CSV.
+    """
+    def preparar(carpeta: str) -> str:
+        path = os.path.join(carpeta, f"puntajes_{tamaño}.csv")
+        if not os.path.exists(path):
+            crear_csv_puntajes(path, TAMAÑOS_CSV[tamaño])
+        return path
+    return preparar
+
+
+def _preparar_indice(tamaño: str):
+    """Devuelve una preparacion que crea el CSV y deja su indice al dia.
+
+    Args:
+        tamaño (str): Clave de TAMAÑOS_CSV.
+
+    Returns:
+        function: (carpeta) -> ruta del CSV.
+    """
+    crear = _preparar_csv(tamaño)
+
+    def preparar(carpeta: str) -> str:
+        path = crear(carpeta)
+        ranking.reconstruir(path)
+        return path
+    return preparar
+
+
+def _preparar_sqlite(tamaño: str):
+    """Devuelve una preparacion que carga el CSV sintetico en una base SQLite.
+
+    Args:
+        tamaño (str): Clave de TAMAÑOS_CSV.
+
+    Returns:
+        function: (carpeta) -> ruta de la base.
+    """
+    crear = _preparar_csv(tamaño)
+
+    def preparar(carpeta: str) -> str:
+        path = os.path.join(carpeta, f"puntajes_{tamaño}.db")
+        if not os.path.exists(path):
+            db.migrar_csv(crear(carpeta), path)
+        return path
+    return preparar
+
+
+def _pagina_profunda(path: str) -> None:
+    """Recorre las primeras 50 paginas del ranking en SQLite.
+
+    Args:
+        path (str): Ruta de la base.
+    """
+    cursor = None
+    for _ in range(50):
+        _, cursor = db.leer_pagina(cursor, var.RANKING_FILAS, "", path)
+        if cursor is None:
+            break
+
+
+def por_serie(carpeta: str) -> dict:
+    """Devuelve las cartas agrupadas por serie del repositorio.
+
+    Args:
+        carpeta (str): Carpeta temporal del benchmark (no se usa).
+
+    Returns:
+        dict: Cartas por serie.
+    """
+    return cartas.obtener_repositorio(var.JSON_CARDS)["por_serie"]
+
+
+def definir_benchmarks() -> list:
+    """Arma la lista de benchmarks.
+
+    Cada benchmark es un diccionario con:
+        "nombre"    -> identificador en la linea de base
+        "preparar"  -> (carpeta) -> dato; no se mide
+        "correr"    -> (dato) -> None; es lo que se mide
+
+    Returns:
+        list: Lista de benchmarks.
+    """
+    benchmarks = [
+        {
+            "nombre": "cartas.generate_random_deck",
+            "preparar": lambda carpeta: (por_serie(carpeta), random.Random(SEMILLA)),
+            "correr": lambda d: cartas.generate_random_deck(d[0], var.DISTRIBUCION_MAZO, d[1]),
+        },
+        {
+            "nombre": "cartas.calculate_average_stats",
+            "preparar": lambda carpeta: _mazos(por_serie(carpeta), 1)[0].mazo_player,
+            "correr": cartas.calculate_average_stats,
+        },
+        {
+            "nombre": "motor.crear_partida",
+            "preparar": por_serie,
+            "correr": lambda d: motor.crear_partida(d, SEMILLA),
+        },
+        {
+            "nombre": "motor.resolver_mano[x64]",
+            "preparar": lambda carpeta: _preparar_resolver(por_serie(carpeta)),
+            "correr": _resolver_manos,
+        },
+        {
+            "nombre": "form_game.draw",
+            "preparar": _preparar_draw_combate,
+            "correr": _draw_combate,
+        },
+        {
+            # O(n^2): solo tiene sentido con el archivo chico
+            "nombre": "aux.selection_sort_scores[1k]",
+            "preparar": lambda carpeta: aux.read_scores_csv(_preparar_csv("1k")(carpeta)),
+            "correr": lambda lista: aux.selection_sort_scores(list(lista)),
+        },
+    ]
+
+    for tamaño in TAMAÑOS_CSV:
+        benchmarks += [
+            {
+                "nombre": f"aux.read_scores_csv[{tamaño}]",
+                "preparar": _preparar_csv(tamaño),
+                "correr": aux.read_scores_csv,
+            },
+            {
+                "nombre": f"ranking.reconstruir[{tamaño}]",
+                "preparar": _preparar_csv(tamaño),
+                "correr": ranking.reconstruir,
+            },
+            {
+                "nombre": f"ranking.leer_top[{tamaño}]",
+                "preparar": _preparar_indice(tamaño),
+                "correr": lambda path: ranking.leer_top(path, 10),
+            },
+            {
+                "nombre": f"sqlite.leer_pagina_x50[{tamaño}]",
+                "preparar": _preparar_sqlite(tamaño),
+                "correr": _pagina_profunda,
+            },
+        ]
+
+    return benchmarks
+
+
+def medir(correr, dato, rondas: int = None, min_seg: float = None) -> dict:
+    """Mide una funcion calibrando las iteraciones por ronda.
+
+    Args:
+        correr (function): Funcion a medir, recibe dato.
+        dato: Argumento de la funcion.
+        rondas (int, optional): Cantidad de rondas. Por defecto var.BENCH_RONDAS.
+        min_seg (float, optional): Duracion minima de una ronda. Por defecto var.BENCH_MIN_SEG.
+
+    Returns:
+        dict: {"seg": mediana por iteracion, "min": mejor ronda por iteracion,
+        "iteraciones": iteraciones por ronda}
+    """
+    if rondas is None:
+        rondas = var.BENCH_RONDAS
+    if min_seg is None:
+        min_seg = var.BENCH_MIN_SEG
+
+    # Calibracion: se duplica hasta que una ronda dure lo suficiente
+    iteraciones = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(iteraciones):
+            correr(dato)
+        duracion = time.perf_counter() - inicio
+        if duracion >= min_seg:
+            break
+        iteraciones *= 2
+
+    tiempos = [duracion / iteraciones]
+    for _ in range(rondas - 1):
+        inicio = time.perf_counter()
+        for _ in range(iteraciones):
+            correr(dato)
+        tiempos.append((time.perf_counter() - inicio) / iteraciones)
+
+    return {"seg": statistics.median(tiempos), "min": min(tiempos), "iteraciones": iteraciones}
+
+
+def correr_benchmarks(filtro: str = "", grandes: bool = True) -> dict:
+    """Corre los benchmarks en una carpeta temporal.
+
+    Args:
+        filtro (str, optional): Solo corre los que contienen este texto en el nombre.
+        grandes (bool, optional): Si es False saltea los de 1M filas.
+
+    Returns:
+        dict: {nombre: resultado de medir} o {nombre: {"error": mensaje}}
+    """
+    resultados = {}
+    carpeta = tempfile.mkdtemp(prefix="bench_")
+    try:
+        for b in definir_benchmarks():
+            nombre = b["nombre"]
+            if filtro not in nombre or (not grandes and "[1M]" in nombre):
+                continue
+
+            print(f"{nombre} ...", end=" ", flush=True, file=sys.stderr)
+            try:
+                dato = b["preparar"](carpeta)
+                resultados[nombre] = medir(b["correr"], dato)
+                print(f"{resultados[nombre]['seg'] * 1000:.3f} ms", file=sys.stderr)
+            except (OSError, pg.error) as e:
+                resultados[nombre] = {"error": str(e)}
+                print(f"error: {e}", file=sys.stderr)
+    finally:
+        db.cerrar_todas()
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+    return resultados
+
+
+def comparar(resultados: dict, base: dict, umbral: float) -> list:
+    """Compara los resultados contra la linea de base.
+
+    Args:
+        resultados (dict): Resultados actuales.
+        base (dict): Benchmarks de la linea de base.
+        umbral (float): Tolerancia, 0.25 es un 25% mas lento.
+
+    Returns:
+        list: Tuplas (nombre, seg_base, seg_actual, cambio) de los que empeoraron.
+    """
+    regresiones = []
+    for nombre, r in resultados.items():
+        anterior = base.get(nombre)
+        if "seg" not in r or not anterior or "seg" not in anterior:
+            continue
+        cambio = r["seg"] / anterior["seg"] - 1
+        if cambio > umbral:
+            regresiones.append((nombre, anterior["seg"], r["seg"], cambio))
+    return regresiones
+
+
+def imprimir_tabla(resultados: dict, base: dict) -> None:
+    """Imprime los resultados y el cambio respecto de la base.
+
+    Args:
+        resultados (dict): Resultados actuales.
+        base (dict): Benchmarks de la linea de base (puede estar vacio).
+    """
+    print(f"{'benchmark':42} {'ms':>12} {'base ms':>12} {'cambio':>8}")
+    for nombre, r in resultados.items():
+        if "error" in r:
+            print(f"{nombre:42} {'error':>12}  {r['error']}")
+            continue
+        anterior = base.get(nombre, {}).get("seg")
+        linea = f"{nombre:42} {r['seg'] * 1000:12.4f}"
+        if anterior:
+            linea += f" {anterior * 1000:12.4f} {r['seg'] / anterior - 1:+8.1%}"
+        print(linea)
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.benchmarks [--guardar] [--umbral 0.25] ..."""
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos calientes del juego")
+    parser.add_argument("--baseline", type=str, default=var.BENCH_BASELINE)
+    parser.add_argument("--guardar", action="store_true", help="Guardar los resultados como linea de base")
+    parser.add_argument("--umbral", type=float, default=var.BENCH_UMBRAL)
+    parser.add_argument("--filtro", type=str, default="")
+    parser.add_argument("--sin-grandes", action="store_true", help="Saltear los archivos de 1M filas")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pg.display.init()
+    pg.font.init()
+
+    resultados = correr_benchmarks(args.filtro, not args.sin_grandes)
+
+    base = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            base = json.load(file)["benchmarks"]
+
+    imprimir_tabla(resultados, base)
+
+    if args.guardar:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "pygame": pg.version.ver,
+                "maquina": platform.machine(),
+                "benchmarks": resultados,
+            }, file, indent=2, sort_keys=True)
+        print(f"Linea de base guardada en {args.baseline}")
+        return
+
+    regresiones = comparar(resultados, base, args.umbral)
+    for nombre, anterior, actual, cambio in regresiones:
+        print(f"REGRESION {nombre}: {anterior * 1000:.4f} ms -> {actual * 1000:.4f} ms ({cambio:+.1%})")
+    if regresiones:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tracemalloc
+import modules.variables as var
+import modules.cartas as cartas
+import modules.motor_combate as motor
+import modules.puntajes as puntajes
+from modules.estadisticas import percentil
+
+# Generador de carga: juega muchas partidas a la vez en un solo proceso, sin
+# pygame, y guarda cada puntaje final por el mismo camino que form_results
+# (puntajes.guardar_puntaje). Cada partida es una tarea de asyncio sobre un
+# estado del motor, igual al de ctx["forms"]["combat"]["estado"], con un
+# jugador simulado que piensa un rato antes de cada accion.
+#
+# El tiempo de partida es simulado: cada milisegundo de juego espera
+# escala milisegundos reales (0.01 juega una partida de 30 s en 0.3 s).
+# Las escrituras de puntajes son bloqueantes, asi que corren en hilos
+# (asyncio.to_thread) y se mide cuanto tarda cada una.
+#   python -m modules.carga_partidas --partidas 5000 --concurrencia 500
+
+
+def elegir_accion(estado: motor.EstadoCombate, rng: random.Random) -> str:
+    """Elige la proxima accion del jugador simulado.
+
+    Usa el heal cuando le queda menos de la mitad de la vida y el shield
+    alguna vez al azar; el resto del tiempo roba carta.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+        rng (random.Random): Generador de la partida.
+
+    Returns:
+        str: "robar", "heal" o "shield".
+    """
+    if not estado.heal_usado and estado.hp_player < estado.hp_inicial_player / 2:
+        return "heal"
+    if not estado.shield_usado and rng.random() < 0.05:
+        return "shield"
+    return "robar"
+
+
+async def jugar(estado: motor.EstadoCombate, rng: random.Random, pensar_ms: float, escala: float) -> int:
+    """Juega una partida completa con las mismas reglas que form_game.
+
+    Args:
+        estado (EstadoCombate): Estado creado con motor.crear_partida.
+        rng (random.Random): Generador para el tiempo de pensar y las acciones.
+        pensar_ms (float): Tiempo medio de pensar entre acciones, en ms de juego.
+        escala (float): Segundos reales por segundo de juego.
+
+    Returns:
+        int: Cantidad de acciones realizadas.
+    """
+    acciones = 0
+    while not estado.terminada:
+        espera = rng.expovariate(1 / pensar_ms)
+        await asyncio.sleep(espera * escala / 1000)
+
+        # Lo que hace form_game.update con el tiempo que paso
+        motor.actualizar_timer(estado, espera)
+        if motor.check_fin_partida(estado):
+            break
+
+        # Lo que hace form_game.handle_event con cada clic
+        accion = elegir_accion(estado, rng)
+        if accion == "robar":
+            motor.robar_carta(estado, player=True)
+            motor.resolver_mano(estado)
+            motor.check_fin_partida(estado)
+        elif accion == "heal":
+            motor.activar_heal(estado)
+        else:
+            motor.activar_shield(estado)
+        estado.eventos.clear()
+        acciones += 1
+
+    estado.eventos.clear()
+    return acciones
+
+
+async def partida(numero: int, por_serie: dict, semilla: int, opciones: dict, metricas: dict) -> None:
+    """Juega una partida y guarda su puntaje, anotando las metricas.
+
+    Args:
+        numero (int): Numero de partida (se usa en el nombre del jugador).
+        por_serie (dict): Cartas agrupadas por serie.
+        semilla (int): Semilla de la partida.
+        opciones (dict): {"pensar_ms", "escala", "limite": asyncio.Semaphore}
+        metricas (dict): Acumulador de resultados (ver correr).
+    """
+    async with opciones["limite"]:
+        rng = random.Random(semilla)
+        estado = motor.crear_partida(por_serie, semilla)
+        acciones = await jugar(estado, rng, opciones["pensar_ms"], opciones["escala"])
+        metricas["acciones"] += acciones
+
+        inicio = time.perf_counter()
+        try:
+            await asyncio.to_thread(puntajes.guardar_puntaje, f"carga_{numero}", estado.puntaje)
+        except Exception as e:
+            metricas["errores"].append(f"partida {numero}: {e}")
+            return
+        metricas["latencias"].append((time.perf_counter() - inicio) * 1000)
+        metricas["terminadas"] += 1
+
+
+async def correr(por_serie: dict, cantidad: int, concurrencia: int, pensar_ms: float,
+                 escala: float, semilla: int) -> dict:
+    """Lanza todas las partidas, con a lo sumo concurrencia en juego a la vez.
+
+    Args:
+        por_serie (dict): Cartas agrupadas por serie.
+        cantidad (int): Cantidad total de partidas.
+        concurrencia (int): Partidas simultaneas como maximo.
+        pensar_ms (float): Tiempo medio de pensar, en ms de juego.
+        escala (float): Segundos reales por segundo de juego.
+        semilla (int): Semilla base; la partida i usa semilla + i.
+
+    Returns:
+        dict: {"terminadas", "acciones", "latencias" (ms), "errores", "segundos"}
+    """
+    opciones = {"pensar_ms": pensar_ms, "escala": escala, "limite": asyncio.Semaphore(concurrencia)}
+    metricas = {"terminadas": 0, "acciones": 0, "latencias": [], "errores": []}
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        partida(i, por_serie, semilla + i, opciones, metricas) for i in range(cantidad)
+    ))
+    metricas["segundos"] = time.perf_counter() - inicio
+    return metricas
+
+
+async def medir_memoria(por_serie: dict, cantidad: int, semilla: int) -> float:
+    """Mide la memoria de partidas en curso: estado, tarea y corrutina.
+
+    Arranca cantidad partidas que quedan esperando su primera accion y
+    cuenta lo que ocupan con tracemalloc. Las cartas son compartidas entre
+    partidas (vienen del repositorio), asi que no suman.
+
+    Args:
+        por_serie (dict): Cartas agrupadas por serie.
+        cantidad (int): Partidas a medir.
+        semilla (int): Semilla base.
+
+    Returns:
+        float: Bytes por partida.
+    """
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+
+    tareas = [
+        asyncio.create_task(jugar(motor.crear_partida(por_serie, semilla + i), random.Random(semilla + i),
+                                  var.CARGA_PENSAR_MS, 3600))
+        for i in range(cantidad)
+    ]
+    await asyncio.sleep(0)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    for tarea in tareas:
+        tarea.cancel()
+    await asyncio.gather(*tareas, return_exceptions=True)
+    return (despues - antes) / cantidad
+
+
+def imprimir_reporte(metricas: dict, memoria: float, concurrencia: int) -> None:
+    """Muestra throughput, latencias de escritura y memoria por partida.
+
+    Args:
+        metricas (dict): Resultado de correr.
+        memoria (float): Bytes por partida segun medir_memoria.
+        concurrencia (int): Partidas simultaneas usadas.
+    """
+    segundos = metricas["segundos"]
+    latencias = sorted(metricas["latencias"])
+    terminadas = metricas["terminadas"]
+
+    print(f"Partidas: {terminadas} en {segundos:.2f} s  (concurrencia {concurrencia})")
+    print(f"Throughput: {terminadas / segundos:.1f} partidas/s  {metricas['acciones'] / segundos:.0f} acciones/s")
+    print(
+        f"Escritura de puntajes (ms): p50 {percentil(latencias, 50):.2f}  p90 {percentil(latencias, 90):.2f}  "
+        f"p99 {percentil(latencias, 99):.2f}  p99.9 {percentil(latencias, 99.9):.2f}  "
+        f"max {latencias[-1] if latencias else 0.0:.2f}"
+    )
+    print(f"Memoria por partida: {memoria / 1024:.1f} KB  ({memoria * concurrencia / 2 ** 20:.1f} MB en juego)")
+    print(f"Errores: {len(metricas['errores'])}")
+    for error in metricas["errores"][:10]:
+        print(f"  {error}")
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.carga_partidas [--partidas N] [--concurrencia N] ..."""
+    parser = argparse.ArgumentParser(description="Generador de carga de partidas y puntajes")
+    parser.add_argument("--partidas", type=int, default=var.CARGA_PARTIDAS)
+    parser.add_argument("--concurrencia", type=int, default=var.CARGA_CONCURRENCIA)
+    parser.add_argument("--pensar", type=float, default=var.CARGA_PENSAR_MS, help="ms de juego entre acciones")
+    parser.add_argument("--escala", type=float, default=var.CARGA_ESCALA, help="segundos reales por segundo de juego")
+    parser.add_argument("--backend", type=str, default=var.SCORE_BACKEND, choices=sorted(puntajes.BACKENDS))
+    parser.add_argument("--destino", type=str, default=None,
+                        help="base o CSV donde guardar los puntajes (por defecto var.CARGA_DESTINO del backend)")
+    parser.add_argument("--semilla", type=int, default=None)
+    args = parser.parse_args()
+
+    # Los puntajes de prueba no van al ranking real, y la base de prueba
+    # no copia el CSV real (la migracion quedaria dentro de las mediciones)
+    if args.destino is None:
+        args.destino = var.CARGA_DESTINO[args.backend]
+    var.SCORE_BACKEND = args.backend
+    var.SCORE_MIGRAR_CSV = False
+    if args.backend == "csv":
+        var.RANKING_CSV = args.destino
+    else:
+        var.RANKING_DB = args.destino
+    puntajes.obtener_backend()
+
+    semilla = args.semilla if args.semilla is not None else motor.nueva_semilla()
+    por_serie = cartas.obtener_repositorio(var.JSON_CARDS)["por_serie"]
+
+    memoria = asyncio.run(medir_memoria(por_serie, min(args.concurrencia, 1000), semilla))
+    metricas = asyncio.run(correr(por_serie, args.partidas, args.concurrencia, args.pensar, args.escala, semilla))
+
+    print(f"Backend: {args.backend} ({os.path.abspath(args.destino)})  Semilla: {semilla}")
+    imprimir_reporte(metricas, memoria, args.concurrencia)
+    if metricas["errores"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import os
+import json
+import random
+import modules.variables as var
+import modules.indice_cartas as indice
+
+# Repositorio de cartas compartido por todo el proceso (ver obtener_repositorio)
+_repositorio = None
+
+
+class Carta:
+    """Carta lista para el combate, armada una sola vez al cargar el repositorio.
+
+    Usa __slots__: cada carta guarda solo estos campos, sin diccionario por
+    instancia, y el motor los lee como atributos. "def" del JSON queda como
+    defensa; ataque_total y daño son los de calcular_ataque_total y calcular_daño.
+    """
+
+    __slots__ = ("id", "serie", "hp", "atk", "defensa", "bonus",
+                 "ruta_frente", "ruta_reverso", "ataque_total", "daño")
+
+    def __init__(self, id: str, serie: str, hp: int, atk: int, defensa: int, bonus: float,
+                 ruta_frente: str, ruta_reverso: str, ataque_total: float, daño: int):
+        self.id = id
+        self.serie = serie
+        self.hp = hp
+        self.atk = atk
+        self.defensa = defensa
+        self.bonus = bonus
+        self.ruta_frente = ruta_frente
+        self.ruta_reverso = ruta_reverso
+        self.ataque_total = ataque_total
+        self.daño = daño
+
+    def __repr__(self) -> str:
+        return f"Carta({self.serie} {self.id} HP {self.hp} ATK {self.atk} DEF {self.defensa} +{self.bonus})"
+
+
+def load_cards(path: str) -> list:
+    """Carga un archivo JSON con cartas y devuelve la lista de cartas.
+
+    Args:
+        path (str): Ruta del archivo JSON.
+
+    Returns:
+        list: Lista de cartas (diccionarios).
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return data
+
+
+def obtener_repositorio(path: str = var.JSON_CARDS, recargar: bool = False) -> dict:
+    """Devuelve el repositorio de cartas del proceso, cargandolo la primera vez.
+
+    El JSON se parsea una sola vez y se guardan las cartas agrupadas por serie
+    e indexadas por id y por ruta del frente. Las llamadas siguientes devuelven
+    el repositorio guardado sin tocar el disco. Con recargar=True se compara el
+    mtime del archivo y se vuelve a armar si cambio; pedir otra ruta tambien
+    lo vuelve a armar.
+
+    Si existe el indice binario generado con el mismo JSON (ver
+    modules.indice_cartas) las cartas se leen de ahi en lugar del JSON, y
+    "dimensiones" trae el tamaño de cada frente; sin indice queda vacio.
+
+    Las cartas del repositorio son objetos Carta (ver crear_carta); los
+    diccionarios leidos del JSON o del indice se descartan al armarlo.
+
+    Los ids se repiten entre series y expansiones, por eso "por_id" guarda una
+    lista de cartas por id; "por_ruta" es unico por carta.
+
+    Args:
+        path (str, optional): Ruta del archivo JSON.
+        recargar (bool, optional): True para volver a leer el archivo si cambio en disco.
+
+    Returns:
+        dict: {"path", "mtime", "cartas", "por_serie", "por_id", "por_ruta", "dimensiones"}
+    """
+    global _repositorio
+    if _repositorio is not None and _repositorio["path"] == path and not recargar:
+        return _repositorio
+
+    mtime = os.path.getmtime(path)
+    if _repositorio is None or _repositorio["path"] != path or _repositorio["mtime"] != mtime:
+        desde_indice = indice.cargar(path)
+        if desde_indice is not None:
+            todas, dimensiones = desde_indice
+        else:
+            todas, dimensiones = load_cards(path), {}
+        todas = [crear_carta(c) for c in todas]
+
+        por_id = {}
+        for c in todas:
+            por_id.setdefault(c.id, []).append(c)
+
+        _repositorio = {
+            "path": path,
+            "mtime": mtime,
+            "cartas": todas,
+            "por_serie": filter_cards_by_series(todas),
+            "por_id": por_id,
+            "por_ruta": {c.ruta_frente: c for c in todas},
+            "dimensiones": dimensiones,
+        }
+
+    return _repositorio
+
+
+def crear_carta(datos: dict) -> Carta:
+    """Arma la Carta de combate a partir de una carta de cartas.json.
+
+    Convierte los stats a numeros y calcula una sola vez los valores que usa
+    el combate, asi el motor no convierte ni recalcula nada en cada mano.
+
+    Args:
+        datos (dict): Carta de cartas.json (no se modifica).
+
+    Returns:
+        Carta: Carta con ataque_total y daño ya calculados.
+    """
+    return Carta(
+        datos["id"],
+        datos["serie"],
+        int(datos["hp"]),
+        int(datos["atk"]),
+        int(datos["def"]),
+        float(datos["bonus"]),
+        datos["ruta_frente"],
+        datos["ruta_reverso"],
+        calcular_ataque_total(datos),
+        calcular_daño(datos),
+    )
+
+
+def filter_cards_by_series(cards: list) -> dict:
+    """Organiza las cartas por serie.
+
+    Args:
+        cards (list): Lista de Carta.
+
+    Returns:
+        dict: Diccionario con series como keys y listas de cartas como valores.
+    """
+    series_dict = {}
+
+    for c in cards:
+        serie = c.serie
+        if serie not in series_dict:
+            series_dict[serie] = []
+        series_dict[serie].append(c)
+
+    return series_dict
+
+
+def generate_random_deck(series_dict: dict, distribution: dict, rng: random.Random = None) -> list:
+    """Genera un mazo aleatorio cumpliendo la distribucion de series.
+
+    Args:
+        series_dict (dict): Diccionario de series con sus cartas.
+        distribution (dict): Distribucion de cartas por serie, ejemplo {"platinum":1, "black":3}
+        rng (random.Random, optional): Generador a usar. Por defecto el global de random.
+
+    Returns:
+        list: Mazo aleatorio como lista de cartas.
+    """
+    deck = []
+
+    for serie, cantidad in distribution.items():
+        if serie not in series_dict:
+            print(f"Serie no encontrada en cartas: {serie}")
+            continue
+
+        cartas_serie = series_dict[serie]
+        cantidad_real = min(cantidad, len(cartas_serie))
+        seleccionadas = (rng or random).sample(cartas_serie, cantidad_real)
+
+        deck.extend(seleccionadas)
+
+    return deck
+
+
+def calculate_average_stats(deck: list) -> dict:
+    """Calcula el promedio de HP, ATK y DEF de un mazo.
+
+    La vida del mazo es 15 veces el promedio de HP de sus cartas. Acepta
+    cartas del repositorio (Carta) o cartas crudas del JSON, que se pasan
+    antes por crear_carta.
+
+    Args:
+        deck (list): Lista de cartas.
+
+    Returns:
+        dict: Promedios de stats {"hp": ..., "atk": ..., "def": ...}
+    """
+    if len(deck) == 0:
+        return {"hp": 0, "atk": 0, "def": 0}
+
+    if not isinstance(deck[0], Carta):
+        deck = [crear_carta(c) for c in deck]
+
+    n = len(deck)
+    total_hp = 0
+    total_atk = 0
+    total_def = 0
+    for carta in deck:
+        total_hp += carta.hp
+        total_atk += carta.atk
+        total_def += carta.defensa
+
+    return {
+        "hp":  total_hp * 15 // n,
+        "atk": total_atk // n,
+        "def": total_def // n
+    }
+
+
+def calcular_ataque_total(carta: dict) -> float:
+    """Calcula el ataque total de una carta sumando su bonus.
+
+    Args:
+        carta (dict): Carta de cartas.json a evaluar.
+
+    Returns:
+        float: Valor total de ataque.
+    """
+    return int(carta["atk"]) + float(carta["bonus"])
+
+
+def calcular_daño(carta: dict) -> int:
+    """Calcula el daño total de una carta sumando hp, atk, def y bonus.
+
+    Args:
+        carta (dict): Carta de cartas.json a evaluar.
+
+    Returns:
+        int: Daño total como entero.
+    """
+    bonus = float(carta["bonus"])
+    hp  = float(carta["hp"])  + bonus
+    atk = float(carta["atk"]) + bonus
+    defn = float(carta["def"]) + bonus
+    total = hp + atk + defn
+
+    return int(total)
@@ -0,0 +1,166 @@
+import os
+import json
+import argparse
+import pygame as pg
+import modules.variables as var
+
+# Tamaños en los que el juego dibuja las cartas
+TAMAÑO_FRENTE = (150, 210)
+TAMAÑO_REVERSO = (130, 180)
+
+
+def ruta_cache(path: str, size: tuple) -> str:
+    """Devuelve la ruta del archivo pre-escalado dentro del cache versionado.
+
+    Ejemplo: "assets/img/decks/x/1.0.png" a 150x210 ->
+    "assets/cache/v2/150x210/img/decks/x/1.0.png"
+
+    Args:
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño (ancho, alto).
+
+    Returns:
+        str: Ruta del archivo en el cache.
+    """
+    relativa = os.path.normpath(path)
+    if relativa.startswith("assets" + os.sep):
+        relativa = relativa[len("assets" + os.sep):]
+    return os.path.join(directorio_version(), f"{size[0]}x{size[1]}", relativa)
+
+
+def directorio_version() -> str:
+    """Devuelve el directorio del cache para la version actual.
+
+    Returns:
+        str: Ruta del directorio, por ejemplo "assets/cache/v2".
+    """
+    return os.path.join(var.ASSET_CACHE_DIR, f"v{var.ASSET_CACHE_VERSION}")
+
+
+def ruta_manifiesto() -> str:
+    """Devuelve la ruta del manifiesto de la version actual.
+
+    Returns:
+        str: Ruta del archivo manifest.json.
+    """
+    return os.path.join(directorio_version(), "manifest.json")
+
+
+def clave_manifiesto(path: str, size: tuple) -> str:
+    """Arma la clave con la que se guarda una imagen en el manifiesto.
+
+    Args:
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño (ancho, alto).
+
+    Returns:
+        str: Clave "ruta|AxB".
+    """
+    return f"{path}|{size[0]}x{size[1]}"
+
+
+def leer_manifiesto() -> dict:
+    """Lee el manifiesto de la version actual.
+
+    Returns:
+        dict: Diccionario clave -> ruta pre-escalada. Vacio si no existe o
+        corresponde a otra version.
+    """
+    path = ruta_manifiesto()
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    if data.get("version") != var.ASSET_CACHE_VERSION:
+        return {}
+    return data.get("imagenes", {})
+
+
+def listar_imagenes(cards: list) -> list:
+    """Arma la lista de (ruta, tamaño) a compilar a partir de las cartas.
+
+    Args:
+        cards (list): Lista de cartas de cartas.json.
+
+    Returns:
+        list: Lista sin repetidos de tuplas (ruta, tamaño).
+    """
+    trabajos = []
+    vistos = set()
+
+    for c in cards:
+        for path, size in ((c["ruta_frente"], TAMAÑO_FRENTE), (c["ruta_reverso"], TAMAÑO_REVERSO)):
+            if (path, size) not in vistos:
+                vistos.add((path, size))
+                trabajos.append((path, size))
+
+    return trabajos
+
+
+def compilar(json_path: str = var.JSON_CARDS, forzar: bool = False) -> dict:
+    """Genera las imagenes pre-escaladas de todas las cartas y el manifiesto.
+
+    Las imagenes que ya existen en el cache se saltean salvo que se pida forzar.
+    Las rutas que no existen en disco se informan y no se agregan al manifiesto.
+
+    Args:
+        json_path (str, optional): Ruta del JSON de cartas.
+        forzar (bool, optional): True para regenerar todo.
+
+    Returns:
+        dict: Resumen {"generadas", "salteadas", "faltantes"}.
+    """
+    with open(json_path, "r", encoding="utf-8") as file:
+        cards = json.load(file)
+
+    manifiesto = {}
+    resumen = {"generadas": 0, "salteadas": 0, "faltantes": []}
+
+    for path, size in listar_imagenes(cards):
+        if not os.path.exists(path):
+            resumen["faltantes"].append(path)
+            continue
+
+        destino = ruta_cache(path, size)
+        manifiesto[clave_manifiesto(path, size)] = destino
+
+        if not forzar and os.path.exists(destino):
+            resumen["salteadas"] += 1
+            continue
+
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        imagen = pg.transform.scale(pg.image.load(path).convert_alpha(), size)
+        pg.image.save(imagen, destino)
+        resumen["generadas"] += 1
+
+    os.makedirs(directorio_version(), exist_ok=True)
+    with open(ruta_manifiesto(), "w", encoding="utf-8") as file:
+        json.dump({"version": var.ASSET_CACHE_VERSION, "imagenes": manifiesto}, file, indent=1)
+
+    return resumen
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.compilar_assets [--forzar]"""
+    parser = argparse.ArgumentParser(description="Genera las imagenes de cartas pre-escaladas")
+    parser.add_argument("--forzar", action="store_true", help="Regenerar tambien las imagenes que ya existen")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+
+    resumen = compilar(forzar=args.forzar)
+
+    print(f"Generadas: {resumen['generadas']}")
+    print(f"Salteadas: {resumen['salteadas']}")
+    print(f"Faltantes: {len(resumen['faltantes'])}")
+    for path in resumen["faltantes"]:
+        print(f"  {path}")
+    print(f"Manifiesto: {ruta_manifiesto()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from collections import Counter
+
+# Cuentas de estadistica sin dependencias (ni pygame ni numpy), compartidas
+# por el perfilador, el simulador y el generador de carga.
+
+
+def percentil(valores: list, p: float) -> float:
+    """Devuelve el percentil p (0 a 100) de una lista ya ordenada.
+
+    Args:
+        valores (list): Valores ordenados de menor a mayor.
+        p (float): Percentil.
+
+    Returns:
+        float: Valor del percentil (0.0 si la lista esta vacia).
+    """
+    if not valores:
+        return 0.0
+    indice = min(len(valores) - 1, int(len(valores) * p / 100))
+    return valores[indice]
+
+
+def percentil_histograma(histograma: Counter, p: float) -> int:
+    """Calcula un percentil a partir de un histograma valor -> cantidad.
+
+    Args:
+        histograma (Counter): Histograma.
+        p (float): Percentil entre 0 y 100.
+
+    Returns:
+        int: Valor del percentil (0 si el histograma esta vacio).
+    """
+    total = sum(histograma.values())
+    if total == 0:
+        return 0
+
+    objetivo = total * p / 100
+    acumulado = 0
+    for valor in sorted(histograma):
+        acumulado += histograma[valor]
+        if acumulado >= objetivo:
+            return valor
+    return valor
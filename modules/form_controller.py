@@ -1,43 +1,243 @@
+import importlib
+from collections import OrderedDict
 import pygame as pg
 import modules.variables as var
 import modules.auxiliar as aux
-import modules.forms.form_menu as fmenu
-import modules.forms.form_game as fgame
-import modules.forms.form_score as fscore
-import modules.forms.form_options as foptions
-import modules.forms.form_results as fresults
 import modules.sonido as son
+import modules.cartas as cartas
+import modules.precarga as precarga
+import modules.fuentes as fuentes
+import modules.perfil as perfil
+
+# Registro de forms: nombre -> modulo que lo implementa, clave de sus datos en
+# ctx["forms"], musica de fondo y si tiene animacion o timer (los animados
+# siempre corren al FPS configurado). El modulo se importa recien la primera
+# vez que se entra al form.
+#
+# Ciclo de vida de un form:
+#   cargar(ctx)  -> una sola vez: fuentes, fondo, botones y labels
+#   entrar(ctx)  -> cada vez que se entra: reinicia el estado (opcional)
+#   salir(ctx)   -> al irse a otro form (opcional)
+# Los datos cargados se conservan entre visitas; si hay mas de
+# var.FORMS_CARGADOS_MAX forms cargados se descarga el visitado hace mas tiempo.
+REGISTRO_FORMS = {}
+
+# Modulos ya importados: nombre -> {"cargar", "entrar", "salir", "handle_event", "update", "draw", ...}
+_importados = {}
+
+
+def _sin_accion(ctx: dict) -> None:
+    """Paso del ciclo de vida que el form no necesita."""
+
+
+def registrar_form(nombre: str, modulo: str, datos: str, musica: str, animado: bool = False) -> None:
+    """Agrega un form al registro.
+
+    El modulo tiene que definir cargar(ctx), handle_event(ctx, event),
+    update(ctx) y draw(ctx), y puede definir entrar(ctx) y salir(ctx).
+
+    Args:
+        nombre (str): Nombre con el que se cambia al form.
+        modulo (str): Ruta de import del modulo, ejemplo "modules.forms.form_menu".
+        datos (str): Clave de ctx["forms"] donde el form guarda sus datos.
+        musica (str): Musica de fondo del form.
+        animado (bool, optional): True si el form necesita frames a ritmo fijo.
+    """
+    REGISTRO_FORMS[nombre] = {"modulo": modulo, "datos": datos, "musica": musica, "animado": animado}
+    _importados.pop(nombre, None)
+
+
+registrar_form("menu", "modules.forms.form_menu", "menu", var.MUSICA_MENU)
+registrar_form("juego", "modules.forms.form_game", "combat", var.MUSICA_STAGE, animado=True)
+registrar_form("score", "modules.forms.form_score", "score", var.MUSICA_RANKING)
+registrar_form("options", "modules.forms.form_options", "settings", var.MUSICA_OPTIONS)
+registrar_form("results", "modules.forms.form_results", "resultados", var.MUSICA_RESULTS)
+
+
+def obtener_form(nombre: str) -> dict:
+    """Devuelve las funciones de un form, importando su modulo la primera vez.
+
+    Args:
+        nombre (str): Nombre del form.
+
+    Raises:
+        KeyError: Si el form no esta registrado.
+
+    Returns:
+        dict: {"cargar", "entrar", "salir", "handle_event", "update", "draw",
+        "datos", "musica", "animado"}
+    """
+    form = _importados.get(nombre)
+    if form is None:
+        registro = REGISTRO_FORMS[nombre]
+        modulo = importlib.import_module(registro["modulo"])
+        form = {
+            "cargar": modulo.cargar,
+            "entrar": getattr(modulo, "entrar", _sin_accion),
+            "salir": getattr(modulo, "salir", _sin_accion),
+            "handle_event": modulo.handle_event,
+            "update": modulo.update,
+            "draw": modulo.draw,
+            "datos": registro["datos"],
+            "musica": registro["musica"],
+            "animado": registro["animado"],
+        }
+        _importados[nombre] = form
+    return form
+
+
+def descargar_viejos(ctx: dict) -> None:
+    """Descarga los forms visitados hace mas tiempo si hay mas de var.FORMS_CARGADOS_MAX.
+
+    El form actual nunca se descarga. Con None no se descarga ninguno.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    if var.FORMS_CARGADOS_MAX is None:
+        return
+
+    cargados = ctx["forms_cargados"]
+    while len(cargados) > max(2, var.FORMS_CARGADOS_MAX):
+        nombre, _ = cargados.popitem(last=False)
+        ctx["forms"].pop(obtener_form(nombre)["datos"], None)
+
 
 def cambiar_form(ctx: dict, nuevo_form: str) -> None:
-    """Cambia el form actual del juego y ejecuta la inicializacion correspondiente,
-    incluyendo la reproduccion de la musica de fondo.
+    """Cambia el form actual del juego, incluyendo la reproduccion de la musica de fondo.
+
+    Sale del form anterior, carga el nuevo solo si no estaba cargado y entra.
+    El form queda en ctx["form_actual"] para que el loop no tenga que buscarlo.
 
     Args:
         ctx (dict): Diccionario de contexto del juego que contiene el estado actual.
         nuevo_form (str): Nombre del form al que se desea cambiar. Ejemplos: "menu", "juego", "score", etc.
     """
+    form = obtener_form(nuevo_form)
+    cargados = ctx["forms_cargados"]
+
+    anterior = ctx.get("form_actual")
+    if anterior is not None:
+        anterior["salir"](ctx)
+
     ctx["form"] = nuevo_form
+    ctx["form_actual"] = form
+    aux.invalidar_pantalla(ctx)
+
+    if nuevo_form not in cargados:
+        form["cargar"](ctx)
+    cargados[nuevo_form] = True
+    cargados.move_to_end(nuevo_form)
+    descargar_viejos(ctx)
+
+    form["entrar"](ctx)
+    son.play_music(ctx, form["musica"])
 
-    match nuevo_form:
-        case "menu":
-            fmenu.iniciar(ctx)
-            son.play_music(ctx, var.MUSICA_MENU)
+    # Mientras se usa este form, se cargan en segundo plano los siguientes
+    precarga.precargar_siguientes(nuevo_form)
 
-        case "juego":
-            fgame.iniciar(ctx)
-            son.play_music(ctx, var.MUSICA_STAGE)
 
-        case "score":
-            fscore.iniciar(ctx)
-            son.play_music(ctx, var.MUSICA_RANKING)
+def revisar_carga(ctx: dict) -> None:
+    """Si la barra de precarga estaba visible y la tanda termino, pide un redibujo completo.
 
-        case "options":
-            foptions.iniciar(ctx)
-            son.play_music(ctx, var.MUSICA_OPTIONS)
-        
-        case "results":
-            fresults.iniciar(ctx)
-            son.play_music(ctx, var.MUSICA_RESULTS)
+    Se llama antes de dibujar el form para que el redibujo borre la barra.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    if ctx.get("carga_visible") and precarga.progreso() >= 1.0:
+        aux.invalidar_pantalla(ctx)
+        ctx["carga_visible"] = False
+
+
+def dibujar_carga(ctx: dict) -> None:
+    """Dibuja la barra de precarga mientras haya assets cargandose en segundo plano.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    valor = precarga.progreso()
+    if valor < 1.0:
+        aux.draw_barra_progreso(ctx, valor)
+        ctx["carga_visible"] = True
+
+
+def presentar(ctx: dict) -> None:
+    """Envia a la ventana lo dibujado en el frame.
+
+    Si se pidio un redibujo completo (o el modo de regiones sucias esta
+    desactivado) hace flip de toda la pantalla; si no, actualiza solo las
+    regiones marcadas por el form. Si nada cambio no actualiza la ventana.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    render = ctx["render"]
+
+    if render["completo"] or not var.DIRTY_RECTS:
+        pg.display.flip()
+    elif render["rects"]:
+        pg.display.update(render["rects"])
+
+    render["completo"] = False
+    render["rects"] = []
+
+
+def en_reposo(ctx: dict) -> bool:
+    """Indica si el loop puede dormir hasta el proximo evento.
+
+    El juego esta en reposo cuando el form actual no tiene animaciones y paso
+    mas de var.IDLE_RAMP_MS desde el ultimo evento recibido.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+
+    Returns:
+        bool: True si no hace falta dibujar frames a ritmo fijo.
+    """
+    if ctx["form_actual"]["animado"]:
+        return False
+    return pg.time.get_ticks() - ctx["pacing"]["ultimo_evento"] > var.IDLE_RAMP_MS
+
+
+def obtener_eventos(ctx: dict) -> list:
+    """Devuelve los eventos pendientes, esperando con timeout si el juego esta en reposo.
+
+    En reposo se bloquea en pg.event.wait hasta var.IDLE_WAIT_MS, de modo que
+    una pantalla estatica no consume CPU. Cualquier evento saca al loop del
+    reposo y vuelve al FPS configurado durante var.IDLE_RAMP_MS.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+
+    Returns:
+        list: Lista de eventos de pygame.
+    """
+    if en_reposo(ctx):
+        primero = pg.event.wait(var.IDLE_WAIT_MS)
+        eventos = [] if primero.type == pg.NOEVENT else [primero]
+        eventos.extend(pg.event.get())
+    else:
+        eventos = pg.event.get()
+
+    if eventos:
+        ctx["pacing"]["ultimo_evento"] = pg.time.get_ticks()
+    return eventos
+
+
+def regular_frame(ctx: dict) -> None:
+    """Limita el frame al FPS configurado, salvo en reposo donde ya se espero por eventos.
+
+    En reposo igual se llama a clock.tick() para que get_time() no acumule
+    el tiempo dormido en el primer frame activo.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    if en_reposo(ctx):
+        ctx["clock"].tick()
+    else:
+        ctx["clock"].tick(var.FPS)
 
 
 def main() -> None:
@@ -51,7 +251,8 @@ def main() -> None:
     pg.init()
     pg.font.init()
     pg.mixer.init()
-    pg.display.set_icon(var.GAME_ICON)
+    son.iniciar_banco_sfx()
+    pg.display.set_icon(pg.image.load(var.GAME_ICON))
     screen = pg.display.set_mode((var.ASPECT_RATIO))
     clock = pg.time.Clock()
 
@@ -59,6 +260,11 @@ def main() -> None:
         "screen": screen,
         "clock": clock,
         "form": "menu",
+        "render": {"completo": True, "rects": []},
+        "pacing": {"ultimo_evento": 0},
+        "perfil": perfil.crear(),
+        "form_actual": None,
+        "forms_cargados": OrderedDict(),
 
         "forms": {
             "menu": {...},
@@ -70,55 +276,51 @@ def main() -> None:
         }
     }
 
+    # Fuentes y cartas en memoria antes del primer form
+    fuentes.precargar()
+    cartas.obtener_repositorio(var.JSON_CARDS)
+
     cambiar_form(ctx, "menu")
 
     running = True
     while running:
 
+        eventos = obtener_eventos(ctx)
+        perfil.iniciar_frame(ctx)
+
         # Captura de contextos
-        for i in pg.event.get():
+        for i in eventos:
             if i.type == pg.QUIT:
                 running = False
+            if i.type in (pg.VIDEOEXPOSE, pg.WINDOWEXPOSED, pg.WINDOWRESTORED):
+                aux.invalidar_pantalla(ctx)
+            perfil.handle_event(ctx, i)
 
-            match ctx["form"]:
-                case "menu":
-                    fmenu.handle_event(ctx, i)
-                case "juego":
-                    fgame.handle_event(ctx, i)
-                case "score":
-                    fscore.handle_event(ctx, i)
-                case "options":
-                    foptions.handle_event(ctx, i)
-                case "results":
-                    fresults.handle_event(ctx, i)
+            # Un evento puede cambiar de form: se lee el actual en cada uno
+            ctx["form_actual"]["handle_event"](ctx, i)
+        perfil.marcar(ctx, "eventos")
 
         # Actualizacion del form actual
-        match ctx["form"]:
-            case "menu":
-                fmenu.update(ctx)
-            case "juego":
-                fgame.update(ctx)
-            case "score":
-                fscore.update(ctx)
-            case "options":
-                foptions.update(ctx)
-            case "results":
-                fresults.update(ctx)
-
-        # Dibujo del form actual
-        match ctx["form"]:
-            case "menu":
-                fmenu.draw(ctx)
-            case "juego":
-                fgame.draw(ctx)
-            case "score":
-                fscore.draw(ctx)
-            case "options":
-                foptions.draw(ctx)
-            case "results":
-                fresults.draw(ctx)
+        ctx["form_actual"]["update"](ctx)
+        perfil.marcar(ctx, "update")
 
-        pg.display.flip()
-        clock.tick(60)
+        # Dibujo del form actual (update tambien puede haber cambiado de form)
+        revisar_carga(ctx)
+        ctx["form_actual"]["draw"](ctx)
+
+        dibujar_carga(ctx)
+        perfil.dibujar_overlay(ctx)
+        perfil.marcar(ctx, "draw")
+
+        presentar(ctx)
+        perfil.marcar(ctx, "flip")
+        perfil.cerrar_frame(ctx)
+
+        regular_frame(ctx)
 
+    if var.PERFIL_EXPORTAR_AL_SALIR:
+        try:
+            perfil.exportar(ctx)
+        except OSError as e:
+            print(f"No se pudo exportar el perfil: {e}")
     pg.quit()
@@ -1,24 +1,23 @@
 import pygame as pg
-import random
 import modules.variables as var
 import modules.auxiliar as aux
-import modules.sonido as so
 import modules.gameplay as gp
+import modules.cartas as cartas
+import modules.motor_combate as motor
+import modules.imagenes as img
+import modules.fuentes as fuentes
+import modules.atlas as atlas
+import modules.replay as replay
 
-def iniciar(ctx: dict) -> None:
-    """Inicializa el form de combate (pantalla de juego).
+def cargar(ctx: dict) -> None:
+    """Carga el form de combate (pantalla de juego) una sola vez.
 
     Configura:
         - Contexto de combate en ctx["forms"]["combat"].
-        - Puntaje inicial.
-        - Indices y cartas actuales.
         - Fuentes para labels grandes y pequeños.
         - Fondo de la pantalla.
-        - Timer de la partida.
         - Labels de puntaje y stats de jugador y rival.
-        - Estados de comodines (heal y shield).
         - Botones de mazo y botones de acción.
-        - Inicialización de mazos y stats promedio.
 
     Args:
         ctx (dict): Contexto global del juego con todos los forms.
@@ -26,27 +25,12 @@ def iniciar(ctx: dict) -> None:
     ctx["forms"]["combat"] = {}
     data = ctx["forms"]["combat"]
 
-    data["puntaje"] = 0
-    data["turno_actual"] = 0
-    
-    gp.iniciar_puntaje(ctx)
-    
-    data["mazo_index_player"] = 0
-    data["mazo_index_rival"] = 0
-
-    data["carta_player_actual"] = None
-    data["carta_rival_actual"] = None
-
     # Fuentes
-    data["font_big"] = pg.font.Font(var.ALT_FONT_PATH, 26)
-    data["font_small"] = pg.font.Font(var.ALT_FONT_PATH, 20)
+    data["font_big"] = fuentes.obtener(var.ALT_FONT_PATH, 26)
+    data["font_small"] = fuentes.obtener(var.ALT_FONT_PATH, 20)
 
     # Fondo
-    data["fondo"] = pg.transform.scale(pg.image.load(var.FONDO_STAGE), var.ASPECT_RATIO)
-
-    # Timer
-    data["timer_max"] = var.STAGE_TIMER
-    data["timer_actual"] = var.STAGE_TIMER
+    data["fondo"] = img.cargar_imagen(var.FONDO_STAGE, var.ASPECT_RATIO)
 
     # Label puntaje
     data["puntaje_label"] = aux.create_label(
@@ -65,58 +49,67 @@ def iniciar(ctx: dict) -> None:
         aux.create_label("DEF: 0", data["font_small"], var.COLORS["white"], 85, 190)
     ]
 
-    # Estados de comodines
-    data["heal_usado"] = False
-    data["shield_usado"] = False
-    data["shield_activo"] = False
-    data["hp_inicial_player"] = 0 
-
     # Botones de mazo
+    # (todas las imagenes salen del atlas de combate)
+    reverso = atlas.imagen_combate("assets/img/decks/black_deck_expansion_1/reverse.png", (130, 180))
     data["mazo_botones"] = [
-        aux.create_image_button("assets/img/decks/black_deck_expansion_1/reverse.png", 300, 100, 130, 180),
-        aux.create_image_button("assets/img/decks/black_deck_expansion_1/reverse.png", 300, 380, 130, 180),
+        aux.create_surface_button(reverso, 300, 100),
+        aux.create_surface_button(reverso, 300, 380),
     ]
 
     # Botones de accion (robar carta, heal, shield)
     data["accion"] = [
-        aux.create_image_button(var.PLAY_HAND, 887, 295, 100, 45),
-        aux.create_image_button(var.WISH_HEAL, 890, 460, 100, 35),
-        aux.create_image_button(var.WISH_SHIELD, 890, 500, 100, 35)
+        aux.create_surface_button(atlas.imagen_combate(var.PLAY_HAND, (100, 45)), 887, 295),
+        aux.create_surface_button(atlas.imagen_combate(var.WISH_HEAL, (100, 35)), 890, 460),
+        aux.create_surface_button(atlas.imagen_combate(var.WISH_SHIELD, (100, 35)), 890, 500)
     ]
+
+
+def entrar(ctx: dict) -> None:
+    """Empieza una partida nueva cada vez que se entra al form.
+
+    Reinicia el label de puntaje y los botones de accion y crea el estado de
+    la partida (mazos, stats, timer, puntaje y comodines) en
+    ctx["forms"]["combat"]["estado"], manejado por motor_combate.
+
+    Args:
+        ctx (dict): Contexto global del juego con todos los forms.
+    """
+    data = ctx["forms"]["combat"]
+
+    aux.update_label(data["puntaje_label"], "Puntaje: 0")
     for b in data["accion"]:
-        if "visible" not in b:
-            b["visible"] = True
+        b["visible"] = True
 
     iniciar_mazos(data)
-    data["hp_inicial_player"] = data["stats_p"]["hp"]
 
 
 def iniciar_mazos(data: dict) -> None:
-    """Inicializa los mazos de jugador y rival y calcula sus stats promedio.
+    """Arma los mazos de jugador y rival y crea el estado de la partida.
+
+    Cada partida tiene su propia semilla (var.SEMILLA_PARTIDA si esta fija) y
+    un registro de repeticion donde se graban las acciones del jugador.
 
     Args:
         data (dict): Diccionario de datos del form de combate.
     """
-    todas = gp.load_cards(var.JSON_CARDS)
-    por_serie = gp.filter_cards_by_series(todas)
-
-    data["mazo_player"] = gp.generate_random_deck(por_serie, var.DISTRIBUCION_MAZO)
-    data["mazo_rival"]  = gp.generate_random_deck(por_serie, var.DISTRIBUCION_MAZO)
+    # Una revision del mtime por partida: si cartas.json cambio se vuelve a cargar
+    por_serie = cartas.obtener_repositorio(var.JSON_CARDS, recargar=True)["por_serie"]
 
-    random.shuffle(data["mazo_player"])
-    random.shuffle(data["mazo_rival"])
+    semilla = var.SEMILLA_PARTIDA
+    if semilla is None:
+        semilla = motor.nueva_semilla()
 
-    # Stats promedio
-    data["stats_p"] = gp.calculate_average_stats(data["mazo_player"])
-    data["stats_r"] = gp.calculate_average_stats(data["mazo_rival"])
+    # Estado de la partida (mazos, stats promedio, timer, puntaje y comodines)
+    data["estado"] = motor.crear_partida(por_serie, semilla, var.DISTRIBUCION_MAZO, var.STAGE_TIMER)
+    data["replay"] = replay.nuevo_registro(data["estado"])
 
-    # Mano inicial
-    data["mano_player"] = None
-    data["mano_rival"] = None
+    mazo_player = data["estado"].mazo_player
+    mazo_rival = data["estado"].mazo_rival
 
     # Mazo reverso
-    data["mazo_reverso_rival"]  = gp.load_rev(data["mazo_rival"])
-    data["mazo_reverso_player"] = gp.load_rev(data["mazo_player"])
+    data["mazo_reverso_rival"]  = gp.load_rev(mazo_rival)
+    data["mazo_reverso_player"] = gp.load_rev(mazo_player)
 
 
 def handle_event(ctx: dict, event: pg.event.Event) -> None:
@@ -137,21 +130,24 @@ def handle_event(ctx: dict, event: pg.event.Event) -> None:
         # Robar carta
         btn_play = data["accion"][0]
         if btn_play.get("visible", True) and btn_play["rect"].collidepoint(mouse):
+            replay.registrar(data["replay"], "robar", data["estado"])
             gp.robar_carta(ctx, player=True)
             gp.resolver_mano(ctx)
             gp.check_fin_partida(ctx)
-            aux.update_label(data["puntaje_label"], f"Puntaje: {data['puntaje']}")
+            aux.update_label(data["puntaje_label"], f"Puntaje: {data['estado'].puntaje}")
             return
 
         # Heal
         btn_heal = data["accion"][1]
-        if btn_heal.get("visible", True) and btn_heal["rect"].collidepoint(mouse) and not data["heal_usado"]:
+        if btn_heal.get("visible", True) and btn_heal["rect"].collidepoint(mouse) and not data["estado"].heal_usado:
+            replay.registrar(data["replay"], "heal", data["estado"])
             gp.activar_heal(ctx)
             return
 
         # Shield
         btn_shield = data["accion"][2]
-        if btn_shield.get("visible", True) and btn_shield["rect"].collidepoint(mouse) and not data["shield_usado"]:
+        if btn_shield.get("visible", True) and btn_shield["rect"].collidepoint(mouse) and not data["estado"].shield_usado:
+            replay.registrar(data["replay"], "shield", data["estado"])
             gp.activar_shield(ctx)
             return
 
@@ -166,10 +162,7 @@ def update(ctx: dict) -> None:
         ctx (dict): Contexto del juego con forms.
     """
     data = ctx["forms"]["combat"]
-    dt = ctx["clock"].get_time()
-    data["timer_actual"] -= dt
-    if data["timer_actual"] < 0:
-        data["timer_actual"] = 0
+    motor.actualizar_timer(data["estado"], ctx["clock"].get_time())
     gp.check_fin_partida(ctx)
 
 
@@ -186,50 +179,49 @@ def draw(ctx: dict) -> None:
     """
     screen = ctx["screen"]
     data = ctx["forms"]["combat"]
+    estado = data["estado"]
+
+    # El timer cambia todo el tiempo: esta pantalla siempre se presenta completa
+    aux.invalidar_pantalla(ctx)
 
     screen.blit(data["fondo"], (0, 0))
     aux.draw_label(screen, data["puntaje_label"])
 
     # Timer
-    timer_text = data["font_big"].render(
-        f"Tiempo: {data['timer_actual'] // 1000}", True, var.COLORS["white"]
+    timer_text = aux.render_text(
+        data["font_big"], f"Tiempo: {estado.timer_actual // 1000}", var.COLORS["white"]
     )
     screen.blit(timer_text, (430, 20))
 
-    # Stats
+    # Stats (update_label solo re-renderiza si el texto cambio)
+    aux.update_label(data["stats_jugador"][0], f"HP: {estado.hp_player}")
+    aux.update_label(data["stats_jugador"][1], f"ATK: {estado.atk_player}")
+    aux.update_label(data["stats_jugador"][2], f"DEF: {estado.def_player}")
+
+    aux.update_label(data["stats_rival"][0], f"HP: {estado.hp_rival}")
+    aux.update_label(data["stats_rival"][1], f"ATK: {estado.atk_rival}")
+    aux.update_label(data["stats_rival"][2], f"DEF: {estado.def_rival}")
+
     for s in data["stats_jugador"]:
         aux.draw_label(screen, s)
     for s in data["stats_rival"]:
         aux.draw_label(screen, s)
 
-    aux.update_label(data["stats_jugador"][0], f"HP: {data['stats_p']['hp']}")
-    aux.update_label(data["stats_jugador"][1], f"ATK: {data['stats_p']['atk']}")
-    aux.update_label(data["stats_jugador"][2], f"DEF: {data['stats_p']['def']}")
-
-    aux.update_label(data["stats_rival"][0], f"HP: {data['stats_r']['hp']}")
-    aux.update_label(data["stats_rival"][1], f"ATK: {data['stats_r']['atk']}")
-    aux.update_label(data["stats_rival"][2], f"DEF: {data['stats_r']['def']}")
-
     if data["mazo_reverso_rival"]:
         data["mazo_botones"][0]["image"] = data["mazo_reverso_rival"]
     if data["mazo_reverso_player"]:
         data["mazo_botones"][1]["image"] = data["mazo_reverso_player"]
 
-    # Dibujar mazo y botones
-    for b in data["mazo_botones"]:
-        aux.draw_image_button(screen, b)
-    for b in data["accion"]:
-        if b.get("visible", True):
-            aux.draw_image_button(screen, b)
+    # Dibujar mazo y botones en un solo blits (comparten la hoja del atlas)
+    screen.blits([(b["image"], b["rect"]) for b in data["mazo_botones"]], doreturn=False)
+    screen.blits([(b["image"], b["rect"]) for b in data["accion"] if b.get("visible", True)], doreturn=False)
     
     # Cartas actuales
-    if data["carta_player_actual"]:
-        img = pg.image.load(data["carta_player_actual"]["ruta_frente"])
-        img = pg.transform.scale(img, (150, 210))
-        screen.blit(img, (450, 365))
-    if data["carta_rival_actual"]:
-        img = pg.image.load(data["carta_rival_actual"]["ruta_frente"])
-        img = pg.transform.scale(img, (150, 210))
-        screen.blit(img, (450, 90))
+    if estado.carta_player_actual:
+        frente = img.cargar_imagen(estado.carta_player_actual.ruta_frente, (150, 210))
+        screen.blit(frente, (450, 365))
+    if estado.carta_rival_actual:
+        frente = img.cargar_imagen(estado.carta_rival_actual.ruta_frente, (150, 210))
+        screen.blit(frente, (450, 90))
 
 
@@ -1,10 +1,15 @@
 import pygame as pg
 import modules.variables as var
 import modules.auxiliar as aux
+import modules.imagenes as img
+import modules.fuentes as fuentes
 from modules import form_controller as fc
 
-def iniciar(ctx: dict) -> None:
-    """Inicializa el form del menú principal del juego.
+def cargar(ctx: dict) -> None:
+    """Carga el form del menú principal del juego.
+
+    Se ejecuta solo la primera vez que se entra (o si el form fue descargado);
+    el menu no tiene estado que reiniciar al volver a entrar.
 
     Configura:
         - Fuente principal.
@@ -22,11 +27,10 @@ def iniciar(ctx: dict) -> None:
     data = ctx["forms"]["menu"]
 
     # Fuente
-    data["font"] = pg.font.Font(var.FONT_PATH, 40)
+    data["font"] = fuentes.obtener(var.FONT_PATH, 40)
 
     # Fondo
-    fondo = pg.image.load(var.FONDO_MENU)
-    data["fondo"] = pg.transform.scale(fondo, var.ASPECT_RATIO)
+    data["fondo"] = img.cargar_imagen(var.FONDO_MENU, var.ASPECT_RATIO)
 
     # Labels
     data["titulo"] = aux.create_label(
@@ -125,6 +129,8 @@ def draw(ctx: dict) -> None:
     - Labels de título y subtítulo.
     - Botones con efecto hover.
 
+    Fuera de un redibujo completo solo se redibujan los botones que cambiaron de color.
+
     Args:
         ctx (dict): Contexto general del juego con forms.
 
@@ -133,6 +139,13 @@ def draw(ctx: dict) -> None:
     """
     screen = ctx["screen"]
     data = ctx["forms"]["menu"]
+    mouse_pos = pg.mouse.get_pos()
+
+    if not aux.redibujo_completo(ctx):
+        for b in data["botones"]:
+            if aux.update_button_hover(b, mouse_pos):
+                aux.redraw_button(ctx, data["fondo"], b)
+        return
 
     # Fondo
     screen.blit(data["fondo"], (0, 0))
@@ -142,7 +155,6 @@ def draw(ctx: dict) -> None:
     aux.draw_label(screen, data["subtitulo"])
 
     # Botones + efecto hover
-    mouse_pos = pg.mouse.get_pos()
     for b in data["botones"]:
         aux.update_button_hover(b, mouse_pos)
         aux.draw_button(screen, b)
@@ -1,15 +1,15 @@
 import pygame as pg
 import modules.variables as var
 import modules.auxiliar as aux
+import modules.imagenes as img
+import modules.fuentes as fuentes
 import modules.sonido as audio
 import modules.form_controller as fc
 
-def iniciar(ctx: dict) -> None:
-    """Inicializa el form de Ajustes del juego.
+def cargar(ctx: dict) -> None:
+    """Carga el form de Ajustes del juego (una sola vez).
 
     Configura:
-        - Estado de audio global si no existe.
-        - Variables locales para musica habilitada y volumen.
         - Fuentes principales y secundarias.
         - Fondo escalado.
         - Botones para apagar/prender musica.
@@ -25,20 +25,12 @@ def iniciar(ctx: dict) -> None:
     ctx["forms"]["settings"] = {}
     data = ctx["forms"]["settings"]
 
-    # --- INICIALIZAR AUDIO GLOBAL SI FALTA ---
-    audio.init_audio_state(ctx)
-
-    # --- LEER EL ESTADO REAL DE AUDIO ---
-    data["music_enabled"] = ctx["audio"]["enabled"]
-    data["volume"] = audio.get_volume_0_100(ctx)
-
     # --- Fuentes ---
-    data["font"] = pg.font.Font(var.FONT_PATH, 35)
-    data["alt_font"] = pg.font.Font(var.ALT_FONT_PATH, 36)
+    data["font"] = fuentes.obtener(var.FONT_PATH, 35)
+    data["alt_font"] = fuentes.obtener(var.ALT_FONT_PATH, 36)
 
     # --- Fondo ---
-    fondo = pg.image.load(var.FONDO_OPTIONS)
-    data["fondo"] = pg.transform.scale(fondo, (var.ASPECT_RATIO))
+    data["fondo"] = img.cargar_imagen(var.FONDO_OPTIONS, var.ASPECT_RATIO)
 
     # --- Botones Musica ---
     data["btn_music_off"] = aux.create_button(
@@ -66,7 +58,7 @@ def iniciar(ctx: dict) -> None:
 
     # Label del numero de volumen
     data["lbl_volumen"] = aux.create_label(
-        str(data["volume"]), data["alt_font"], (255,255,255), x=485, y=280
+        "", data["alt_font"], (255,255,255), x=485, y=280
     )
 
     # --- Boton Volver ---
@@ -77,6 +69,29 @@ def iniciar(ctx: dict) -> None:
     )
 
 
+def entrar(ctx: dict) -> None:
+    """Prepara el form de Ajustes cada vez que se entra.
+
+    Configura:
+        - Estado de audio global si no existe.
+        - Variables locales para musica habilitada y volumen.
+        - Label del volumen actual.
+
+    Args:
+        ctx (dict): Contexto general del juego con todos los forms y audio.
+    """
+    data = ctx["forms"]["settings"]
+
+    # --- INICIALIZAR AUDIO GLOBAL SI FALTA ---
+    audio.init_audio_state(ctx)
+
+    # --- LEER EL ESTADO REAL DE AUDIO ---
+    data["music_enabled"] = ctx["audio"]["enabled"]
+    data["volume"] = audio.get_volume_0_100(ctx)
+
+    aux.update_label(data["lbl_volumen"], str(data["volume"]))
+
+
 def handle_event(ctx: dict, event: pg.event.Event) -> None:
     """Gestiona eventos de la pantalla de Ajustes.
 
@@ -98,6 +113,9 @@ def handle_event(ctx: dict, event: pg.event.Event) -> None:
     mouse_pos = pg.mouse.get_pos()
     press = pg.mouse.get_pressed()
 
+    # Un clic puede cambiar el label de volumen: se redibuja todo
+    aux.invalidar_pantalla(ctx)
+
     # Volver al menu
     if aux.button_is_clicked(data["btn_volver"], mouse_pos, press):
         fc.cambiar_form(ctx, "menu")
@@ -117,19 +135,13 @@ def handle_event(ctx: dict, event: pg.event.Event) -> None:
     if aux.button_is_clicked(data["btn_vol_down"], mouse_pos, press):
         data["volume"] = max(1, data["volume"] - 5)
         audio.set_volume_0_100(ctx, data["volume"])
-        data["lbl_volumen"]["text"] = str(data["volume"])
-        data["lbl_volumen"]["surface"] = data["lbl_volumen"]["font"].render(
-            data["lbl_volumen"]["text"], True, data["lbl_volumen"]["color"]
-        )
+        aux.update_label(data["lbl_volumen"], str(data["volume"]))
 
     # Subir volumen
     if aux.button_is_clicked(data["btn_vol_up"], mouse_pos, press):
         data["volume"] = min(100, data["volume"] + 5)
         audio.set_volume_0_100(ctx, data["volume"])
-        data["lbl_volumen"]["text"] = str(data["volume"])
-        data["lbl_volumen"]["surface"] = data["lbl_volumen"]["font"].render(
-            data["lbl_volumen"]["text"], True, data["lbl_volumen"]["color"]
-        )
+        aux.update_label(data["lbl_volumen"], str(data["volume"]))
 
 
 def update(ctx: dict) -> None:
@@ -153,6 +165,8 @@ def draw(ctx: dict) -> None:
     - Label de volumen actual.
     - Botones con efecto hover.
 
+    Fuera de un redibujo completo solo se redibujan los botones que cambiaron de color.
+
     Args:
         ctx (dict): Contexto general del juego con forms y audio.
 
@@ -161,11 +175,18 @@ def draw(ctx: dict) -> None:
     """
     screen = ctx["screen"]
     data = ctx["forms"]["settings"]
+    mouse_pos = pg.mouse.get_pos()
+    botones = ["btn_music_off", "btn_music_on", "btn_vol_down", "btn_vol_up", "btn_volver"]
+
+    if not aux.redibujo_completo(ctx):
+        for key in botones:
+            if aux.update_button_hover(data[key], mouse_pos):
+                aux.redraw_button(ctx, data["fondo"], data[key])
+        return
 
     screen.blit(data["fondo"], (0,0))
     aux.draw_label(screen, data["lbl_volumen"])
 
-    mouse_pos = pg.mouse.get_pos()
-    for key in ["btn_music_off", "btn_music_on", "btn_vol_down", "btn_vol_up", "btn_volver"]:
+    for key in botones:
         aux.update_button_hover(data[key], mouse_pos)
         aux.draw_button(screen, data[key])
@@ -1,15 +1,17 @@
 import pygame as pg
 import modules.variables as var
 import modules.auxiliar as aux
+import modules.puntajes as puntajes
+import modules.imagenes as img
+import modules.fuentes as fuentes
 import modules.gameplay as gp
 import modules.form_controller as fc
 
-def iniciar(ctx: dict) -> None:
-    """Inicializa el form de resultados de la partida.
+def cargar(ctx: dict) -> None:
+    """Carga el form de resultados de la partida (una sola vez).
 
     Configura:
         - Fuentes grandes y pequeñas.
-        - Fondo escalado.
         - Labels: titulo, puntaje y instruccion para ingresar nombre.
         - Campo de texto para que el jugador escriba su nombre.
         - Botones disponibles (por ejemplo: 'Guardar y Volver').
@@ -24,24 +26,15 @@ def iniciar(ctx: dict) -> None:
     data = ctx["forms"]["resultados"]
 
     # Fuente
-    data["font_big"] = pg.font.Font(var.FONT_PATH, 40)
-    data["font_small"] = pg.font.Font(var.ALT_FONT_PATH, 28)
-
-    # Fondo
-    if ctx["forms"]["combat"].get("victoria", True):
-        fondo = pg.image.load(var.FONDO_VICTORIA)
-    else:
-        fondo = pg.image.load(var.FONDO_DERROTA)
-    data["fondo"] = pg.transform.scale(fondo, var.ASPECT_RATIO)
-
+    data["font_big"] = fuentes.obtener(var.FONT_PATH, 40)
+    data["font_small"] = fuentes.obtener(var.ALT_FONT_PATH, 28)
 
     # Labels
     data["titulo"] = aux.create_label(
         text="¡Partida Finalizada!", font=data["font_big"], color=var.COLORS["white"], x=355, y=80
     )
     data["puntaje_label"] = aux.create_label(
-        text=f"Puntaje: {ctx['forms']['combat'].get('puntaje', 0)}",
-        font=data["font_small"], color=var.COLORS["white"], x=400, y=200
+        text="Puntaje: 0", font=data["font_small"], color=var.COLORS["white"], x=400, y=200
     )
     data["instruccion"] = aux.create_label(
         text="Ingresa tu nombre:", font=data["font_small"], color=var.COLORS["white"], x=370, y=270
@@ -69,6 +62,32 @@ def iniciar(ctx: dict) -> None:
     ]
 
 
+def entrar(ctx: dict) -> None:
+    """Prepara el form de resultados para la partida que acaba de terminar.
+
+    Configura:
+        - Fondo de victoria o derrota.
+        - Label con el puntaje de la partida.
+        - Campo de texto vacio e inactivo.
+
+    Args:
+        ctx (dict): Contexto general del juego con todos los forms.
+    """
+    data = ctx["forms"]["resultados"]
+    estado = ctx["forms"]["combat"]["estado"]
+
+    # Fondo
+    if estado.victoria:
+        data["fondo"] = img.cargar_imagen(var.FONDO_VICTORIA, var.ASPECT_RATIO)
+    else:
+        data["fondo"] = img.cargar_imagen(var.FONDO_DERROTA, var.ASPECT_RATIO)
+
+    aux.update_label(data["puntaje_label"], f"Puntaje: {estado.puntaje}")
+
+    data["nombre_input"]["text"] = ""
+    data["nombre_input"]["active"] = False
+
+
 def handle_event(ctx: dict, event: pg.event.Event) -> None:
     """Gestiona eventos de la pantalla de resultados.
 
@@ -86,6 +105,10 @@ def handle_event(ctx: dict, event: pg.event.Event) -> None:
     """
     data = ctx["forms"]["resultados"]
 
+    # Clics y teclas cambian el campo de texto: se redibuja todo
+    if event.type in (pg.MOUSEBUTTONDOWN, pg.KEYDOWN):
+        aux.invalidar_pantalla(ctx)
+
     if event.type == pg.MOUSEBUTTONDOWN:
         mouse_pos = pg.mouse.get_pos()
 
@@ -103,8 +126,8 @@ def handle_event(ctx: dict, event: pg.event.Event) -> None:
                     nombre = data["nombre_input"]["text"].strip()
                     if nombre:
                         if aux.nombre_valido(nombre):
-                            puntaje = ctx['forms']['combat'].get('puntaje', 0)
-                            aux.guardar_puntaje_csv("puntajes.csv", nombre, puntaje)
+                            puntaje = ctx['forms']['combat']['estado'].puntaje
+                            puntajes.guardar_puntaje(nombre, puntaje)
                             fc.cambiar_form(ctx, "menu")
                         else:
                             print("Nombre Invalido")
@@ -143,6 +166,8 @@ def draw(ctx: dict) -> None:
         - Campo de texto con borde y texto ingresado.
         - Botones con efecto hover.
 
+    Fuera de un redibujo completo solo se redibujan los botones que cambiaron de color.
+
     Args:
         ctx (dict): Contexto general del juego con forms.
 
@@ -151,6 +176,13 @@ def draw(ctx: dict) -> None:
     """
     screen = ctx["screen"]
     data = ctx["forms"]["resultados"]
+    mouse_pos = pg.mouse.get_pos()
+
+    if not aux.redibujo_completo(ctx):
+        for b in data["botones"]:
+            if aux.update_button_hover(b, mouse_pos):
+                aux.redraw_button(ctx, data["fondo"], b)
+        return
 
     # Fondo
     screen.blit(data["fondo"], (0, 0))
@@ -159,18 +191,17 @@ def draw(ctx: dict) -> None:
     aux.draw_label(screen, data["titulo"])
     aux.draw_label(screen, data["instruccion"])
 
-    puntaje_total = ctx["forms"]["combat"].get("puntaje", 0)
+    puntaje_total = ctx["forms"]["combat"]["estado"].puntaje
     aux.update_label(data["puntaje_label"], f"Puntaje: {puntaje_total}")
     aux.draw_label(screen, data["puntaje_label"])
 
     # Campo de texto
     rect = data["nombre_input"]["rect"]
     pg.draw.rect(screen, data["nombre_input"]["color"], rect, 2)
-    txt_surf = data["nombre_input"]["font"].render(data["nombre_input"]["text"], True, var.COLORS["white"])
+    txt_surf = aux.render_text(data["nombre_input"]["font"], data["nombre_input"]["text"], var.COLORS["white"])
     screen.blit(txt_surf, (rect.x+5, rect.y+5))
 
     # Botones
-    mouse_pos = pg.mouse.get_pos()
     for b in data["botones"]:
         aux.update_button_hover(b, mouse_pos)
         aux.draw_button(screen, b)
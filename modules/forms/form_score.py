@@ -1,17 +1,21 @@
 import pygame as pg
 import modules.variables as var
 import modules.auxiliar as aux
+import modules.puntajes as puntajes
+import modules.imagenes as img
+import modules.fuentes as fuentes
 import modules.form_controller as fc
 
-def iniciar(event: dict) -> None:
-    """Inicializa la pantalla de ranking (Score).
+def cargar(event: dict) -> None:
+    """Carga la pantalla de ranking (Score) una sola vez.
 
     Crea y configura:
         - Fuentes de letra.
         - Fondo.
         - Label del titulo "Puntajes".
-        - Lista de puntajes leida desde CSV y ordenada descendente.
-        - Labels de los 10 mejores puntajes.
+        - Pool de labels para las filas de una pagina (se reutilizan al paginar).
+        - Campo de texto para filtrar por prefijo de nombre.
+        - Botones de pagina anterior y siguiente.
         - Boton "Volver" al menu principal.
 
     Args:
@@ -24,38 +28,50 @@ def iniciar(event: dict) -> None:
     data = event["forms"]["score"]
 
     # fuentes
-    data["font_title"] = pg.font.Font(var.FONT_PATH, 48)
-    data["font_button"] = pg.font.Font(var.FONT_PATH, 36)
-    data["font"] = pg.font.Font(var.ALT_FONT_PATH, 28)
+    data["font_title"] = fuentes.obtener(var.FONT_PATH, 48)
+    data["font_button"] = fuentes.obtener(var.FONT_PATH, 36)
+    data["font"] = fuentes.obtener(var.ALT_FONT_PATH, 28)
 
     # fondo
-    fondo = pg.image.load(var.FONDO_SCORE)
-    data["fondo"] = pg.transform.scale(fondo, (var.ASPECT_RATIO))
+    data["fondo"] = img.cargar_imagen(var.FONDO_SCORE, var.ASPECT_RATIO)
 
     # título
     data["titulo"] = aux.create_label(
         "Puntajes", data["font_title"], var.COLORS["white"], 420, 60
     )
 
-    # cargar puntajes desde CSV
-    lista = aux.read_scores_csv(var.RANKING_CSV)
-
-    # ordenar por puntaje descendente
-    lista = aux.selection_sort_scores(lista)
-
-    # top 10
-    lista = lista[:10]
-
-    # generar labels
+    # pool de filas: una label por fila visible
     labels = []
     y = 140
-    for nombre, puntaje in lista:
-        texto = f"{nombre}  -  {puntaje}"
-        label = aux.create_label(texto, data["font"], (255, 255, 255), 400, y)
-        labels.append(label)
+    for _ in range(var.RANKING_FILAS):
+        labels.append(aux.create_label("", data["font"], (255, 255, 255), 400, y))
         y += 32
     data["labels_scores"] = labels
 
+    # filtro por nombre
+    data["lbl_filtro"] = aux.create_label(
+        "Buscar:", data["font"], var.COLORS["white"], 720, 100
+    )
+    data["filtro_input"] = {
+        "rect": pg.Rect(720, 140, 240, 40),
+        "color": var.COLORS["white"],
+        "text": "",
+        "active": False,
+        "font": data["font"]
+    }
+
+    # paginas
+    data["btn_anterior"] = aux.create_button(
+        "<", data["font_button"], var.COLORS["white"], var.COLORS["bg"],
+        x=330, y=480, w=60, h=60,
+        hover_color=var.COLORS["hover"]
+    )
+    data["btn_siguiente"] = aux.create_button(
+        ">", data["font_button"], var.COLORS["white"], var.COLORS["bg"],
+        x=612, y=480, w=60, h=60,
+        hover_color=var.COLORS["hover"]
+    )
+
     # boton volver
     data["btn_volver"] = aux.create_button(
         "Volver", data["font_button"], var.COLORS["white"], var.COLORS["bg"],
@@ -64,10 +80,85 @@ def iniciar(event: dict) -> None:
     )
 
 
+def entrar(event: dict) -> None:
+    """Prepara la pantalla de ranking cada vez que se entra.
+
+    Limpia el filtro y lee la primera pagina del backend de puntajes, asi que
+    abrir la pantalla no depende de cuantos puntajes haya guardados.
+
+    Args:
+        event (dict): Contexto general del juego con todos los forms.
+    """
+    data = event["forms"]["score"]
+    data["filtro_input"]["text"] = ""
+    data["filtro_input"]["active"] = False
+    data["filtro_vence"] = None
+    reiniciar_paginas(data)
+
+
+def reiniciar_paginas(data: dict) -> None:
+    """Vuelve a la primera pagina (por ejemplo al cambiar el filtro) y la carga.
+
+    Args:
+        data (dict): Datos del form de ranking.
+    """
+    # cursores[i] es el cursor con el que se pide la pagina i
+    data["cursores"] = [None]
+    data["pagina"] = 0
+    cargar_pagina(data)
+
+
+def cargar_pagina(data: dict) -> None:
+    """Pide la pagina actual al backend y actualiza las labels del pool.
+
+    Args:
+        data (dict): Datos del form de ranking.
+    """
+    cursor = data["cursores"][data["pagina"]]
+    filas, siguiente = puntajes.leer_pagina(cursor, var.RANKING_FILAS, data["filtro_input"]["text"].strip())
+
+    data["siguiente"] = siguiente
+    data["filas_visibles"] = len(filas)
+
+    posicion = data["pagina"] * var.RANKING_FILAS + 1
+    for label, (nombre, puntaje) in zip(data["labels_scores"], filas):
+        aux.update_label(label, f"{posicion}. {nombre}  -  {puntaje}")
+        posicion += 1
+
+
+def cambiar_pagina(data: dict, paso: int) -> bool:
+    """Avanza o retrocede una pagina si existe.
+
+    Args:
+        data (dict): Datos del form de ranking.
+        paso (int): 1 para la siguiente pagina, -1 para la anterior.
+
+    Returns:
+        bool: True si se cambio de pagina.
+    """
+    if paso > 0:
+        if data["siguiente"] is None:
+            return False
+        # la pagina siguiente puede ya tener cursor si se volvio atras
+        del data["cursores"][data["pagina"] + 1:]
+        data["cursores"].append(data["siguiente"])
+        data["pagina"] += 1
+    else:
+        if data["pagina"] == 0:
+            return False
+        data["pagina"] -= 1
+
+    cargar_pagina(data)
+    return True
+
+
 def handle_event(event: dict, ctx: pg.event.Event) -> None:
     """Gestiona eventos de la pantalla Score.
 
-    Detecta clics en el boton "Volver" y cambia el form a menu.
+    - Clic en "Volver" cambia el form a menu.
+    - Clic en "<" / ">" o la rueda del mouse cambian de pagina.
+    - Clic en el campo de busqueda lo activa; escribir filtra por prefijo
+      cuando se deja de escribir (var.RANKING_FILTRO_MS) o al apretar Enter.
 
     Args:
         event (dict): Contexto general del juego.
@@ -84,12 +175,54 @@ def handle_event(event: dict, ctx: pg.event.Event) -> None:
 
         if aux.button_is_clicked(data["btn_volver"], mouse_pos, mouse_pr):
             fc.cambiar_form(event, "menu")
+            return
+
+        data["filtro_input"]["active"] = data["filtro_input"]["rect"].collidepoint(mouse_pos)
+        aux.invalidar_pantalla(event)
+
+        if aux.button_is_clicked(data["btn_anterior"], mouse_pos, mouse_pr):
+            cambiar_pagina(data, -1)
+        elif aux.button_is_clicked(data["btn_siguiente"], mouse_pos, mouse_pr):
+            cambiar_pagina(data, 1)
+
+    elif ctx.type == pg.MOUSEWHEEL and ctx.y != 0:
+        if cambiar_pagina(data, -1 if ctx.y > 0 else 1):
+            aux.invalidar_pantalla(event)
+
+    elif ctx.type == pg.KEYDOWN and data["filtro_input"]["active"]:
+        texto = data["filtro_input"]["text"]
+        if ctx.key in (pg.K_RETURN, pg.K_KP_ENTER):
+            if data["filtro_vence"] is not None:
+                aplicar_filtro(event, data)
+            return
+        if ctx.key == pg.K_BACKSPACE:
+            texto = texto[:-1]
+        elif len(texto) < 15 and (ctx.unicode.isalpha() or ctx.unicode == " "):
+            texto += ctx.unicode
+
+        if texto != data["filtro_input"]["text"]:
+            # Se busca cuando se deja de escribir (ver update), no en cada tecla
+            data["filtro_input"]["text"] = texto
+            data["filtro_vence"] = pg.time.get_ticks() + var.RANKING_FILTRO_MS
+            aux.invalidar_pantalla(event)
+
+
+def aplicar_filtro(event: dict, data: dict) -> None:
+    """Vuelve a la primera pagina con el filtro escrito y pide redibujar.
+
+    Args:
+        event (dict): Contexto general del juego.
+        data (dict): Datos del form de ranking.
+    """
+    data["filtro_vence"] = None
+    reiniciar_paginas(data)
+    aux.invalidar_pantalla(event)
 
 
 def update(event: dict) -> None:
     """Actualiza la logica de la pantalla Score.
 
-    Por ahora no realiza acciones adicionales.
+    Aplica el filtro cuando paso var.RANKING_FILTRO_MS desde la ultima tecla.
 
     Args:
         event (dict): Contexto general del juego.
@@ -97,7 +230,9 @@ def update(event: dict) -> None:
     Returns:
         None
     """
-    pass
+    data = event["forms"]["score"]
+    if data["filtro_vence"] is not None and pg.time.get_ticks() >= data["filtro_vence"]:
+        aplicar_filtro(event, data)
 
 
 def draw(event: dict) -> None:
@@ -106,8 +241,11 @@ def draw(event: dict) -> None:
     Se dibuja:
         - Fondo.
         - Titulo.
-        - Lista de puntajes.
-        - Boton "Volver" con efecto hover.
+        - Filas de la pagina actual.
+        - Campo de busqueda.
+        - Botones de pagina y "Volver" con efecto hover.
+
+    Fuera de un redibujo completo solo se redibujan los botones que cambiaron de color.
 
     Args:
         event (dict): Contexto general del juego.
@@ -117,6 +255,18 @@ def draw(event: dict) -> None:
     """
     screen = event["screen"]
     data = event["forms"]["score"]
+    mouse_pos = pg.mouse.get_pos()
+    botones = [data["btn_volver"]]
+    if data["pagina"] > 0:
+        botones.append(data["btn_anterior"])
+    if data["siguiente"] is not None:
+        botones.append(data["btn_siguiente"])
+
+    if not aux.redibujo_completo(event):
+        for b in botones:
+            if aux.update_button_hover(b, mouse_pos):
+                aux.redraw_button(event, data["fondo"], b)
+        return
 
     # fondo
     screen.blit(data["fondo"], (0, 0))
@@ -124,11 +274,18 @@ def draw(event: dict) -> None:
     # título
     aux.draw_label(screen, data["titulo"])
 
-    # lista
-    for lbl in data["labels_scores"]:
+    # filas de la pagina
+    for lbl in data["labels_scores"][:data["filas_visibles"]]:
         aux.draw_label(screen, lbl)
-    
-    # hover + boton
-    mouse_pos = pg.mouse.get_pos()
-    aux.update_button_hover(data["btn_volver"], mouse_pos)
-    aux.draw_button(screen, data["btn_volver"])
+
+    # busqueda
+    aux.draw_label(screen, data["lbl_filtro"])
+    rect = data["filtro_input"]["rect"]
+    pg.draw.rect(screen, data["filtro_input"]["color"], rect, 3 if data["filtro_input"]["active"] else 1)
+    txt_surf = aux.render_text(data["filtro_input"]["font"], data["filtro_input"]["text"], var.COLORS["white"])
+    screen.blit(txt_surf, (rect.x+5, rect.y+5))
+
+    # hover + botones
+    for b in botones:
+        aux.update_button_hover(b, mouse_pos)
+        aux.draw_button(screen, b)
@@ -0,0 +1,105 @@
+import pygame as pg
+import modules.variables as var
+
+# Administrador de fuentes: una sola pg.font.Font por (ruta, tamaño) para
+# todo el juego, asi cada form reutiliza las fuentes en lugar de crearlas.
+
+# (ruta, tamaño) -> pg.font.Font
+_fuentes = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def obtener(path: str, size: int) -> pg.font.Font:
+    """Devuelve la fuente compartida para esa ruta y tamaño, creandola si falta.
+
+    Args:
+        path (str): Ruta del archivo de fuente.
+        size (int): Tamaño de la fuente.
+
+    Returns:
+        pg.font.Font: Fuente lista para usar (no modificar su estilo: es compartida).
+    """
+    clave = (path, size)
+    font = _fuentes.get(clave)
+    if font is not None:
+        _stats["hits"] += 1
+        return font
+
+    _stats["misses"] += 1
+    font = _fuentes[clave] = pg.font.Font(path, size)
+    return font
+
+
+def precargar(en_uso: dict = None) -> None:
+    """Crea de antemano las fuentes que usan los forms.
+
+    Args:
+        en_uso (dict, optional): {ruta: (tamaños, ...)}. Por defecto var.FUENTES_EN_USO.
+    """
+    if en_uso is None:
+        en_uso = var.FUENTES_EN_USO
+
+    for path, tamaños in en_uso.items():
+        for size in tamaños:
+            obtener(path, size)
+
+
+def metricas(path: str, size: int) -> dict:
+    """Devuelve las metricas verticales de una fuente para armar layouts.
+
+    Args:
+        path (str): Ruta del archivo de fuente.
+        size (int): Tamaño de la fuente.
+
+    Returns:
+        dict: {"alto", "alto_linea", "ascenso", "descenso"} en pixeles.
+    """
+    font = obtener(path, size)
+    return {
+        "alto": font.get_height(),
+        "alto_linea": font.get_linesize(),
+        "ascenso": font.get_ascent(),
+        "descenso": font.get_descent(),
+    }
+
+
+def medir(path: str, size: int, texto: str) -> tuple:
+    """Devuelve el tamaño que ocupa un texto sin renderizarlo.
+
+    Args:
+        path (str): Ruta del archivo de fuente.
+        size (int): Tamaño de la fuente.
+        texto (str): Texto a medir.
+
+    Returns:
+        tuple: (ancho, alto) en pixeles.
+    """
+    return obtener(path, size).size(texto)
+
+
+def metricas_glifos(path: str, size: int, texto: str) -> list:
+    """Devuelve las metricas de cada caracter de un texto.
+
+    Args:
+        path (str): Ruta del archivo de fuente.
+        size (int): Tamaño de la fuente.
+        texto (str): Caracteres a consultar.
+
+    Returns:
+        list: Por caracter, (min_x, max_x, min_y, max_y, avance) o None si la
+        fuente no tiene ese glifo.
+    """
+    return obtener(path, size).metrics(texto)
+
+
+def get_stats() -> dict:
+    """Devuelve los contadores del administrador de fuentes.
+
+    Returns:
+        dict: {"fuentes", "hits", "misses"}
+    """
+    return {
+        "fuentes": len(_fuentes),
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+    }
@@ -1,141 +1,82 @@
-import json
-import random
-import pygame as pg
 import modules.sonido as so
-import modules.variables as var 
+import modules.motor_combate as motor
 import modules.form_controller as fc
+import modules.atlas as atlas
+import modules.replay as replay
 
-def load_cards(path: str) -> list:
-    """Carga un archivo JSON con cartas y devuelve la lista de cartas.
-
-    Args:
-        path (str): Ruta del archivo JSON.
-
-    Returns:
-        list: Lista de cartas (diccionarios).
-    """
-    with open(path, "r", encoding="utf-8") as file:
-        data = json.load(file)
-    return data
+# Capa de pygame sobre motor_combate: aplica las reglas al estado de la
+# partida (ctx["forms"]["combat"]["estado"]) y ejecuta los efectos que el
+# motor deja encolados (sonidos, musica y cambio a la pantalla de resultados).
 
 
-def filter_cards_by_series(cards: list) -> dict:
-    """Organiza las cartas por serie.
+def procesar_eventos(ctx: dict) -> None:
+    """Consume los eventos que dejo el motor de combate y ejecuta sus efectos.
 
     Args:
-        cards (list): Lista de cartas.
-
-    Returns:
-        dict: Diccionario con series como keys y listas de cartas como valores.
+        ctx (dict): Contexto del juego con forms.
     """
-    series_dict = {}
+    estado = ctx["forms"]["combat"]["estado"]
 
-    for c in cards:
-        serie = c["serie"]
-        if serie not in series_dict:
-            series_dict[serie] = []
-        series_dict[serie].append(c)
+    for tipo, valor in motor.consumir_eventos(estado):
+        match tipo:
+            case "sfx":
+                so.play_sfx(valor)
+            case "musica":
+                so.play_music(ctx, valor)
+            case "fin":
+                guardar_replay(ctx)
+                fc.cambiar_form(ctx, "results")
 
-    return series_dict
 
+def guardar_replay(ctx: dict) -> None:
+    """Cierra la repeticion de la partida terminada y la guarda en var.REPLAY_DIR.
 
-def generate_random_deck(series_dict: dict, distribution: dict) -> list:
-    """Genera un mazo aleatorio cumpliendo la distribucion de series.
+    Despues borra las mas viejas si la carpeta pasa de var.REPLAY_MAX.
 
     Args:
-        series_dict (dict): Diccionario de series con sus cartas.
-        distribution (dict): Distribucion de cartas por serie, ejemplo {"platinum":1, "black":3}
-
-    Returns:
-        list: Mazo aleatorio como lista de cartas.
+        ctx (dict): Contexto del juego con forms.
     """
-    deck = []
-
-    for serie, cantidad in distribution.items():
-        if serie not in series_dict:
-            print(f"Serie no encontrada en cartas: {serie}")
-            continue
-
-        cartas_serie = series_dict[serie]
-        cantidad_real = min(cantidad, len(cartas_serie))
-        seleccionadas = random.sample(cartas_serie, cantidad_real)
-
-        deck.extend(seleccionadas)
+    data = ctx["forms"]["combat"]
+    estado = data["estado"]
 
-    return deck
+    replay.cerrar(data["replay"], estado)
+    try:
+        replay.guardar(data["replay"], replay.ruta_replay(estado.semilla))
+        replay.podar()
+    except OSError as e:
+        print(f"No se pudo guardar la repeticion: {e}")
 
 
 def robar_carta(ctx: dict, player: bool = True) -> None:
-    """Roba la siguiente carta del mazo para el jugador o rival y actualiza el reverso.
+    """Roba la siguiente carta del mazo para el jugador y el rival y actualiza los reversos.
 
     Args:
         ctx (dict): Contexto del juego con forms.
         player (bool, optional): True para jugador, False para rival. Defaults to True.
     """
     data = ctx["forms"]["combat"]
+    estado = data["estado"]
 
-    if player:
-        mazo = data["mazo_player"]
-        idx = data["mazo_index_player"]
-
-        if idx >= len(mazo):
-            data["carta_player_actual"] = None
-            data["mazo_reverso_player"] = None
-            return
-
-        carta = mazo[idx]
-        data["carta_player_actual"] = carta
-        data["mazo_index_player"] += 1
-
-        siguiente = obtener_reverso_siguiente(mazo, data["mazo_index_player"])
-        if siguiente:
-            data["mazo_reverso_player"] = pg.transform.scale(
-                pg.image.load(siguiente).convert_alpha(),
-                (130, 180)
-            )
-        else:
-            data["mazo_reverso_player"] = None
-
-        robar_carta(ctx, player=False)
+    motor.robar_carta(estado, player)
 
-    else:
-        mazo = data["mazo_rival"]
-        idx = data["mazo_index_rival"]
+    data["mazo_reverso_player"] = load_rev(estado.mazo_player, estado.mazo_index_player)
+    data["mazo_reverso_rival"] = load_rev(estado.mazo_rival, estado.mazo_index_rival)
 
-        if idx >= len(mazo):
-            data["carta_rival_actual"] = None
-            data["mazo_reverso_rival"] = None
-            return
 
-        carta = mazo[idx]
-        data["carta_rival_actual"] = carta
-        data["mazo_index_rival"] += 1
-
-        siguiente = obtener_reverso_siguiente(mazo, data["mazo_index_rival"])
-        if siguiente:
-            data["mazo_reverso_rival"] = pg.transform.scale(
-                pg.image.load(siguiente).convert_alpha(),
-                (130, 180)
-            )
-        else:
-            data["mazo_reverso_rival"] = None
-
-
-def load_rev(mazo: list):
-    """Carga el reverso de la primera carta del mazo escalado a 130x180.
+def load_rev(mazo: list, index: int = 0):
+    """Carga el reverso de la carta del mazo en la posicion indicada escalado a 130x180.
 
     Args:
         mazo (list): Lista de cartas.
+        index (int, optional): Indice de la proxima carta. Por defecto la primera.
 
     Returns:
-        pg.Surface|None: Imagen escalada del reverso o None si mazo vacio.
+        pg.Surface|None: Imagen escalada del reverso o None si no quedan cartas.
     """
-    if len(mazo) == 0: 
+    siguiente = obtener_reverso_siguiente(mazo, index)
+    if siguiente is None:
         return None
-    return pg.transform.scale(
-        pg.image.load(mazo[0]["ruta_reverso"]).convert_alpha(),
-        (130, 180)
-    )
+    return atlas.imagen_combate(siguiente, (130, 180))
 
 
 def obtener_reverso_siguiente(mazo: list, index: int):
@@ -150,73 +91,7 @@ def obtener_reverso_siguiente(mazo: list, index: int):
     """
     if index >= len(mazo):
         return None
-    return mazo[index]["ruta_reverso"]
-
-
-def calculate_average_stats(deck: list) -> dict:
-    """Calcula el promedio de HP, ATK y DEF de un mazo.
-
-    Args:
-        deck (list): Lista de cartas.
-
-    Returns:
-        dict: Promedios de stats {"hp": ..., "atk": ..., "def": ...}
-    """
-    if len(deck) == 0:
-        return {"hp": 0, "atk": 0, "def": 0}
-
-    get_hp  = lambda c: int(c["hp"])
-    get_atk = lambda c: int(c["atk"])
-    get_def = lambda c: int(c["def"])
-
-    lista_hp  = [get_hp(carta) for carta in deck]
-    lista_atk = [get_atk(carta) for carta in deck]
-    lista_def = [get_def(carta) for carta in deck]
-
-    n = len(deck)
-
-    def sumar(lista):
-        total = 0
-        for x in lista:
-            total += x
-        return total
-
-    return {
-        "hp":  sumar(lista_hp * 15) // n,
-        "atk": sumar(lista_atk) // n,
-        "def": sumar(lista_def) // n
-    }
-
-
-
-def calcular_ataque_total(carta: dict) -> float:
-    """Calcula el ataque total de una carta sumando su bonus.
-
-    Args:
-        carta (dict): Carta a evaluar.
-
-    Returns:
-        float: Valor total de ataque.
-    """
-    return int(carta["atk"]) + float(carta["bonus"])
-
-
-def calcular_daño(carta: dict) -> int:
-    """Calcula el daño total de una carta sumando hp, atk, def y bonus.
-
-    Args:
-        carta (dict): Carta a evaluar.
-
-    Returns:
-        int: Daño total como entero.
-    """
-    bonus = float(carta["bonus"])
-    hp  = float(carta["hp"])  + bonus
-    atk = float(carta["atk"]) + bonus
-    defn = float(carta["def"]) + bonus
-    total = hp + atk + defn
-
-    return int(total)
+    return mazo[index].ruta_reverso
 
 
 def resolver_mano(ctx: dict) -> None:
@@ -225,166 +100,25 @@ def resolver_mano(ctx: dict) -> None:
     Args:
         ctx (dict): Contexto del juego con forms.
     """
-    data = ctx["forms"]["combat"]
-    carta_p = data["carta_player_actual"]
-    carta_r = data["carta_rival_actual"]
-
-    #añadir turno
-    if data["carta_player_actual"] and data["carta_rival_actual"]:
-        data["turno_actual"] += 1
-    
-    #si no hay carta
-    if carta_p is None or carta_r is None:
-        return
-
-    atk_p = calcular_ataque_total(carta_p)
-    atk_r = calcular_ataque_total(carta_r)
-
-    #empate
-    if atk_p == atk_r:
-        return
-
-    # Jugador pierde
-    if atk_p < atk_r:
-        #Shield
-        if data.get("shield_activo", False):
-            daño_reflejado = calcular_daño(carta_r)
-            daño_reflejado -= int(data["stats_r"]["def"])
-            daño_reflejado = max(1, daño_reflejado)
-            data["stats_r"]["hp"] -= daño_reflejado
-            data["stats_r"]["hp"] = max(0, data["stats_r"]["hp"])
-            data["shield_activo"] = False
-            so.play_sfx(var.SHIELD_BROKEN_SFX)
-            agregar_puntaje(ctx, 500)
-            return
-        
-        #no shield
-        daño = calcular_daño(carta_p)
-        daño -= int(data["stats_p"]["def"])
-        daño = max(1, daño)
-        data["stats_p"]["hp"] -= daño
-        data["stats_p"]["hp"] = max(0, data["stats_p"]["hp"])
-        so.play_sfx(var.HIT_SFX)
-
-        hp_inicial = data.get("hp_inicial_player", data["stats_p"]["hp"])
-        if not data.get("music_danger_on", False) and data["stats_p"]["hp"] < hp_inicial * 0.5:
-            so.play_sfx(var.DANGER_SFX)
-            so.play_music(ctx, var.MUSICA_LASTSTAND)
-            data["music_danger_on"] = True
-            agregar_puntaje(ctx, 500)
-        return
-
-    # Rival pierde
-    else:
-        daño = calcular_daño(carta_r)
-        daño -= int(data["stats_r"]["def"])
-        daño = max(1, daño)
-        data["stats_r"]["hp"] -= daño
-        data["stats_r"]["hp"] = max(0, data["stats_r"]["hp"])
-        so.play_sfx(var.WIN_SFX)
-        agregar_puntaje(ctx, 100)
+    motor.resolver_mano(ctx["forms"]["combat"]["estado"])
+    procesar_eventos(ctx)
+
 
 def check_fin_partida(ctx: dict) -> bool:
     """Verifica si la partida ha terminado por tiempo, HP o cartas.
 
-    Args:
-        ctx (dict): Contexto del juego.
-
-    Returns:
-        bool: True si la partida termino, False en caso contrario.
-    """
-    data = ctx["forms"]["combat"]
-
-    if data["timer_actual"] <= 0:
-        hp_p = data["stats_p"]["hp"]
-        hp_r = data["stats_r"]["hp"]
-
-        if hp_p < hp_r:
-            terminar_partida(ctx, ganador="rival")
-            return True
-        elif hp_r < hp_p:
-            terminar_partida(ctx, ganador="player")
-            agregar_puntaje(ctx, 1000)
-            return True
-        else:
-            terminar_partida(ctx, ganador="empate")
-            agregar_puntaje(ctx, 500)
-            return True
-
-    if data["stats_p"]["hp"] <= 0:
-        terminar_partida(ctx, ganador="rival")
-        return True
-
-    if data["stats_r"]["hp"] <= 0:
-        terminar_partida(ctx, ganador="player")
-        agregar_puntaje(ctx, 1000)
-        return True
-
-    if data["mazo_index_player"] >= len(data["mazo_player"]):
-        if data["stats_p"]["hp"] < data["stats_r"]["hp"]:
-            terminar_partida(ctx, ganador="rival")
-        else:
-            terminar_partida(ctx, ganador="player")
-            agregar_puntaje(ctx, 1000)
-        return True
-
-    return False
-
-
-def terminar_partida(ctx: dict, ganador: str) -> bool:
-    """Finaliza la partida, reproduce sfx y cambia al form de resultados.
+    Si termino, pasa a la pantalla de resultados.
 
     Args:
         ctx (dict): Contexto del juego.
-        ganador (str): "player", "rival" o "empate".
 
     Returns:
-        bool: Siempre True.
-    """
-    data = ctx["forms"]["combat"]
-    
-    if ganador == "player":
-        #puntos por victoria
-        max_turnos = 40
-        turnos = data.get("turno_actual", 0)
-        bonus = max(0, (max_turnos - turnos) * 100)
-        agregar_puntaje(ctx, 1500 + bonus)
-    else:
-        data["victoria"] = False
-        agregar_puntaje(ctx, 0)
-    
-    if ganador == "player":
-        so.play_sfx(var.WIN_SFX)
-    elif ganador == "rival":
-        so.play_sfx(var.HIT_SFX)
-    else:
-        so.play_sfx(var.SHIELD_BROKEN_SFX)
-
-    fc.cambiar_form(ctx, "results")
-    return True
-
-
-def iniciar_puntaje(ctx: dict):
-    """Inicializa el puntaje en 0 al comenzar una partida.
-
-    Args:
-        ctx (dict): Contexto del juego.
+        bool: True si la partida termino, False en caso contrario.
     """
-    data = ctx["forms"]["combat"]
-    data["puntaje"] = 0
-
+    terminada = motor.check_fin_partida(ctx["forms"]["combat"]["estado"])
+    procesar_eventos(ctx)
+    return terminada
 
-def agregar_puntaje(ctx: dict, puntos: int):
-    """Suma puntos al puntaje actual.
-
-    Args:
-        ctx (dict): Contexto del juego.
-        puntos (int): Puntos a agregar.
-    """
-    data = ctx["forms"]["combat"]
-    if "puntaje" not in data:
-        data["puntaje"] = 0
-    data["puntaje"] += puntos
 
 def activar_heal(ctx: dict) -> None:
     """Activa el comodín de curación del jugador.
@@ -397,16 +131,10 @@ def activar_heal(ctx: dict) -> None:
     """
     data = ctx["forms"]["combat"]
 
-    if data["heal_usado"]:
-        return
+    motor.activar_heal(data["estado"])
+    data["accion"][1]["visible"] = not data["estado"].heal_usado
+    procesar_eventos(ctx)
 
-    # Calcula nueva vida, sin superar la vida inicial
-    nueva_hp = data["stats_p"]["hp"] + data["hp_inicial_player"] * 0.25
-    data["stats_p"]["hp"] = min(nueva_hp, data["hp_inicial_player"])
-
-    data["heal_usado"] = True
-    data["accion"][1]["visible"] = False
-    so.play_sfx(var.HEAL_SFX)
 
 def activar_shield(ctx: dict) -> None:
     """Activa el comodín de shield del jugador.
@@ -418,10 +146,6 @@ def activar_shield(ctx: dict) -> None:
     """
     data = ctx["forms"]["combat"]
 
-    if data["shield_usado"]:
-        return
-
-    data["shield_activo"] = True
-    data["shield_usado"] = True
-    data["accion"][2]["visible"] = False
-    so.play_sfx(var.SHIELD_SFX)
+    motor.activar_shield(data["estado"])
+    data["accion"][2]["visible"] = not data["estado"].shield_usado
+    procesar_eventos(ctx)
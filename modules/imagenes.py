@@ -0,0 +1,227 @@
+import os
+import pygame as pg
+from collections import OrderedDict
+import modules.variables as var
+import modules.compilar_assets as build
+import modules.paquete_imagenes as paquete
+
+# Cache compartido de superficies: (ruta, tamaño, alpha) -> pg.Surface
+_cache = OrderedDict()
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "evicciones": 0,
+}
+# Manifiesto de imagenes pre-escaladas (se lee una sola vez)
+_manifiesto = None
+# Paquete mapeado de imagenes de cartas: None sin abrir, False si no existe
+_paquete = None
+# Imagenes ya decodificadas por el hilo de precarga, sin convertir: (ruta, tamaño) -> pg.Surface
+_decodificadas = {}
+
+
+def cargar_imagen(path: str, size: tuple = None, alpha: bool = True) -> pg.Surface:
+    """Devuelve una superficie convertida y escalada usando el cache compartido.
+
+    Si la combinacion (ruta, tamaño, alpha) ya fue cargada se devuelve la misma
+    superficie sin volver a leer el archivo. Cuando el cache supera
+    var.IMG_CACHE_MAX entradas se descarta la menos usada recientemente.
+    Las cartas se toman del paquete de paquete_imagenes o de la version
+    pre-escalada de compilar_assets si existen (ver leer_imagen).
+
+    Args:
+        path (str): Ruta de la imagen.
+        size (tuple, optional): Tamaño final (ancho, alto). None mantiene el original.
+        alpha (bool, optional): True para convert_alpha(), False para convert().
+
+    Returns:
+        pg.Surface: Superficie lista para dibujar.
+    """
+    key = (path, tuple(size) if size else None, alpha)
+
+    surf = _cache.get(key)
+    if surf is not None:
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+        return surf
+
+    _stats["misses"] += 1
+    surf = _decodificadas.pop((path, key[1]), None)
+    if surf is not None:
+        surf = _convertir(surf, alpha)
+    else:
+        surf = leer_imagen(path, size, alpha)
+
+    _cache[key] = surf
+    while len(_cache) > var.IMG_CACHE_MAX:
+        _cache.popitem(last=False)
+        _stats["evicciones"] += 1
+
+    return surf
+
+
+def registrar_decodificada(path: str, size: tuple, surf: pg.Surface) -> None:
+    """Guarda una imagen decodificada fuera del hilo principal para usarla en cargar_imagen.
+
+    La conversion al formato de pantalla se hace recien cuando se pide la imagen.
+
+    Args:
+        path (str): Ruta de la imagen.
+        size (tuple): Tamaño al que se escalo, o None.
+        surf (pg.Surface): Superficie decodificada y escalada.
+    """
+    if cargada(path, size):
+        # El hilo principal la cargo mientras se decodificaba: no guardarla dos veces
+        return
+    _decodificadas[(path, tuple(size) if size else None)] = surf
+
+
+def cargada(path: str, size: tuple = None) -> bool:
+    """Indica si una imagen ya esta en el cache o decodificada esperando su conversion.
+
+    Args:
+        path (str): Ruta de la imagen.
+        size (tuple, optional): Tamaño (ancho, alto) o None.
+
+    Returns:
+        bool: True si no hace falta volver a decodificarla.
+    """
+    size = tuple(size) if size else None
+    return (path, size, True) in _cache or (path, size, False) in _cache or (path, size) in _decodificadas
+
+
+def leer_imagen(path: str, size: tuple = None, alpha: bool = True) -> pg.Surface:
+    """Lee, escala y convierte una imagen sin pasar por el cache.
+
+    Busca primero en el paquete de imagenes de cartas y despues en la version
+    pre-escalada de compilar_assets; si no esta en ninguno lee el original.
+
+    Args:
+        path (str): Ruta de la imagen.
+        size (tuple, optional): Tamaño final (ancho, alto). None mantiene el original.
+        alpha (bool, optional): True para convert_alpha(), False para convert().
+
+    Returns:
+        pg.Surface: Superficie nueva.
+    """
+    empaquetada = _desde_paquete(path, size)
+    if empaquetada is not None:
+        # Ya esta en el formato de pantalla: convertirla copiaria los pixeles
+        # fuera del mapa. Solo se convierte si se pide sin alpha.
+        return empaquetada if alpha else _convertir(empaquetada, alpha)
+
+    return _convertir(decodificar(path, size), alpha)
+
+
+def decodificar(path: str, size: tuple = None) -> pg.Surface:
+    """Lee y escala una imagen sin convertirla al formato de pantalla.
+
+    Usa el paquete o la version pre-escalada si existen, igual que leer_imagen.
+    Se puede llamar desde el hilo de precarga.
+
+    Args:
+        path (str): Ruta de la imagen.
+        size (tuple, optional): Tamaño final (ancho, alto). None mantiene el original.
+
+    Returns:
+        pg.Surface: Superficie sin convertir.
+    """
+    empaquetada = _desde_paquete(path, size)
+    if empaquetada is not None:
+        return empaquetada
+
+    precompilada = _ruta_precompilada(path, size)
+    if precompilada:
+        return pg.image.load(precompilada)
+
+    surf = pg.image.load(path)
+    if size:
+        surf = pg.transform.scale(surf, size)
+    return surf
+
+
+def _desde_paquete(path: str, size: tuple):
+    """Busca la imagen en el paquete mapeado de cartas, abriendolo la primera vez.
+
+    Args:
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño pedido o None.
+
+    Returns:
+        pg.Surface|None: Superficie que apunta a los pixeles del paquete, o None.
+    """
+    global _paquete
+    if not size:
+        return None
+    if _paquete is None:
+        _paquete = paquete.abrir() or False
+    if not _paquete:
+        return None
+    return paquete.superficie(_paquete, path, size)
+
+
+def _ruta_precompilada(path: str, size: tuple):
+    """Busca en el manifiesto la version pre-escalada de una imagen.
+
+    Args:
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño pedido o None.
+
+    Returns:
+        str|None: Ruta del archivo pre-escalado o None si no existe.
+    """
+    global _manifiesto
+    if not size:
+        return None
+    if _manifiesto is None:
+        _manifiesto = build.leer_manifiesto()
+
+    destino = _manifiesto.get(build.clave_manifiesto(path, size))
+    if destino and os.path.exists(destino):
+        return destino
+    return None
+
+
+def _convertir(surf: pg.Surface, alpha: bool) -> pg.Surface:
+    """Convierte la superficie al formato de pantalla si hay un display activo.
+
+    Args:
+        surf (pg.Surface): Superficie a convertir.
+        alpha (bool): True para conservar el canal alpha.
+
+    Returns:
+        pg.Surface: Superficie convertida (o la original si no hay display).
+    """
+    if pg.display.get_surface() is None:
+        return surf
+    if alpha:
+        return surf.convert_alpha()
+    return surf.convert()
+
+
+def get_stats() -> dict:
+    """Devuelve los contadores del cache de imagenes.
+
+    Returns:
+        dict: {"hits", "misses", "evicciones", "entradas", "hit_rate"}
+    """
+    total = _stats["hits"] + _stats["misses"]
+    return {
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "evicciones": _stats["evicciones"],
+        "entradas": len(_cache),
+        "hit_rate": _stats["hits"] / total if total else 0.0,
+    }
+
+
+def limpiar_cache() -> None:
+    """Vacia el cache de imagenes, reinicia los contadores y vuelve a leer el manifiesto y el paquete."""
+    global _manifiesto, _paquete
+    _manifiesto = None
+    _cache.clear()
+    if _paquete:
+        paquete.cerrar(_paquete)
+    _paquete = None
+    for k in _stats:
+        _stats[k] = 0
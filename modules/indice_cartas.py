@@ -0,0 +1,246 @@
+import os
+import re
+import json
+import struct
+import argparse
+import modules.variables as var
+
+# Indice binario de cartas: reemplaza el parseo de cartas.json al iniciar.
+# Se genera a partir de cartas.json y de los PNG de las cartas, validando que
+# los stats del nombre de archivo coincidan con los del JSON.
+#   python -m modules.indice_cartas            -> genera el indice y muestra los problemas
+#
+# Formato (little endian):
+#   cabecera  "CIDX", version u16, cartas u32, bytes de textos u32,
+#             mtime f64 y tamaño u64 del JSON con el que se genero
+#   cartas    id u32, serie u32, frente u32, reverso u32   (indices de texto)
+#             hp i32, atk i32, def i32, bonus f64, ancho u16, alto u16
+#   textos    cadenas utf-8 separadas por "\n"; cada texto distinto se guarda
+#             una sola vez (las 812 cartas comparten 17 reversos y 8 series)
+
+MAGIA = b"CIDX"
+VERSION = 1
+_CABECERA = struct.Struct("<4sHIIdQ")
+_CARTA = struct.Struct("<IIIIiiidHH")
+
+# Nombre de los frentes: "<id>_HP_<hp>_ATK_<atk>_DEF_<def>_<bonus %>.png"
+PATRON_FRENTE = re.compile(
+    r"^(?P<id>[\d.]+)_HP_(?P<hp>\d+)_ATK_(?P<atk>\d+)_DEF_(?P<def>\d+)_(?P<bonus>\d+)\.png$"
+)
+
+_FIRMA_PNG = b"\x89PNG\r\n\x1a\n"
+
+
+def ruta_indice(json_path: str) -> str:
+    """Devuelve la ruta del indice binario de un JSON de cartas.
+
+    Args:
+        json_path (str): Ruta del JSON.
+
+    Returns:
+        str: Ruta con extension .idx en la misma carpeta.
+    """
+    return os.path.splitext(json_path)[0] + ".idx"
+
+
+def dimensiones_png(path: str):
+    """Lee ancho y alto de un PNG desde su cabecera IHDR, sin decodificarlo.
+
+    Args:
+        path (str): Ruta del PNG.
+
+    Returns:
+        tuple|None: (ancho, alto) o None si no existe o no es un PNG.
+    """
+    try:
+        with open(path, "rb") as file:
+            cabecera = file.read(24)
+    except OSError:
+        return None
+
+    if len(cabecera) < 24 or cabecera[:8] != _FIRMA_PNG or cabecera[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", cabecera[16:24])
+
+
+def stats_de_nombre(path: str):
+    """Extrae id y stats del nombre de archivo de un frente.
+
+    Args:
+        path (str): Ruta del frente.
+
+    Returns:
+        dict|None: {"id", "hp", "atk", "def", "bonus"} o None si el nombre no tiene el formato.
+    """
+    m = PATRON_FRENTE.match(os.path.basename(path))
+    if m is None:
+        return None
+    return {
+        "id": m["id"],
+        "hp": int(m["hp"]),
+        "atk": int(m["atk"]),
+        "def": int(m["def"]),
+        "bonus": int(m["bonus"]) / 100,
+    }
+
+
+def validar(cartas: list, carpeta_decks: str = "assets/img/decks") -> list:
+    """Compara cada carta del JSON con su archivo de frente y con los PNG en disco.
+
+    Args:
+        cartas (list): Cartas de cartas.json.
+        carpeta_decks (str, optional): Carpeta con los mazos, para buscar frentes sin carta.
+
+    Returns:
+        list: Mensajes con los problemas encontrados.
+    """
+    problemas = []
+    rutas = set()
+
+    for c in cartas:
+        frente = c["ruta_frente"]
+        rutas.add(os.path.normpath(frente))
+
+        stats = stats_de_nombre(frente)
+        if stats is None:
+            problemas.append(f"Nombre sin stats: {frente}")
+        else:
+            for campo in ("id", "hp", "atk", "def"):
+                if stats[campo] != c[campo]:
+                    problemas.append(f"{campo} distinto en {frente}: archivo {stats[campo]}, JSON {c[campo]}")
+            if round(stats["bonus"] * 100) != round(c["bonus"] * 100):
+                problemas.append(f"bonus distinto en {frente}: archivo {stats['bonus']}, JSON {c['bonus']}")
+
+        carpeta = os.path.basename(os.path.dirname(frente))
+        if not carpeta.startswith(c["serie"]):
+            problemas.append(f"Serie {c['serie']} en carpeta {carpeta}: {frente}")
+
+        for ruta in (frente, c["ruta_reverso"]):
+            if dimensiones_png(ruta) is None:
+                problemas.append(f"Falta o no es PNG: {ruta}")
+
+    # Frentes en disco que no estan en el JSON
+    for raiz, _, archivos in os.walk(carpeta_decks):
+        for nombre in archivos:
+            ruta = os.path.normpath(os.path.join(raiz, nombre))
+            if PATRON_FRENTE.match(nombre) and ruta not in rutas:
+                problemas.append(f"Frente sin carta en el JSON: {ruta}")
+
+    # Sin repetidos por ruta (los avisos de archivo faltante del reverso se repiten por carta)
+    return list(dict.fromkeys(problemas))
+
+
+def generar(json_path: str = var.JSON_CARDS, salida: str = None) -> dict:
+    """Genera el indice binario a partir del JSON y de los PNG.
+
+    Args:
+        json_path (str, optional): Ruta del JSON de cartas.
+        salida (str, optional): Ruta del indice. Por defecto ruta_indice(json_path).
+
+    Returns:
+        dict: {"salida", "cartas", "textos", "bytes", "problemas"}
+    """
+    if salida is None:
+        salida = ruta_indice(json_path)
+
+    with open(json_path, "r", encoding="utf-8") as file:
+        cartas = json.load(file)
+
+    textos = {}
+
+    def texto(valor: str) -> int:
+        return textos.setdefault(valor, len(textos))
+
+    registros = bytearray()
+    for c in cartas:
+        ancho, alto = dimensiones_png(c["ruta_frente"]) or (0, 0)
+        registros += _CARTA.pack(
+            texto(c["id"]), texto(c["serie"]), texto(c["ruta_frente"]), texto(c["ruta_reverso"]),
+            c["hp"], c["atk"], c["def"], c["bonus"], ancho, alto,
+        )
+
+    blob = "\n".join(textos).encode("utf-8")
+    stat = os.stat(json_path)
+    cabecera = _CABECERA.pack(MAGIA, VERSION, len(cartas), len(blob), stat.st_mtime, stat.st_size)
+
+    # Se escribe aparte y se reemplaza de una vez: un indice a medio escribir
+    # nunca queda con la cabecera de un JSON valido
+    temporal = salida + ".tmp"
+    with open(temporal, "wb") as file:
+        file.write(cabecera + registros + blob)
+    os.replace(temporal, salida)
+
+    return {
+        "salida": salida,
+        "cartas": len(cartas),
+        "textos": len(textos),
+        "bytes": len(cabecera) + len(registros) + len(blob),
+        "problemas": validar(cartas),
+    }
+
+
+def cargar(json_path: str = var.JSON_CARDS):
+    """Carga las cartas desde el indice binario si esta al dia con el JSON.
+
+    Args:
+        json_path (str, optional): Ruta del JSON de cartas.
+
+    Returns:
+        tuple|None: (cartas, dimensiones) con las cartas como los diccionarios
+        de cartas.json y dimensiones {ruta_frente: (ancho, alto)}; None si no
+        hay indice, esta incompleto o fue generado con otra version del JSON.
+    """
+    try:
+        with open(ruta_indice(json_path), "rb") as file:
+            datos = file.read()
+        stat = os.stat(json_path)
+    except OSError:
+        return None
+
+    if len(datos) < _CABECERA.size:
+        return None
+    magia, version, cantidad, largo_textos, mtime, tamaño = _CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA or version != VERSION or mtime != stat.st_mtime or tamaño != stat.st_size:
+        return None
+
+    inicio_textos = _CABECERA.size + cantidad * _CARTA.size
+    if len(datos) != inicio_textos + largo_textos:
+        return None
+    textos = datos[inicio_textos:inicio_textos + largo_textos].decode("utf-8").split("\n")
+
+    cartas = []
+    dimensiones = {}
+    for id_, serie, frente, reverso, hp, atk, defensa, bonus, ancho, alto in _CARTA.iter_unpack(
+            memoryview(datos)[_CABECERA.size:inicio_textos]):
+        ruta = textos[frente]
+        cartas.append({
+            "id": textos[id_],
+            "serie": textos[serie],
+            "hp": hp,
+            "atk": atk,
+            "def": defensa,
+            "bonus": bonus,
+            "ruta_frente": ruta,
+            "ruta_reverso": textos[reverso],
+        })
+        dimensiones[ruta] = (ancho, alto)
+
+    return (cartas, dimensiones)
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.indice_cartas [cartas.json]"""
+    parser = argparse.ArgumentParser(description="Genera el indice binario de cartas y valida los nombres de archivo")
+    parser.add_argument("json", nargs="?", default=var.JSON_CARDS, help="JSON de cartas")
+    args = parser.parse_args()
+
+    resumen = generar(args.json)
+    print(f"Indice: {resumen['salida']}")
+    print(f"Cartas: {resumen['cartas']}  Textos distintos: {resumen['textos']}  Bytes: {resumen['bytes']}")
+    print(f"Problemas: {len(resumen['problemas'])}")
+    for problema in resumen["problemas"]:
+        print(f"  {problema}")
+
+
+if __name__ == "__main__":
+    main()
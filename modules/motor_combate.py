@@ -0,0 +1,359 @@
+import random
+import modules.variables as var
+import modules.cartas as cartas
+
+# Motor de combate sin pygame: reglas puras sobre un estado explicito.
+# Los efectos (sonidos, musica, fin de partida) no se ejecutan aca: se
+# encolan en estado.eventos como tuplas y la capa de pygame los consume.
+#   ("sfx", ruta)        -> reproducir un efecto de sonido
+#   ("musica", ruta)     -> cambiar la musica de fondo
+#   ("fin", ganador)     -> la partida termino ("player", "rival" o "empate")
+
+# Las semillas se guardan como u64 en las repeticiones
+MASCARA_SEMILLA = 2 ** 64 - 1
+
+
+class EstadoCombate:
+    """Estado de una partida, con un atributo por campo (__slots__).
+
+    Las stats promedio de cada mazo quedan sueltas (hp_player, atk_player,
+    def_player y las del rival) para que las reglas no busquen por clave.
+
+    Args:
+        mazo_player (list): Mazo del jugador (Carta), ya mezclado.
+        mazo_rival (list): Mazo del rival (Carta), ya mezclado.
+        stats_p (dict): Stats promedio del jugador {"hp", "atk", "def"}.
+        stats_r (dict): Stats promedio del rival {"hp", "atk", "def"}.
+        timer (int): Duracion de la partida en milisegundos.
+    """
+
+    __slots__ = (
+        "mazo_player", "mazo_rival", "mazo_index_player", "mazo_index_rival",
+        "carta_player_actual", "carta_rival_actual",
+        "hp_player", "atk_player", "def_player", "hp_rival", "atk_rival", "def_rival",
+        "hp_inicial_player",
+        "timer_max", "timer_actual", "turno_actual", "puntaje",
+        "heal_usado", "shield_usado", "shield_activo", "music_danger_on",
+        "terminada", "ganador", "victoria",
+        "semilla", "eventos",
+    )
+
+    def __init__(self, mazo_player: list, mazo_rival: list, stats_p: dict, stats_r: dict, timer: int):
+        self.mazo_player = mazo_player
+        self.mazo_rival = mazo_rival
+        self.mazo_index_player = 0
+        self.mazo_index_rival = 0
+        self.carta_player_actual = None
+        self.carta_rival_actual = None
+
+        self.hp_player = stats_p["hp"]
+        self.atk_player = stats_p["atk"]
+        self.def_player = stats_p["def"]
+        self.hp_rival = stats_r["hp"]
+        self.atk_rival = stats_r["atk"]
+        self.def_rival = stats_r["def"]
+        self.hp_inicial_player = stats_p["hp"]
+
+        self.timer_max = timer
+        self.timer_actual = timer
+        self.turno_actual = 0
+        self.puntaje = 0
+
+        self.heal_usado = False
+        self.shield_usado = False
+        self.shield_activo = False
+        self.music_danger_on = False
+
+        self.terminada = False
+        self.ganador = None
+        self.victoria = True
+
+        self.semilla = None
+        self.eventos = []
+
+
+def crear_estado(mazo_player: list, mazo_rival: list, timer: int = var.STAGE_TIMER,
+                 stats_p: dict = None, stats_r: dict = None) -> EstadoCombate:
+    """Crea el estado inicial de una partida.
+
+    Args:
+        mazo_player (list): Mazo del jugador (Carta), ya mezclado.
+        mazo_rival (list): Mazo del rival (Carta), ya mezclado.
+        timer (int, optional): Duracion de la partida en milisegundos.
+        stats_p (dict, optional): Stats promedio del jugador si ya se calcularon.
+        stats_r (dict, optional): Stats promedio del rival si ya se calcularon.
+
+    Returns:
+        EstadoCombate: Estado de combate.
+    """
+    if stats_p is None:
+        stats_p = cartas.calculate_average_stats(mazo_player)
+    if stats_r is None:
+        stats_r = cartas.calculate_average_stats(mazo_rival)
+
+    return EstadoCombate(mazo_player, mazo_rival, stats_p, stats_r, timer)
+
+
+def crear_partida(por_serie: dict, semilla: int, distribucion: dict = var.DISTRIBUCION_MAZO,
+                  timer: int = var.STAGE_TIMER) -> EstadoCombate:
+    """Arma los dos mazos con un generador propio y crea el estado de la partida.
+
+    La misma semilla con las mismas cartas siempre da los mismos mazos.
+    La semilla se lleva a 64 bits sin signo (una negativa o mas grande se
+    enmascara), que es lo que se graba en la repeticion.
+
+    Args:
+        por_serie (dict): Cartas agrupadas por serie.
+        semilla (int): Semilla de la partida.
+        distribucion (dict, optional): Distribucion de cartas por serie del mazo.
+        timer (int, optional): Duracion de la partida en milisegundos.
+
+    Returns:
+        EstadoCombate: Estado de combate, con la semilla en estado.semilla.
+    """
+    semilla &= MASCARA_SEMILLA
+    rng = random.Random(semilla)
+
+    mazo_player = cartas.generate_random_deck(por_serie, distribucion, rng)
+    mazo_rival = cartas.generate_random_deck(por_serie, distribucion, rng)
+    rng.shuffle(mazo_player)
+    rng.shuffle(mazo_rival)
+
+    estado = crear_estado(mazo_player, mazo_rival, timer)
+    estado.semilla = semilla
+    return estado
+
+
+def nueva_semilla() -> int:
+    """Devuelve una semilla al azar para una partida nueva (entra en 63 bits).
+
+    Returns:
+        int: Semilla.
+    """
+    return random.SystemRandom().randrange(2 ** 63)
+
+
+def consumir_eventos(estado: EstadoCombate) -> list:
+    """Devuelve los eventos pendientes y vacia la cola.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+
+    Returns:
+        list: Lista de tuplas (tipo, valor).
+    """
+    eventos = estado.eventos
+    estado.eventos = []
+    return eventos
+
+
+def robar_carta(estado: EstadoCombate, player: bool = True) -> None:
+    """Roba la siguiente carta del mazo para el jugador (y luego para el rival).
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+        player (bool, optional): True para jugador, False para rival. Defaults to True.
+    """
+    if player:
+        idx = estado.mazo_index_player
+        if idx >= len(estado.mazo_player):
+            estado.carta_player_actual = None
+            return
+        estado.carta_player_actual = estado.mazo_player[idx]
+        estado.mazo_index_player = idx + 1
+        robar_carta(estado, player=False)
+        return
+
+    idx = estado.mazo_index_rival
+    if idx >= len(estado.mazo_rival):
+        estado.carta_rival_actual = None
+        return
+    estado.carta_rival_actual = estado.mazo_rival[idx]
+    estado.mazo_index_rival = idx + 1
+
+
+def actualizar_timer(estado: EstadoCombate, dt: int) -> None:
+    """Descuenta dt milisegundos del timer de la partida.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+        dt (int): Milisegundos transcurridos.
+    """
+    estado.timer_actual -= dt
+    if estado.timer_actual < 0:
+        estado.timer_actual = 0
+
+
+def agregar_puntaje(estado: EstadoCombate, puntos: int) -> None:
+    """Suma puntos al puntaje actual.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+        puntos (int): Puntos a agregar.
+    """
+    estado.puntaje += puntos
+
+
+def resolver_mano(estado: EstadoCombate) -> None:
+    """Resuelve una ronda de combate entre jugador y rival y aplica daños.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+    """
+    carta_p = estado.carta_player_actual
+    carta_r = estado.carta_rival_actual
+
+    #añadir turno
+    if carta_p and carta_r:
+        estado.turno_actual += 1
+
+    #si no hay carta
+    if carta_p is None or carta_r is None:
+        return
+
+    # Valores calculados al cargar las cartas (cartas.crear_carta)
+    atk_p = carta_p.ataque_total
+    atk_r = carta_r.ataque_total
+
+    #empate
+    if atk_p == atk_r:
+        return
+
+    # Jugador pierde
+    if atk_p < atk_r:
+        #Shield
+        if estado.shield_activo:
+            daño_reflejado = max(1, carta_r.daño - estado.def_rival)
+            estado.hp_rival = max(0, estado.hp_rival - daño_reflejado)
+            estado.shield_activo = False
+            estado.eventos.append(("sfx", var.SHIELD_BROKEN_SFX))
+            agregar_puntaje(estado, 500)
+            return
+
+        #no shield
+        daño = max(1, carta_p.daño - estado.def_player)
+        estado.hp_player = max(0, estado.hp_player - daño)
+        estado.eventos.append(("sfx", var.HIT_SFX))
+
+        if not estado.music_danger_on and estado.hp_player < estado.hp_inicial_player * 0.5:
+            estado.eventos.append(("sfx", var.DANGER_SFX))
+            estado.eventos.append(("musica", var.MUSICA_LASTSTAND))
+            estado.music_danger_on = True
+            agregar_puntaje(estado, 500)
+        return
+
+    # Rival pierde
+    daño = max(1, carta_r.daño - estado.def_rival)
+    estado.hp_rival = max(0, estado.hp_rival - daño)
+    estado.eventos.append(("sfx", var.WIN_SFX))
+    agregar_puntaje(estado, 100)
+
+
+def check_fin_partida(estado: EstadoCombate) -> bool:
+    """Verifica si la partida ha terminado por tiempo, HP o cartas.
+
+    Una partida ya terminada no se vuelve a cerrar.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+
+    Returns:
+        bool: True si la partida termino, False en caso contrario.
+    """
+    if estado.terminada:
+        return True
+
+    hp_p = estado.hp_player
+    hp_r = estado.hp_rival
+
+    if estado.timer_actual <= 0:
+        if hp_p < hp_r:
+            terminar_partida(estado, ganador="rival")
+        elif hp_r < hp_p:
+            terminar_partida(estado, ganador="player")
+            agregar_puntaje(estado, 1000)
+        else:
+            terminar_partida(estado, ganador="empate")
+            agregar_puntaje(estado, 500)
+        return True
+
+    if hp_p <= 0:
+        terminar_partida(estado, ganador="rival")
+        return True
+
+    if hp_r <= 0:
+        terminar_partida(estado, ganador="player")
+        agregar_puntaje(estado, 1000)
+        return True
+
+    if estado.mazo_index_player >= len(estado.mazo_player):
+        if hp_p < hp_r:
+            terminar_partida(estado, ganador="rival")
+        else:
+            terminar_partida(estado, ganador="player")
+            agregar_puntaje(estado, 1000)
+        return True
+
+    return False
+
+
+def terminar_partida(estado: EstadoCombate, ganador: str) -> bool:
+    """Finaliza la partida, suma los puntos de cierre y encola el sfx y el fin.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+        ganador (str): "player", "rival" o "empate".
+
+    Returns:
+        bool: Siempre True.
+    """
+    if ganador == "player":
+        #puntos por victoria
+        max_turnos = 40
+        bonus = max(0, (max_turnos - estado.turno_actual) * 100)
+        agregar_puntaje(estado, 1500 + bonus)
+        estado.eventos.append(("sfx", var.WIN_SFX))
+    else:
+        estado.victoria = False
+        if ganador == "rival":
+            estado.eventos.append(("sfx", var.HIT_SFX))
+        else:
+            estado.eventos.append(("sfx", var.SHIELD_BROKEN_SFX))
+
+    estado.terminada = True
+    estado.ganador = ganador
+    estado.eventos.append(("fin", ganador))
+    return True
+
+
+def activar_heal(estado: EstadoCombate) -> None:
+    """Activa el comodín de curación del jugador.
+
+    Suma un 25% de la vida inicial, sin superar la vida máxima.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+    """
+    if estado.heal_usado:
+        return
+
+    # Calcula nueva vida, sin superar la vida inicial
+    nueva_hp = estado.hp_player + estado.hp_inicial_player * 0.25
+    estado.hp_player = min(nueva_hp, estado.hp_inicial_player)
+
+    estado.heal_usado = True
+    estado.eventos.append(("sfx", var.HEAL_SFX))
+
+
+def activar_shield(estado: EstadoCombate) -> None:
+    """Activa el comodín de shield del jugador.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+    """
+    if estado.shield_usado:
+        return
+
+    estado.shield_activo = True
+    estado.shield_usado = True
+    estado.eventos.append(("sfx", var.SHIELD_SFX))
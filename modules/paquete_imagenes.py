@@ -0,0 +1,198 @@
+import os
+import mmap
+import json
+import struct
+import argparse
+import pygame as pg
+import modules.variables as var
+import modules.compilar_assets as build
+
+# Paquete de imagenes de cartas: los frentes y reversos ya decodificados y
+# escalados al tamaño en que se dibujan, como pixeles BGRA crudos en un solo
+# archivo. En el juego el archivo se mapea con mmap y cada superficie se arma
+# con pg.image.frombuffer sobre ese mapa, sin abrir ni decodificar PNGs.
+# BGRA es el orden de bytes que deja convert_alpha() en pantallas de 32 bits,
+# asi que las superficies se dibujan rapido sin convertirlas (sin copiar).
+#   python -m modules.paquete_imagenes            -> genera el paquete
+#
+# Formato (little endian):
+#   cabecera  "IPAK", version u16, entradas u32, bytes de textos u32
+#   tabla     ruta u32 (indice de texto), ancho u16, alto u16, offset u64   (una por imagen)
+#   textos    rutas utf-8 separadas por "\n"
+#   pixeles   ancho * alto * 4 bytes BGRA por imagen, cada bloque alineado a 16 bytes
+
+MAGIA = b"IPAK"
+VERSION = 2
+_CABECERA = struct.Struct("<4sHII")
+_ENTRADA = struct.Struct("<IHHQ")
+_ALINEACION = 16
+# Orden de los pixeles en el paquete
+FORMATO = "BGRA"
+
+
+def ruta_paquete() -> str:
+    """Devuelve la ruta del paquete dentro del cache versionado de assets.
+
+    Returns:
+        str: Ruta, por ejemplo "assets/cache/v2/cartas.pak".
+    """
+    return os.path.join(build.directorio_version(), "cartas.pak")
+
+
+def _alinear(n: int) -> int:
+    """Redondea n hacia arriba al multiplo de _ALINEACION."""
+    return (n + _ALINEACION - 1) // _ALINEACION * _ALINEACION
+
+
+def generar(json_path: str = var.JSON_CARDS, salida: str = None) -> dict:
+    """Genera el paquete con todas las imagenes de cartas ya escaladas.
+
+    Usa los mismos tamaños que compilar_assets (frentes y reversos). Necesita
+    un display activo para convert_alpha. Las rutas que no existen en disco
+    se informan y quedan fuera del paquete.
+
+    Args:
+        json_path (str, optional): Ruta del JSON de cartas.
+        salida (str, optional): Ruta del paquete. Por defecto ruta_paquete().
+
+    Returns:
+        dict: {"salida", "imagenes", "bytes", "faltantes"}
+    """
+    if salida is None:
+        salida = ruta_paquete()
+
+    with open(json_path, "r", encoding="utf-8") as file:
+        cards = json.load(file)
+
+    imagenes = []
+    faltantes = []
+    for path, size in build.listar_imagenes(cards):
+        if os.path.exists(path):
+            imagenes.append((path, size))
+        else:
+            faltantes.append(path)
+
+    blob = "\n".join(path for path, _ in imagenes).encode("utf-8")
+    offset = _alinear(_CABECERA.size + _ENTRADA.size * len(imagenes) + len(blob))
+
+    tabla = bytearray()
+    for i, (path, (ancho, alto)) in enumerate(imagenes):
+        tabla += _ENTRADA.pack(i, ancho, alto, offset)
+        offset = _alinear(offset + ancho * alto * 4)
+
+    os.makedirs(os.path.dirname(salida) or ".", exist_ok=True)
+    temporal = salida + ".tmp"
+    with open(temporal, "wb") as file:
+        file.write(_CABECERA.pack(MAGIA, VERSION, len(imagenes), len(blob)))
+        file.write(tabla)
+        file.write(blob)
+        for path, size in imagenes:
+            file.write(b"\0" * (_alinear(file.tell()) - file.tell()))
+            surf = pg.transform.scale(pg.image.load(path).convert_alpha(), size)
+            file.write(pg.image.tobytes(surf, FORMATO))
+        tamaño = file.tell()
+    os.replace(temporal, salida)
+
+    return {"salida": salida, "imagenes": len(imagenes), "bytes": tamaño, "faltantes": faltantes}
+
+
+def abrir(path: str = None):
+    """Mapea el paquete en memoria y lee su tabla de imagenes.
+
+    El mapa queda abierto mientras exista el paquete devuelto: las superficies
+    creadas con superficie() apuntan directamente a sus bytes.
+
+    Args:
+        path (str, optional): Ruta del paquete. Por defecto ruta_paquete().
+
+    Returns:
+        dict|None: {"mapa", "vista", "tabla": {(ruta, (ancho, alto)): (offset, largo)}},
+        o None si no hay paquete o es de otra version.
+    """
+    if path is None:
+        path = ruta_paquete()
+
+    try:
+        with open(path, "rb") as file:
+            mapa = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapa) < _CABECERA.size:
+        mapa.close()
+        return None
+    magia, version, cantidad, largo_textos = _CABECERA.unpack_from(mapa, 0)
+    if magia != MAGIA or version != VERSION:
+        mapa.close()
+        return None
+
+    inicio_textos = _CABECERA.size + cantidad * _ENTRADA.size
+    rutas = mapa[inicio_textos:inicio_textos + largo_textos].decode("utf-8").split("\n")
+
+    tabla = {}
+    for ruta, ancho, alto, offset in _ENTRADA.iter_unpack(mapa[_CABECERA.size:inicio_textos]):
+        tabla[(rutas[ruta], (ancho, alto))] = (offset, ancho * alto * 4)
+
+    return {"mapa": mapa, "vista": memoryview(mapa), "tabla": tabla}
+
+
+def superficie(paquete: dict, path: str, size: tuple):
+    """Arma una superficie con alpha que lee sus pixeles directamente del paquete.
+
+    Args:
+        paquete (dict): Paquete abierto con abrir().
+        path (str): Ruta original de la imagen.
+        size (tuple): Tamaño (ancho, alto) pedido.
+
+    Returns:
+        pg.Surface|None: Superficie sin copiar los pixeles, o None si la imagen
+        no esta en el paquete con ese tamaño.
+    """
+    entrada = paquete["tabla"].get((path, tuple(size)))
+    if entrada is None:
+        return None
+    offset, largo = entrada
+    return pg.image.frombuffer(paquete["vista"][offset:offset + largo], tuple(size), FORMATO)
+
+
+def cerrar(paquete: dict) -> bool:
+    """Libera el mapa y el archivo del paquete.
+
+    Si todavia hay superficies vivas que apuntan al mapa no se puede cerrar
+    ahora: queda abierto hasta que se liberen (lo cierra el recolector).
+
+    Args:
+        paquete (dict): Paquete abierto con abrir().
+
+    Returns:
+        bool: True si se cerro, False si quedaron superficies usandolo.
+    """
+    try:
+        paquete["vista"].release()
+        paquete["mapa"].close()
+    except BufferError:
+        return False
+    return True
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.paquete_imagenes [cartas.json]"""
+    parser = argparse.ArgumentParser(description="Genera el paquete de imagenes de cartas")
+    parser.add_argument("json", nargs="?", default=var.JSON_CARDS, help="JSON de cartas")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+
+    resumen = generar(args.json)
+
+    print(f"Paquete: {resumen['salida']}")
+    print(f"Imagenes: {resumen['imagenes']}  Bytes: {resumen['bytes']}")
+    print(f"Faltantes: {len(resumen['faltantes'])}")
+    for path in resumen["faltantes"]:
+        print(f"  {path}")
+
+
+if __name__ == "__main__":
+    main()
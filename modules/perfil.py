@@ -0,0 +1,268 @@
+import os
+import csv
+import json
+import time
+from collections import deque
+import pygame as pg
+import modules.variables as var
+import modules.auxiliar as aux
+import modules.imagenes as img
+import modules.fuentes as fuentes
+from modules.estadisticas import percentil
+
+# Perfilador de frames: mide cuanto tarda cada etapa del loop principal
+# (eventos, update, draw y flip) separado por form, y guarda las ultimas
+# var.PERFIL_MUESTRAS mediciones de cada una.
+#   F3 -> muestra u oculta el overlay (fps, p50/p99 del frame, caches)
+#   F4 -> exporta los histogramas a var.PERFIL_ARCHIVO (.json o .csv)
+# Con var.PERFIL_EXPORTAR_AL_SALIR tambien se exportan al cerrar el juego.
+
+ETAPAS = ("eventos", "update", "draw", "flip", "frame")
+
+# Limites superiores (ms) de los buckets del histograma; el ultimo es abierto
+BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66, 100)
+
+TECLA_OVERLAY = pg.K_F3
+TECLA_EXPORTAR = pg.K_F4
+
+
+def crear() -> dict:
+    """Crea el estado del perfilador (va en ctx["perfil"]).
+
+    Returns:
+        dict: Estado del perfilador.
+    """
+    return {
+        "muestras": {},
+        "form": None,
+        "inicio": 0.0,
+        "marca": 0.0,
+        "overlay": False,
+        "overlay_lineas": [],
+        "overlay_refresco": 0,
+        "font": None,
+    }
+
+
+def _muestras(perfil: dict, form: str, etapa: str) -> deque:
+    """Devuelve la ventana de muestras de una etapa de un form, creandola si falta.
+
+    Args:
+        perfil (dict): Estado del perfilador.
+        form (str): Nombre del form.
+        etapa (str): Nombre de la etapa.
+
+    Returns:
+        deque: Ultimas mediciones en milisegundos.
+    """
+    por_form = perfil["muestras"].setdefault(form, {})
+    ventana = por_form.get(etapa)
+    if ventana is None:
+        ventana = por_form[etapa] = deque(maxlen=var.PERFIL_MUESTRAS)
+    return ventana
+
+
+def iniciar_frame(ctx: dict) -> None:
+    """Marca el comienzo del trabajo del frame (despues de esperar eventos).
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    perfil = ctx["perfil"]
+    perfil["form"] = ctx["form"]
+    perfil["inicio"] = perfil["marca"] = time.perf_counter()
+
+
+def marcar(ctx: dict, etapa: str) -> None:
+    """Registra el tiempo desde la marca anterior como duracion de la etapa.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+        etapa (str): "eventos", "update", "draw" o "flip".
+    """
+    perfil = ctx["perfil"]
+    ahora = time.perf_counter()
+    _muestras(perfil, perfil["form"], etapa).append((ahora - perfil["marca"]) * 1000)
+    perfil["marca"] = ahora
+
+
+def cerrar_frame(ctx: dict) -> None:
+    """Registra la duracion total del frame (sin contar la espera del FPS).
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    perfil = ctx["perfil"]
+    _muestras(perfil, perfil["form"], "frame").append((time.perf_counter() - perfil["inicio"]) * 1000)
+
+
+def resumir(ventana) -> dict:
+    """Calcula estadisticas e histograma de una ventana de muestras.
+
+    Args:
+        ventana (iterable): Mediciones en milisegundos.
+
+    Returns:
+        dict: {"n", "media", "p50", "p90", "p99", "max", "histograma"}, donde
+        histograma tiene una cuenta por bucket de BUCKETS_MS mas uno abierto.
+    """
+    valores = sorted(ventana)
+    histograma = [0] * (len(BUCKETS_MS) + 1)
+    i = 0
+    for v in valores:
+        while i < len(BUCKETS_MS) and v > BUCKETS_MS[i]:
+            i += 1
+        histograma[i] += 1
+
+    return {
+        "n": len(valores),
+        "media": sum(valores) / len(valores) if valores else 0.0,
+        "p50": percentil(valores, 50),
+        "p90": percentil(valores, 90),
+        "p99": percentil(valores, 99),
+        "max": valores[-1] if valores else 0.0,
+        "histograma": histograma,
+    }
+
+
+def nombres_buckets() -> list:
+    """Devuelve las etiquetas de los buckets del histograma ("<=1ms", ..., ">100ms").
+
+    Returns:
+        list: Lista de etiquetas.
+    """
+    return [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+
+
+def resumen(ctx: dict) -> dict:
+    """Resume todas las etapas de todos los forms medidos.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+
+    Returns:
+        dict: {form: {etapa: resumen}}
+    """
+    return {
+        form: {etapa: resumir(ventana) for etapa, ventana in etapas.items()}
+        for form, etapas in ctx["perfil"]["muestras"].items()
+    }
+
+
+def exportar(ctx: dict, path: str = None) -> str:
+    """Exporta los histogramas a JSON o CSV segun la extension del archivo.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+        path (str, optional): Ruta del archivo. Por defecto var.PERFIL_ARCHIVO.
+
+    Returns:
+        str: Ruta del archivo escrito.
+    """
+    if path is None:
+        path = var.PERFIL_ARCHIVO
+    datos = resumen(ctx)
+    buckets = nombres_buckets()
+
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["form", "etapa", "n", "media_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms"] + buckets)
+            for form, etapas in datos.items():
+                for etapa, r in etapas.items():
+                    writer.writerow(
+                        [form, etapa, r["n"]]
+                        + [round(r[k], 3) for k in ("media", "p50", "p90", "p99", "max")]
+                        + r["histograma"]
+                    )
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({
+                "muestras_por_etapa": var.PERFIL_MUESTRAS,
+                "buckets": buckets,
+                "forms": datos,
+            }, file, indent=2)
+
+    return path
+
+
+def handle_event(ctx: dict, event: pg.event.Event) -> None:
+    """Atiende las teclas del perfilador (F3 overlay, F4 exportar).
+
+    Args:
+        ctx (dict): Contexto general del juego.
+        event (pg.event.Event): Evento de pygame.
+    """
+    if event.type != pg.KEYDOWN:
+        return
+
+    perfil = ctx["perfil"]
+    if event.key == TECLA_OVERLAY:
+        perfil["overlay"] = not perfil["overlay"]
+        perfil["overlay_refresco"] = 0
+        # Al ocultarlo hay que borrar el recuadro
+        aux.invalidar_pantalla(ctx)
+    elif event.key == TECLA_EXPORTAR:
+        try:
+            print(f"Perfil exportado en {exportar(ctx)}")
+        except OSError as e:
+            print(f"No se pudo exportar el perfil: {e}")
+
+
+def _lineas_overlay(ctx: dict) -> list:
+    """Arma los textos del overlay con las mediciones del form actual.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+
+    Returns:
+        list: Lineas de texto.
+    """
+    etapas = ctx["perfil"]["muestras"].get(ctx["form"], {})
+    frame = resumir(etapas.get("frame", ()))
+    lineas = [
+        f"FPS: {ctx['clock'].get_fps():.0f}   ({ctx['form']})",
+        f"frame p50 {frame['p50']:.1f} / p99 {frame['p99']:.1f} ms",
+    ]
+    for etapa in ("eventos", "update", "draw", "flip"):
+        r = resumir(etapas.get(etapa, ()))
+        lineas.append(f"{etapa}: {r['p50']:.1f} / {r['p99']:.1f} ms")
+    lineas.append(f"cache img: {img.get_stats()['hit_rate']:.0%}")
+    lineas.append(f"cache texto: {aux.get_text_cache_stats()['hit_rate']:.0%}")
+    return lineas
+
+
+def dibujar_overlay(ctx: dict) -> None:
+    """Dibuja el overlay del perfilador en la esquina superior derecha, si esta activo.
+
+    Los textos se recalculan cada var.PERFIL_REFRESCO_MS y se renderizan sin
+    pasar por el cache de textos para no alterar sus estadisticas.
+
+    Args:
+        ctx (dict): Contexto general del juego.
+    """
+    perfil = ctx["perfil"]
+    if not perfil["overlay"]:
+        return
+
+    if perfil["font"] is None:
+        perfil["font"] = fuentes.obtener(var.ALT_FONT_PATH, var.PERFIL_FUENTE)
+
+    ahora = pg.time.get_ticks()
+    if ahora >= perfil["overlay_refresco"]:
+        perfil["overlay_lineas"] = [
+            perfil["font"].render(linea, True, var.COLORS["white"]) for linea in _lineas_overlay(ctx)
+        ]
+        perfil["overlay_refresco"] = ahora + var.PERFIL_REFRESCO_MS
+
+    screen = ctx["screen"]
+    alto_linea = perfil["font"].get_linesize()
+    rect = pg.Rect(0, 10, 250, alto_linea * len(perfil["overlay_lineas"]) + 10)
+    rect.right = screen.get_width() - 10
+
+    pg.draw.rect(screen, var.COLORS["bg"], rect)
+    y = rect.y + 5
+    for surf in perfil["overlay_lineas"]:
+        screen.blit(surf, (rect.x + 5, y))
+        y += alto_linea
+    aux.marcar_region(ctx, rect)
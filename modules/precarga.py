@@ -0,0 +1,171 @@
+import io
+import queue
+import threading
+import pygame as pg
+import modules.variables as var
+import modules.imagenes as img
+import modules.atlas as atlas
+
+# Precarga de assets en un hilo aparte. El hilo solo lee y decodifica
+# (imagenes escaladas, hojas de atlas y bytes de musica); la conversion al
+# formato de pantalla queda en el hilo principal. Las fuentes las maneja
+# modules.fuentes.
+
+# Assets que usa cada form al iniciar
+ASSETS_POR_FORM = {
+    "menu": {
+        "imagenes": [(var.FONDO_MENU, var.ASPECT_RATIO)],
+        "musica": [var.MUSICA_MENU],
+    },
+    "juego": {
+        "imagenes": [(var.FONDO_STAGE, var.ASPECT_RATIO)],
+        "musica": [var.MUSICA_STAGE, var.MUSICA_LASTSTAND],
+        "atlas": ["combate"],
+    },
+    "score": {
+        "imagenes": [(var.FONDO_SCORE, var.ASPECT_RATIO)],
+        "musica": [var.MUSICA_RANKING],
+    },
+    "options": {
+        "imagenes": [(var.FONDO_OPTIONS, var.ASPECT_RATIO)],
+        "musica": [var.MUSICA_OPTIONS],
+    },
+    "results": {
+        "imagenes": [(var.FONDO_VICTORIA, var.ASPECT_RATIO), (var.FONDO_DERROTA, var.ASPECT_RATIO)],
+        "musica": [var.MUSICA_RESULTS],
+    },
+}
+
+# Forms a los que probablemente se pasa desde cada form
+SIGUIENTES = {
+    "menu": ["juego", "score", "options"],
+    "juego": ["results"],
+    "results": ["menu"],
+    "score": ["menu"],
+    "options": ["menu"],
+}
+
+# Atlas que se pueden armar en el hilo (sin convertir las hojas)
+ATLAS = {
+    "combate": lambda: atlas.armar_atlas_combate(convertir=False),
+}
+
+_cola = queue.Queue()
+_hilo = None
+# Bytes de musica ya leidos y todavia sin usar: ruta -> bytes
+_archivos = {}
+# Tareas encoladas que todavia no terminaron, para no repetir trabajo. Al
+# terminar salen del conjunto: una imagen que despues sale del cache LRU o
+# una musica ya usada se puede volver a precargar.
+_pedidos = set()
+_progreso = {"encoladas": 0, "completadas": 0}
+_lock = threading.Lock()
+
+
+def _trabajar() -> None:
+    """Loop del hilo de precarga: procesa tareas de la cola para siempre."""
+    while True:
+        tipo, path, size = _cola.get()
+        try:
+            if tipo == "imagen":
+                # Si el hilo principal ya la cargo no se decodifica de nuevo
+                if not img.cargada(path, size):
+                    img.registrar_decodificada(path, size, img.decodificar(path, size))
+            elif tipo == "atlas":
+                ATLAS[path]()
+            elif path not in _archivos:
+                with open(path, "rb") as file:
+                    _archivos[path] = file.read()
+        except (OSError, pg.error) as e:
+            print(f"No se pudo precargar {path}: {e}")
+        finally:
+            with _lock:
+                _pedidos.discard((tipo, path, size))
+                _progreso["completadas"] += 1
+            _cola.task_done()
+
+
+def _encolar(tipo: str, path: str, size: tuple = None) -> None:
+    """Agrega una tarea a la cola si no hay una igual pendiente.
+
+    Args:
+        tipo (str): "imagen", "atlas" o "musica".
+        path (str): Ruta del archivo (o nombre del atlas).
+        size (tuple, optional): Tamaño para imagenes.
+    """
+    global _hilo
+    clave = (tipo, path, size)
+
+    if _hilo is None:
+        _hilo = threading.Thread(target=_trabajar, name="precarga", daemon=True)
+        _hilo.start()
+
+    with _lock:
+        if clave in _pedidos:
+            return
+        _pedidos.add(clave)
+        if _progreso["completadas"] == _progreso["encoladas"]:
+            # Empieza una tanda nueva: la barra arranca de cero
+            _progreso["encoladas"] = 0
+            _progreso["completadas"] = 0
+        _progreso["encoladas"] += 1
+    _cola.put(clave)
+
+
+def precargar_form(nombre: str) -> None:
+    """Encola la carga de las imagenes, atlas y musica de un form.
+
+    Lo que ya esta en el cache de imagenes o en memoria no se encola.
+
+    Args:
+        nombre (str): Nombre del form ("menu", "juego", "score", ...).
+    """
+    assets = ASSETS_POR_FORM.get(nombre, {})
+    for path, size in assets.get("imagenes", []):
+        if not img.cargada(path, size):
+            _encolar("imagen", path, size)
+    for nombre_atlas in assets.get("atlas", []):
+        _encolar("atlas", nombre_atlas)
+    for path in assets.get("musica", []):
+        if path not in _archivos:
+            _encolar("musica", path)
+
+
+def precargar_siguientes(nombre: str) -> None:
+    """Encola los assets de los forms a los que probablemente se pase desde este.
+
+    Args:
+        nombre (str): Nombre del form actual.
+    """
+    for siguiente in SIGUIENTES.get(nombre, []):
+        precargar_form(siguiente)
+
+
+def progreso() -> float:
+    """Devuelve el avance de la tanda de precarga actual.
+
+    Returns:
+        float: Valor de 0.0 a 1.0 (1.0 si no hay nada pendiente).
+    """
+    with _lock:
+        if _progreso["encoladas"] == 0:
+            return 1.0
+        return _progreso["completadas"] / _progreso["encoladas"]
+
+
+def musica(path: str):
+    """Devuelve la musica precargada como archivo en memoria, o la ruta si no esta lista.
+
+    Los bytes precargados se entregan una sola vez: el modulo deja de
+    guardarlos y quedan vivos solo mientras el mixer use el archivo devuelto.
+
+    Args:
+        path (str): Ruta del archivo de musica.
+
+    Returns:
+        io.BytesIO|str: Objeto para pasar a pg.mixer.music.load.
+    """
+    datos = _archivos.pop(path, None)
+    if datos is None:
+        return path
+    return io.BytesIO(datos)
@@ -0,0 +1,154 @@
+import modules.variables as var
+import modules.ranking as ranking
+import modules.puntajes_sqlite as db
+
+# Punto de entrada unico para guardar y consultar puntajes. Cada backend es un
+# diccionario de funciones; el que se usa se elige con var.SCORE_BACKEND.
+#   "iniciar"  -> ()              prepara el almacenamiento (se llama una vez)
+#   "guardar"  -> (filas)         guarda una lista de tuplas (nombre, puntaje)
+#   "top"      -> (cantidad)      devuelve los mejores puntajes, de mayor a menor
+#   "pagina"   -> (cursor, cantidad, prefijo)
+#                 devuelve (filas, cursor_siguiente); el cursor es opaco,
+#                 None pide la primera pagina y None de vuelta indica el final
+
+
+def _iniciar_csv() -> None:
+    """El CSV no necesita preparacion: el indice se arma al consultarlo."""
+
+
+def _guardar_csv(filas: list) -> None:
+    """Agrega puntajes al CSV de ranking.
+
+    Args:
+        filas (list): Tuplas (nombre, puntaje).
+    """
+    ranking.agregar_filas(var.RANKING_CSV, filas)
+
+
+def _top_csv(cantidad: int) -> list:
+    """Devuelve los mejores puntajes del CSV de ranking.
+
+    Args:
+        cantidad (int): Cantidad de puntajes.
+
+    Returns:
+        list: Lista de tuplas (nombre, puntaje).
+    """
+    return ranking.leer_top(var.RANKING_CSV, cantidad)
+
+
+def _pagina_csv(cursor, cantidad: int, prefijo: str) -> tuple:
+    """Devuelve una pagina del CSV de ranking. El cursor es la cantidad de filas ya vistas.
+
+    Args:
+        cursor (int|None): Filas a saltear, o None para la primera pagina.
+        cantidad (int): Cantidad de filas de la pagina.
+        prefijo (str): Prefijo del nombre.
+
+    Returns:
+        tuple: (filas, cursor_siguiente).
+    """
+    inicio = cursor or 0
+    filas = ranking.leer_pagina(var.RANKING_CSV, inicio, cantidad + 1, prefijo)
+
+    if len(filas) > cantidad:
+        return (filas[:cantidad], inicio + cantidad)
+    return (filas, None)
+
+
+def _iniciar_sqlite() -> None:
+    """Crea la base si no existe y le pasa los puntajes del CSV la primera vez (si var.SCORE_MIGRAR_CSV)."""
+    if var.SCORE_MIGRAR_CSV:
+        db.migrar_csv(var.RANKING_CSV, var.RANKING_DB)
+    else:
+        db.conectar(var.RANKING_DB)
+
+
+BACKENDS = {
+    "csv": {
+        "iniciar": _iniciar_csv,
+        "guardar": _guardar_csv,
+        "top": _top_csv,
+        "pagina": _pagina_csv,
+    },
+    "sqlite": {
+        "iniciar": _iniciar_sqlite,
+        "guardar": lambda filas: db.guardar_puntajes(filas, var.RANKING_DB),
+        "top": lambda cantidad: db.leer_top(cantidad, var.RANKING_DB),
+        "pagina": lambda cursor, cantidad, prefijo: db.leer_pagina(cursor, cantidad, prefijo, var.RANKING_DB),
+    },
+}
+
+# Backends ya iniciados en este proceso
+_iniciados = set()
+
+
+def obtener_backend(nombre: str = None) -> dict:
+    """Devuelve el backend de puntajes, iniciandolo la primera vez.
+
+    Args:
+        nombre (str, optional): Nombre del backend. Por defecto var.SCORE_BACKEND.
+
+    Raises:
+        ValueError: Si no existe un backend con ese nombre.
+
+    Returns:
+        dict: Diccionario de funciones del backend.
+    """
+    if nombre is None:
+        nombre = var.SCORE_BACKEND
+
+    backend = BACKENDS.get(nombre)
+    if backend is None:
+        raise ValueError(f"Backend de puntajes desconocido: {nombre}")
+
+    if nombre not in _iniciados:
+        backend["iniciar"]()
+        _iniciados.add(nombre)
+    return backend
+
+
+def guardar_puntaje(nombre: str, puntaje: int) -> None:
+    """Guarda un puntaje en el backend configurado.
+
+    Args:
+        nombre (str): Nombre del jugador.
+        puntaje (int): Puntaje obtenido.
+    """
+    obtener_backend()["guardar"]([(nombre, puntaje)])
+
+
+def guardar_puntajes(filas: list) -> None:
+    """Guarda varios puntajes de una vez en el backend configurado.
+
+    Args:
+        filas (list): Tuplas (nombre, puntaje).
+    """
+    obtener_backend()["guardar"](filas)
+
+
+def leer_top(cantidad: int = var.RANKING_TOP_K) -> list:
+    """Devuelve los mejores puntajes del backend configurado.
+
+    Args:
+        cantidad (int, optional): Cantidad de puntajes.
+
+    Returns:
+        list: Lista de tuplas (nombre, puntaje), de mayor a menor.
+    """
+    return obtener_backend()["top"](cantidad)
+
+
+def leer_pagina(cursor, cantidad: int, prefijo: str = "") -> tuple:
+    """Devuelve una pagina del ranking del backend configurado.
+
+    Args:
+        cursor: Cursor devuelto por la pagina anterior, o None para la primera.
+        cantidad (int): Cantidad de filas de la pagina.
+        prefijo (str, optional): Prefijo del nombre para filtrar.
+
+    Returns:
+        tuple: (filas, cursor_siguiente) con filas como tuplas (nombre, puntaje)
+        y cursor_siguiente en None si no hay mas paginas.
+    """
+    return obtener_backend()["pagina"](cursor, cantidad, prefijo)
@@ -0,0 +1,259 @@
+import argparse
+import itertools
+import sqlite3
+import threading
+import modules.variables as var
+import modules.ranking as ranking
+
+# Backend de puntajes sobre SQLite. Cada hilo tiene su propia conexion por
+# archivo; las consultas son siempre las mismas cadenas SQL, asi que sqlite3
+# las compila una vez y las reutiliza desde su cache de sentencias.
+# Las escrituras van en transacciones BEGIN IMMEDIATE de hasta SCORE_BATCH
+# filas, lo que serializa a los escritores sin bloquear a los lectores (WAL).
+
+SQL_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS puntajes (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    puntaje INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_puntajes_puntaje ON puntajes (puntaje DESC, id);
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+SQL_INSERTAR = "INSERT INTO puntajes (nombre, puntaje) VALUES (?, ?)"
+SQL_TOP = "SELECT nombre, puntaje FROM puntajes ORDER BY puntaje DESC, id LIMIT ?"
+# Paginas por cursor (puntaje, id) de la ultima fila: cada pagina arranca
+# donde termino la anterior recorriendo el indice, sin OFFSET.
+SQL_PAGINA_INICIO = (
+    "SELECT id, nombre, puntaje FROM puntajes WHERE nombre LIKE ? ESCAPE '\\' "
+    "ORDER BY puntaje DESC, id LIMIT ?"
+)
+SQL_PAGINA = (
+    "SELECT id, nombre, puntaje FROM puntajes "
+    "WHERE puntaje <= ? AND (puntaje < ? OR id > ?) AND nombre LIKE ? ESCAPE '\\' "
+    "ORDER BY puntaje DESC, id LIMIT ?"
+)
+SQL_CONTAR = "SELECT COUNT(*) FROM puntajes"
+SQL_LEER_META = "SELECT valor FROM meta WHERE clave = ?"
+SQL_GUARDAR_META = "INSERT OR REPLACE INTO meta (clave, valor) VALUES (?, ?)"
+
+# Milisegundos que espera un escritor si otro proceso tiene la base bloqueada
+ESPERA_BLOQUEO_MS = 5000
+
+_local = threading.local()
+
+
+def conectar(path: str = var.RANKING_DB) -> sqlite3.Connection:
+    """Devuelve la conexion del hilo actual a la base, creandola si hace falta.
+
+    Args:
+        path (str, optional): Ruta de la base.
+
+    Returns:
+        sqlite3.Connection: Conexion en modo autocommit (las transacciones
+        se abren a mano).
+    """
+    conexiones = getattr(_local, "conexiones", None)
+    if conexiones is None:
+        conexiones = _local.conexiones = {}
+
+    con = conexiones.get(path)
+    if con is None:
+        con = sqlite3.connect(path, timeout=ESPERA_BLOQUEO_MS / 1000, isolation_level=None)
+        con.execute(f"PRAGMA busy_timeout = {ESPERA_BLOQUEO_MS}")
+        con.execute(f"PRAGMA journal_mode = {var.SCORE_JOURNAL}")
+        con.execute("PRAGMA synchronous = NORMAL")
+        con.executescript(SQL_ESQUEMA)
+        conexiones[path] = con
+    return con
+
+
+def cerrar(path: str = var.RANKING_DB) -> None:
+    """Cierra la conexion del hilo actual a la base, si existe.
+
+    Args:
+        path (str, optional): Ruta de la base.
+    """
+    conexiones = getattr(_local, "conexiones", {})
+    con = conexiones.pop(path, None)
+    if con is not None:
+        con.close()
+
+
+def cerrar_todas() -> None:
+    """Cierra todas las conexiones del hilo actual."""
+    conexiones = getattr(_local, "conexiones", {})
+    for con in conexiones.values():
+        con.close()
+    conexiones.clear()
+
+
+def _insertar(con: sqlite3.Connection, filas) -> int:
+    """Inserta filas en lotes de SCORE_BATCH dentro de la transaccion abierta.
+
+    Args:
+        con (sqlite3.Connection): Conexion con una transaccion abierta.
+        filas (iterable): Tuplas (nombre, puntaje).
+
+    Returns:
+        int: Cantidad de filas insertadas.
+    """
+    filas = iter(filas)
+    total = 0
+    while True:
+        lote = list(itertools.islice(filas, var.SCORE_BATCH))
+        if not lote:
+            return total
+        con.executemany(SQL_INSERTAR, lote)
+        total += len(lote)
+
+
+def guardar_puntajes(filas, path: str = var.RANKING_DB) -> int:
+    """Guarda varios puntajes, confirmando una transaccion cada SCORE_BATCH filas.
+
+    Args:
+        filas (iterable): Tuplas (nombre, puntaje).
+        path (str, optional): Ruta de la base.
+
+    Returns:
+        int: Cantidad de filas guardadas.
+    """
+    con = conectar(path)
+    filas = iter(filas)
+    total = 0
+    while True:
+        lote = list(itertools.islice(filas, var.SCORE_BATCH))
+        if not lote:
+            return total
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.executemany(SQL_INSERTAR, lote)
+            con.execute("COMMIT")
+        except sqlite3.Error:
+            con.execute("ROLLBACK")
+            raise
+        total += len(lote)
+
+
+def guardar_puntaje(nombre: str, puntaje: int, path: str = var.RANKING_DB) -> None:
+    """Guarda un puntaje en su propia transaccion.
+
+    Args:
+        nombre (str): Nombre del jugador.
+        puntaje (int): Puntaje obtenido.
+        path (str, optional): Ruta de la base.
+    """
+    guardar_puntajes([(nombre, puntaje)], path)
+
+
+def leer_top(cantidad: int = var.RANKING_TOP_K, path: str = var.RANKING_DB) -> list:
+    """Devuelve los mejores puntajes usando el indice por puntaje.
+
+    A igual puntaje queda primero el que se guardo antes.
+
+    Args:
+        cantidad (int, optional): Cantidad de puntajes.
+        path (str, optional): Ruta de la base.
+
+    Returns:
+        list: Lista de tuplas (nombre, puntaje).
+    """
+    return conectar(path).execute(SQL_TOP, (cantidad,)).fetchall()
+
+
+def leer_pagina(cursor, cantidad: int, prefijo: str = "", path: str = var.RANKING_DB) -> tuple:
+    """Devuelve una pagina del ranking a partir de un cursor.
+
+    Args:
+        cursor (tuple|None): (puntaje, id) de la ultima fila de la pagina
+            anterior, o None para la primera pagina.
+        cantidad (int): Cantidad de filas de la pagina.
+        prefijo (str, optional): Prefijo del nombre (sin distinguir mayusculas).
+        path (str, optional): Ruta de la base.
+
+    Returns:
+        tuple: (filas, cursor_siguiente) con filas como tuplas (nombre, puntaje)
+        y cursor_siguiente en None si no hay mas paginas.
+    """
+    patron = prefijo.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    con = conectar(path)
+
+    # Se pide una fila de mas para saber si hay pagina siguiente
+    if cursor is None:
+        filas = con.execute(SQL_PAGINA_INICIO, (patron, cantidad + 1)).fetchall()
+    else:
+        puntaje, ultimo_id = cursor
+        filas = con.execute(SQL_PAGINA, (puntaje, puntaje, ultimo_id, patron, cantidad + 1)).fetchall()
+
+    siguiente = None
+    if len(filas) > cantidad:
+        filas = filas[:cantidad]
+        siguiente = (filas[-1][2], filas[-1][0])
+
+    return ([(nombre, puntaje) for _, nombre, puntaje in filas], siguiente)
+
+
+def contar(path: str = var.RANKING_DB) -> int:
+    """Devuelve la cantidad de puntajes guardados.
+
+    Args:
+        path (str, optional): Ruta de la base.
+
+    Returns:
+        int: Cantidad de filas.
+    """
+    return conectar(path).execute(SQL_CONTAR).fetchone()[0]
+
+
+def migrar_csv(path_csv: str = var.RANKING_CSV, path: str = var.RANKING_DB) -> int:
+    """Copia los puntajes del CSV a la base, una unica vez por base.
+
+    La migracion corre en una sola transaccion y queda marcada en la tabla
+    meta, asi que si dos procesos la intentan a la vez solo uno la hace.
+
+    Args:
+        path_csv (str, optional): Ruta del CSV de puntajes.
+        path (str, optional): Ruta de la base.
+
+    Returns:
+        int: Cantidad de filas migradas (0 si ya estaba migrada o no hay CSV).
+    """
+    con = conectar(path)
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        if con.execute(SQL_LEER_META, ("csv_migrado",)).fetchone() is not None:
+            con.execute("ROLLBACK")
+            return 0
+
+        try:
+            with open(path_csv, "r", encoding="utf-8") as file:
+                total = _insertar(con, filter(None, map(ranking.parsear_linea, file)))
+        except FileNotFoundError:
+            total = 0
+
+        con.execute(SQL_GUARDAR_META, ("csv_migrado", path_csv))
+        con.execute("COMMIT")
+    except (sqlite3.Error, OSError, UnicodeDecodeError):
+        con.execute("ROLLBACK")
+        raise
+    return total
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.puntajes_sqlite [csv] [base]"""
+    parser = argparse.ArgumentParser(description="Copia los puntajes del CSV a la base SQLite")
+    parser.add_argument("csv", nargs="?", default=var.RANKING_CSV, help="CSV de puntajes")
+    parser.add_argument("base", nargs="?", default=var.RANKING_DB, help="Base SQLite")
+    args = parser.parse_args()
+    path_csv, path = args.csv, args.base
+
+    migradas = migrar_csv(path_csv, path)
+    print(f"Migradas: {migradas}")
+    print(f"Total en {path}: {contar(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+import os
+import heapq
+import threading
+import modules.variables as var
+
+# Indice del ranking: un archivo "<csv>.top" con los K mejores puntajes ya
+# ordenados y la cantidad de bytes del CSV que cubre. Como el CSV solo crece
+# por el final, al guardar un puntaje se leen unicamente las lineas nuevas y
+# se mezclan con el top actual; el CSV completo se recorre solo si el indice
+# no existe o no coincide con el archivo. Solo se leen lineas completas: una
+# linea a medio escribir por otro proceso queda para la proxima lectura.
+#
+# Formato del indice (utf-8):
+#   <bytes cubiertos>,<k>
+#   nombre,puntaje      <- ordenado por puntaje descendente
+
+# Ultima consulta de leer_pagina que recorrio el CSV completo. Se reutiliza
+# mientras el CSV no cambie de tamaño y se pida el mismo prefijo, asi pasar
+# de pagina no vuelve a leer todo el archivo.
+_consulta = {"clave": None, "limite": 0, "filas": []}
+
+
+def ruta_indice(path: str) -> str:
+    """Devuelve la ruta del indice de un CSV de puntajes.
+
+    Args:
+        path (str): Ruta del CSV.
+
+    Returns:
+        str: Ruta del archivo de indice.
+    """
+    return f"{path}.top"
+
+
+def parsear_linea(linea: str):
+    """Convierte una linea "nombre,puntaje" del CSV en una tupla.
+
+    Las lineas cuyo puntaje no es un numero (como el encabezado
+    "Nombre,Puntaje" de archivos viejos) se descartan.
+
+    Args:
+        linea (str): Linea del CSV.
+
+    Returns:
+        tuple|None: (nombre:str, puntaje:int) o None si la linea no es un puntaje.
+    """
+    linea = linea.strip()
+    if linea == "":
+        return None
+
+    partes = linea.split(",")
+    nombre = partes[0].strip()
+    puntaje_str = partes[1].strip() if len(partes) > 1 else ""
+
+    if not (puntaje_str.isdigit() and puntaje_str.isascii()):
+        return None
+
+    return (nombre, int(puntaje_str))
+
+
+def _leer_desde(path: str, offset: int, hasta: int = None, fin: list = None):
+    """Recorre las lineas completas del CSV desde un byte dado.
+
+    Se corta en la primera linea sin salto de linea final (otro proceso la
+    esta escribiendo) o que pasa de hasta.
+
+    Args:
+        path (str): Ruta del CSV.
+        offset (int): Byte desde el que empezar a leer.
+        hasta (int, optional): Byte en el que dejar de leer. None lee hasta el final.
+        fin (list, optional): Si se pasa, fin[0] queda en el byte siguiente a
+            la ultima linea leida.
+
+    Yields:
+        tuple: (nombre, puntaje) por cada linea con datos.
+    """
+    with open(path, "rb") as file:
+        file.seek(offset)
+        posicion = offset
+        for linea in file:
+            if not linea.endswith(b"\n") or (hasta is not None and posicion + len(linea) > hasta):
+                break
+            posicion += len(linea)
+            if fin is not None:
+                fin[0] = posicion
+            fila = parsear_linea(linea.decode("utf-8"))
+            if fila is not None:
+                yield fila
+
+
+def _mejores(filas, k: int) -> list:
+    """Devuelve los k mejores puntajes, en orden descendente.
+
+    A igual puntaje se mantiene el orden de llegada.
+
+    Args:
+        filas (iterable): Tuplas (nombre, puntaje).
+        k (int): Cantidad a conservar.
+
+    Returns:
+        list: Lista de tuplas ordenada.
+    """
+    return heapq.nlargest(k, filas, key=lambda fila: fila[1])
+
+
+def _leer_indice(path: str):
+    """Lee el indice de un CSV.
+
+    Args:
+        path (str): Ruta del CSV.
+
+    Returns:
+        tuple|None: (bytes_cubiertos, k, top) o None si no existe o esta dañado.
+    """
+    try:
+        with open(ruta_indice(path), "r", encoding="utf-8") as file:
+            cubiertos, k = (int(x) for x in file.readline().split(","))
+            top = [fila for fila in map(parsear_linea, file) if fila is not None]
+    except (OSError, ValueError):
+        return None
+    return (cubiertos, k, top)
+
+
+def _escribir_indice(path: str, cubiertos: int, k: int, top: list) -> None:
+    """Guarda el indice reemplazando el anterior de una sola vez.
+
+    Cada escritor usa su propio archivo temporal; si dos guardan a la vez
+    queda el ultimo, y si ese cubre menos bytes la proxima lectura se pone
+    al dia desde ahi.
+
+    Args:
+        path (str): Ruta del CSV.
+        cubiertos (int): Bytes del CSV incluidos en el top.
+        k (int): Tamaño del top.
+        top (list): Lista ordenada de tuplas (nombre, puntaje).
+    """
+    destino = ruta_indice(path)
+    temporal = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as file:
+        file.write(f"{cubiertos},{k}\n")
+        for nombre, puntaje in top:
+            file.write(f"{nombre},{puntaje}\n")
+    os.replace(temporal, destino)
+
+
+def agregar_filas(path: str, filas: list) -> None:
+    """Agrega puntajes al final del CSV en una sola escritura y actualiza el indice.
+
+    Args:
+        path (str): Ruta del CSV.
+        filas (list): Tuplas (nombre, puntaje).
+    """
+    with open(path, "a", encoding="utf-8") as file:
+        file.writelines(f"{nombre},{puntaje}\n" for nombre, puntaje in filas)
+
+    actualizar(path)
+
+
+def reconstruir(path: str, k: int = var.RANKING_TOP_K) -> list:
+    """Arma el indice recorriendo el CSV completo una sola vez.
+
+    Args:
+        path (str): Ruta del CSV.
+        k (int, optional): Tamaño del top.
+
+    Returns:
+        list: Top k de tuplas (nombre, puntaje).
+    """
+    if not os.path.exists(path):
+        return []
+
+    cubiertos = [0]
+    top = _mejores(_leer_desde(path, 0, os.path.getsize(path), cubiertos), k)
+    _escribir_indice(path, cubiertos[0], k, top)
+    return top
+
+
+def actualizar(path: str, k: int = var.RANKING_TOP_K) -> list:
+    """Pone el indice al dia con el CSV leyendo solo las lineas agregadas.
+
+    Si el indice no existe, es de otro tamaño o el CSV se achico, lo reconstruye.
+
+    Args:
+        path (str): Ruta del CSV.
+        k (int, optional): Tamaño del top.
+
+    Returns:
+        list: Top k de tuplas (nombre, puntaje).
+    """
+    if not os.path.exists(path):
+        return []
+
+    indice = _leer_indice(path)
+    tamaño = os.path.getsize(path)
+
+    if indice is None or indice[1] != k or indice[0] > tamaño:
+        return reconstruir(path, k)
+
+    cubiertos, _, top = indice
+    if cubiertos == tamaño:
+        return top
+
+    fin = [cubiertos]
+    nuevas = list(_leer_desde(path, cubiertos, tamaño, fin))
+    if fin[0] == cubiertos:
+        return top
+
+    top = _mejores(top + nuevas, k)
+    _escribir_indice(path, fin[0], k, top)
+    return top
+
+
+def leer_top(path: str, cantidad: int = var.RANKING_TOP_K) -> list:
+    """Devuelve los mejores puntajes del CSV, ordenados de mayor a menor.
+
+    Args:
+        path (str): Ruta del CSV.
+        cantidad (int, optional): Cantidad de puntajes. Si supera el tamaño
+            del indice se recorre el CSV completo.
+
+    Returns:
+        list: Lista de tuplas (nombre, puntaje).
+    """
+    if cantidad > var.RANKING_TOP_K:
+        if not os.path.exists(path):
+            return []
+        return _mejores(_leer_desde(path, 0), cantidad)
+
+    return actualizar(path)[:cantidad]
+
+
+def leer_pagina(path: str, inicio: int, cantidad: int, prefijo: str = "") -> list:
+    """Devuelve una pagina del ranking, opcionalmente filtrada por prefijo de nombre.
+
+    La primera pagina sin filtro sale del indice; el resto recorre el CSV
+    guardando las mejores filas hasta el doble de las pedidas (al menos
+    var.RANKING_TOP_K), que quedan
+    para las paginas siguientes con el mismo prefijo mientras el CSV no cambie.
+
+    Args:
+        path (str): Ruta del CSV.
+        inicio (int): Cantidad de filas a saltear.
+        cantidad (int): Cantidad de filas de la pagina.
+        prefijo (str, optional): Prefijo del nombre (sin distinguir mayusculas).
+
+    Returns:
+        list: Lista de tuplas (nombre, puntaje).
+    """
+    if not prefijo and inicio + cantidad <= var.RANKING_TOP_K:
+        return leer_top(path, inicio + cantidad)[inicio:]
+
+    if not os.path.exists(path):
+        return []
+
+    prefijo = prefijo.lower()
+    tamaño = os.path.getsize(path)
+    clave = (path, tamaño, prefijo)
+    limite = inicio + cantidad
+
+    if _consulta["clave"] != clave or _consulta["limite"] < limite:
+        limite = max(limite * 2, var.RANKING_TOP_K)
+        filas = (fila for fila in _leer_desde(path, 0, tamaño) if fila[0].lower().startswith(prefijo))
+        _consulta.update(clave=clave, limite=limite, filas=_mejores(filas, limite))
+
+    return _consulta["filas"][inicio:inicio + cantidad]
@@ -0,0 +1,319 @@
+import os
+import sys
+import time
+import zlib
+import struct
+import modules.variables as var
+import modules.cartas as cartas
+import modules.motor_combate as motor
+
+# Repeticion de partidas: la semilla alcanza para rearmar los mazos, asi que
+# solo se guardan las acciones del jugador con el momento en que ocurrieron
+# (milisegundos de partida transcurridos, segun el timer del motor).
+#
+# Formato binario (little endian):
+#   cabecera  "RPL1", semilla u64, timer u32, crc32 de los mazos u32
+#   eventos   tipo u8, ms u32              (uno por accion)
+#   cierre    tipo FIN u8, ms u32, puntaje i32
+#
+#   python -m modules.replay replays/*.rpl   -> re-ejecuta y verifica puntajes
+
+MAGIA = b"RPL1"
+_CABECERA = struct.Struct("<4sQII")
+_EVENTO = struct.Struct("<BI")
+_PUNTAJE = struct.Struct("<i")
+
+TIPOS = {"fin": 0, "robar": 1, "heal": 2, "shield": 3}
+_NOMBRES = {codigo: nombre for nombre, codigo in TIPOS.items()}
+
+
+def crc_mazos(estado: motor.EstadoCombate) -> int:
+    """Calcula un checksum de los dos mazos de la partida.
+
+    Sirve para detectar que las cartas o la distribucion cambiaron desde que
+    se grabo la repeticion.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+
+    Returns:
+        int: CRC32 de las rutas de frente de ambos mazos, en orden.
+    """
+    rutas = [c.ruta_frente for c in estado.mazo_player + estado.mazo_rival]
+    return zlib.crc32("\n".join(rutas).encode("utf-8"))
+
+
+def nuevo_registro(estado: motor.EstadoCombate) -> dict:
+    """Crea el registro de repeticion de una partida recien creada.
+
+    Args:
+        estado (EstadoCombate): Estado creado con motor.crear_partida.
+
+    Returns:
+        dict: {"datos": bytearray con la cabecera ya escrita, "cerrado": False}
+    """
+    datos = bytearray(_CABECERA.pack(MAGIA, estado.semilla, estado.timer_max, crc_mazos(estado)))
+    return {"datos": datos, "cerrado": False}
+
+
+def ms_transcurridos(estado: motor.EstadoCombate) -> int:
+    """Devuelve los milisegundos de partida transcurridos segun el timer.
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+
+    Returns:
+        int: Milisegundos desde el inicio.
+    """
+    return int(estado.timer_max - estado.timer_actual)
+
+
+def registrar(registro: dict, tipo: str, estado: motor.EstadoCombate) -> None:
+    """Agrega una accion del jugador al registro.
+
+    Args:
+        registro (dict): Registro de repeticion.
+        tipo (str): "robar", "heal" o "shield".
+        estado (EstadoCombate): Estado de combate (para tomar el tiempo).
+    """
+    if registro["cerrado"]:
+        return
+    registro["datos"] += _EVENTO.pack(TIPOS[tipo], ms_transcurridos(estado))
+
+
+def cerrar(registro: dict, estado: motor.EstadoCombate) -> None:
+    """Agrega el cierre con el momento del fin y el puntaje final.
+
+    Args:
+        registro (dict): Registro de repeticion.
+        estado (EstadoCombate): Estado de combate ya terminado.
+    """
+    if registro["cerrado"]:
+        return
+    registro["datos"] += _EVENTO.pack(TIPOS["fin"], ms_transcurridos(estado))
+    registro["datos"] += _PUNTAJE.pack(estado.puntaje)
+    registro["cerrado"] = True
+
+
+def guardar(registro: dict, path: str) -> None:
+    """Escribe el registro en disco.
+
+    Args:
+        registro (dict): Registro de repeticion.
+        path (str): Ruta del archivo.
+    """
+    carpeta = os.path.dirname(path)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(registro["datos"])
+
+
+def podar(carpeta: str = None, maximo: int = None) -> int:
+    """Borra las repeticiones mas viejas hasta dejar como mucho maximo.
+
+    Args:
+        carpeta (str, optional): Carpeta de repeticiones. Por defecto var.REPLAY_DIR.
+        maximo (int, optional): Cantidad a conservar. Por defecto var.REPLAY_MAX;
+            None no borra nada.
+
+    Returns:
+        int: Cantidad de archivos borrados.
+    """
+    if carpeta is None:
+        carpeta = var.REPLAY_DIR
+    if maximo is None:
+        maximo = var.REPLAY_MAX
+    if maximo is None or not os.path.isdir(carpeta):
+        return 0
+
+    archivos = [os.path.join(carpeta, nombre) for nombre in os.listdir(carpeta) if nombre.endswith(".rpl")]
+    if len(archivos) <= maximo:
+        return 0
+
+    archivos.sort(key=os.path.getmtime)
+    borrados = 0
+    for path in archivos[:len(archivos) - maximo]:
+        try:
+            os.remove(path)
+            borrados += 1
+        except OSError:
+            pass
+    return borrados
+
+
+def ruta_replay(semilla: int) -> str:
+    """Devuelve una ruta nueva donde guardar la repeticion de una partida.
+
+    El nombre lleva la fecha y hora ademas de la semilla, y un contador si ya
+    existe, asi dos partidas con la misma semilla (var.SEMILLA_PARTIDA fija)
+    no se pisan. La semilla tambien queda en la cabecera del archivo.
+
+    Args:
+        semilla (int): Semilla de la partida.
+
+    Returns:
+        str: Ruta dentro de var.REPLAY_DIR, por ejemplo
+        "replays/partida_20260101_183005_1234.rpl".
+    """
+    base = os.path.join(var.REPLAY_DIR, f"partida_{time.strftime('%Y%m%d_%H%M%S')}_{semilla}")
+    path = f"{base}.rpl"
+    numero = 1
+    while os.path.exists(path):
+        path = f"{base}_{numero}.rpl"
+        numero += 1
+    return path
+
+
+def decodificar(datos: bytes) -> dict:
+    """Lee una repeticion desde sus bytes.
+
+    Args:
+        datos (bytes): Contenido del archivo.
+
+    Raises:
+        ValueError: Si los datos no son una repeticion valida.
+
+    Returns:
+        dict: {"semilla", "timer", "crc", "eventos": [(tipo, ms)], "fin": ms|None,
+        "puntaje": int|None}
+    """
+    if len(datos) < _CABECERA.size:
+        raise ValueError("Repeticion incompleta")
+
+    magia, semilla, timer, crc = _CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA:
+        raise ValueError("No es un archivo de repeticion")
+
+    partida = {"semilla": semilla, "timer": timer, "crc": crc, "eventos": [], "fin": None, "puntaje": None}
+    pos = _CABECERA.size
+    while pos + _EVENTO.size <= len(datos):
+        codigo, ms = _EVENTO.unpack_from(datos, pos)
+        pos += _EVENTO.size
+
+        if codigo not in _NOMBRES:
+            raise ValueError(f"Evento desconocido: {codigo}")
+        if codigo == TIPOS["fin"]:
+            partida["fin"] = ms
+            partida["puntaje"] = _PUNTAJE.unpack_from(datos, pos)[0]
+            break
+        partida["eventos"].append((_NOMBRES[codigo], ms))
+
+    return partida
+
+
+def leer(path: str) -> dict:
+    """Lee una repeticion desde un archivo.
+
+    Args:
+        path (str): Ruta del archivo.
+
+    Returns:
+        dict: Repeticion decodificada (ver decodificar).
+    """
+    with open(path, "rb") as file:
+        return decodificar(file.read())
+
+
+def _avanzar(estado: motor.EstadoCombate, ms: int) -> None:
+    """Lleva el timer hasta el momento dado y revisa el fin de partida, como hace update().
+
+    Args:
+        estado (EstadoCombate): Estado de combate.
+        ms (int): Milisegundos de partida transcurridos.
+    """
+    motor.actualizar_timer(estado, ms - ms_transcurridos(estado))
+    motor.check_fin_partida(estado)
+
+
+def reproducir(partida: dict, por_serie: dict, distribucion: dict = var.DISTRIBUCION_MAZO) -> motor.EstadoCombate:
+    """Re-ejecuta una partida sin pygame aplicando sus acciones en el mismo orden.
+
+    Args:
+        partida (dict): Repeticion decodificada.
+        por_serie (dict): Cartas agrupadas por serie.
+        distribucion (dict, optional): Distribucion de cartas por serie del mazo.
+
+    Raises:
+        ValueError: Si los mazos rearmados no coinciden con los grabados.
+
+    Returns:
+        EstadoCombate: Estado final de la partida.
+    """
+    estado = motor.crear_partida(por_serie, partida["semilla"], distribucion, partida["timer"])
+    if crc_mazos(estado) != partida["crc"]:
+        raise ValueError("Los mazos no coinciden: cambiaron las cartas o la distribucion")
+
+    for tipo, ms in partida["eventos"]:
+        _avanzar(estado, ms)
+        if estado.terminada:
+            break
+
+        # Mismas reglas que form_game.handle_event
+        if tipo == "robar":
+            motor.robar_carta(estado, player=True)
+            motor.resolver_mano(estado)
+            motor.check_fin_partida(estado)
+        elif tipo == "heal":
+            motor.activar_heal(estado)
+        elif tipo == "shield":
+            motor.activar_shield(estado)
+        estado.eventos.clear()
+
+    if partida["fin"] is not None and not estado.terminada:
+        _avanzar(estado, partida["fin"])
+    estado.eventos.clear()
+    return estado
+
+
+def verificar(path: str, por_serie: dict) -> dict:
+    """Re-ejecuta una repeticion y compara el puntaje con el grabado.
+
+    Args:
+        path (str): Ruta del archivo de repeticion.
+        por_serie (dict): Cartas agrupadas por serie.
+
+    Returns:
+        dict: {"path", "ok", "registrado", "obtenido", "error"}
+    """
+    resultado = {"path": path, "ok": False, "registrado": None, "obtenido": None, "error": None}
+    try:
+        partida = leer(path)
+        estado = reproducir(partida, por_serie)
+    except (OSError, ValueError, struct.error) as e:
+        resultado["error"] = str(e)
+        return resultado
+
+    resultado["registrado"] = partida["puntaje"]
+    resultado["obtenido"] = estado.puntaje
+    resultado["ok"] = partida["puntaje"] == estado.puntaje
+    return resultado
+
+
+def main() -> None:
+    """Punto de entrada: python -m modules.replay archivo.rpl [archivo.rpl ...]"""
+    rutas = sys.argv[1:]
+    if not rutas:
+        print("Uso: python -m modules.replay archivo.rpl [archivo.rpl ...]")
+        return
+
+    por_serie = cartas.obtener_repositorio(var.JSON_CARDS)["por_serie"]
+
+    inicio = time.perf_counter()
+    errores = 0
+    for path in rutas:
+        r = verificar(path, por_serie)
+        if not r["ok"]:
+            errores += 1
+            detalle = r["error"] or f"registrado {r['registrado']}, obtenido {r['obtenido']}"
+            print(f"FALLA {path}: {detalle}")
+    duracion = time.perf_counter() - inicio
+
+    print(f"Verificadas: {len(rutas)}  Correctas: {len(rutas) - errores}  Fallas: {errores}")
+    print(f"Tiempo: {duracion:.2f} s")
+    if errores:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
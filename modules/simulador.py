@@ -0,0 +1,366 @@
+import os
+import sys
+import time
+import json
+import random
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import modules.variables as var
+import modules.cartas as cartas
+import modules.motor_combate as motor
+from modules.estadisticas import percentil_histograma
+
+try:
+    import numpy as np
+    import modules.tabla_cartas as tabla_cartas
+except ImportError:
+    tabla_cartas = None
+
+# Simulador Monte Carlo de balance: juega partidas al azar con el motor de
+# combate, repartidas en procesos, y acumula resultados por lote.
+#   python -m modules.simulador --partidas 1000000 --workers 8 --semilla 1
+
+# Ancho de los buckets del histograma de puntajes
+BUCKET_PUNTAJE = 500
+
+# Tabla columnar, armada una vez por proceso
+_tabla = None
+
+
+def _tabla_cartas(json_path: str) -> dict:
+    """Devuelve la tabla columnar de cartas, armandola una sola vez por proceso.
+
+    Args:
+        json_path (str): Ruta del JSON de cartas.
+
+    Returns:
+        dict: Tabla de cartas de tabla_cartas.
+    """
+    global _tabla
+    if _tabla is None:
+        _tabla = tabla_cartas.crear_tabla(cartas.obtener_repositorio(json_path)["cartas"])
+    return _tabla
+
+
+def simular_partida(por_serie: dict, distribucion: dict, rng: random.Random) -> dict:
+    """Arma dos mazos al azar y juega una partida completa.
+
+    Args:
+        por_serie (dict): Cartas agrupadas por serie.
+        distribucion (dict): Distribucion de cartas por serie del mazo.
+        rng (random.Random): Generador de la partida.
+
+    Returns:
+        dict: Resultado de jugar_partida.
+    """
+    mazo_player = cartas.generate_random_deck(por_serie, distribucion, rng)
+    mazo_rival = cartas.generate_random_deck(por_serie, distribucion, rng)
+    rng.shuffle(mazo_player)
+    rng.shuffle(mazo_rival)
+
+    return jugar_partida(motor.crear_estado(mazo_player, mazo_rival), rng)
+
+
+def jugar_partida(estado: motor.EstadoCombate, rng: random.Random) -> dict:
+    """Juega una partida completa con decisiones al azar.
+
+    El jugador roba hasta que termina la partida; usa el heal cuando su vida
+    baja de la mitad y activa el shield al azar una vez. El timer no corre.
+
+    Args:
+        estado (EstadoCombate): Estado inicial creado con motor.crear_estado.
+        rng (random.Random): Generador de las decisiones.
+
+    Returns:
+        dict: {"ganador", "turnos", "puntaje", "mazo"} donde mazo son las rutas del frente.
+    """
+    while not motor.check_fin_partida(estado):
+        if not estado.shield_usado and rng.random() < 0.1:
+            motor.activar_shield(estado)
+        motor.robar_carta(estado)
+        motor.resolver_mano(estado)
+        if not estado.heal_usado and estado.hp_player < estado.hp_inicial_player * 0.5:
+            motor.activar_heal(estado)
+        estado.eventos.clear()
+
+    return {
+        "ganador": estado.ganador,
+        "turnos": estado.turno_actual,
+        "puntaje": estado.puntaje,
+        "mazo": [c.ruta_frente for c in estado.mazo_player],
+    }
+
+
+def nuevo_resumen() -> dict:
+    """Crea un resumen vacio de resultados.
+
+    Returns:
+        dict: Resumen con contadores en cero.
+    """
+    return {
+        "partidas": 0,
+        "ganadores": Counter(),
+        "turnos": Counter(),
+        "puntajes": Counter(),
+        "cartas_jugadas": Counter(),
+        "cartas_ganadas": Counter(),
+    }
+
+
+def simular_lote(semilla: int, cantidad: int, distribucion: dict, json_path: str) -> dict:
+    """Juega un lote de partidas con una semilla propia (se ejecuta en un worker).
+
+    El mismo (semilla, cantidad) siempre da el mismo resultado, sin importar
+    cuantos workers haya ni en que orden terminen los lotes.
+
+    Args:
+        semilla (int): Semilla del lote.
+        cantidad (int): Cantidad de partidas.
+        distribucion (dict): Distribucion de cartas por serie del mazo.
+        json_path (str): Ruta del JSON de cartas.
+
+    Returns:
+        dict: Resumen del lote.
+    """
+    rng = random.Random(semilla)
+    resumen = nuevo_resumen()
+
+    for r in _partidas_lote(cantidad, distribucion, json_path, rng):
+        resumen["partidas"] += 1
+        resumen["ganadores"][r["ganador"]] += 1
+        resumen["turnos"][r["turnos"]] += 1
+        resumen["puntajes"][r["puntaje"] // BUCKET_PUNTAJE * BUCKET_PUNTAJE] += 1
+        resumen["cartas_jugadas"].update(r["mazo"])
+        if r["ganador"] == "player":
+            resumen["cartas_ganadas"].update(r["mazo"])
+
+    return resumen
+
+
+def _mazos_lote(series: dict, distribucion: dict, cantidad: int, rng: random.Random) -> list:
+    """Arma y mezcla los pares de mazos de todo un lote con el generador del lote.
+
+    Solo depende de cuantas cartas tiene cada serie, no de que son: con las
+    cartas del repositorio o con sus indices en la tabla columnar salen los
+    mismos mazos para la misma semilla.
+
+    Args:
+        series (dict): Serie -> lista de cartas (o de indices de la tabla).
+        distribucion (dict): Distribucion de cartas por serie del mazo.
+        cantidad (int): Cantidad de partidas.
+        rng (random.Random): Generador del lote.
+
+    Returns:
+        list: Tuplas (mazo_player, mazo_rival).
+    """
+    pares = []
+    for _ in range(cantidad):
+        mazo_player = cartas.generate_random_deck(series, distribucion, rng)
+        mazo_rival = cartas.generate_random_deck(series, distribucion, rng)
+        rng.shuffle(mazo_player)
+        rng.shuffle(mazo_rival)
+        pares.append((mazo_player, mazo_rival))
+    return pares
+
+
+def _partidas_lote(cantidad: int, distribucion: dict, json_path: str, rng: random.Random):
+    """Genera los resultados de las partidas de un lote.
+
+    Primero se arman todos los mazos del lote y despues se juegan las partidas,
+    todo con el mismo generador. Con numpy disponible los mazos se arman como
+    indices de la tabla columnar y sus stats promedio se calculan para todo el
+    lote de una vez; los resultados son los mismos que sin numpy.
+
+    Args:
+        cantidad (int): Cantidad de partidas.
+        distribucion (dict): Distribucion de cartas por serie del mazo.
+        json_path (str): Ruta del JSON de cartas.
+        rng (random.Random): Generador del lote (mazos y decisiones de juego).
+
+    Yields:
+        dict: Resultado de cada partida.
+    """
+    if tabla_cartas is None:
+        por_serie = cartas.obtener_repositorio(json_path)["por_serie"]
+        for mazo_player, mazo_rival in _mazos_lote(por_serie, distribucion, cantidad, rng):
+            yield jugar_partida(motor.crear_estado(mazo_player, mazo_rival), rng)
+        return
+
+    tabla = _tabla_cartas(json_path)
+    indices = {serie: idx.tolist() for serie, idx in tabla["por_serie"].items()}
+    pares = _mazos_lote(indices, distribucion, cantidad, rng)
+    decks_p = np.array([p for p, _ in pares], dtype=np.intp)
+    decks_r = np.array([r for _, r in pares], dtype=np.intp)
+    stats_p = tabla_cartas.calculate_average_stats_lote(tabla, decks_p)
+    stats_r = tabla_cartas.calculate_average_stats_lote(tabla, decks_r)
+
+    for i in range(cantidad):
+        estado = motor.crear_estado(
+            tabla_cartas.cartas_de_mazo(tabla, decks_p[i]),
+            tabla_cartas.cartas_de_mazo(tabla, decks_r[i]),
+            stats_p={k: int(v[i]) for k, v in stats_p.items()},
+            stats_r={k: int(v[i]) for k, v in stats_r.items()},
+        )
+        yield jugar_partida(estado, rng)
+
+
+def combinar(total: dict, parcial: dict) -> None:
+    """Suma un resumen parcial al total.
+
+    Args:
+        total (dict): Resumen acumulado (se modifica).
+        parcial (dict): Resumen de un lote.
+    """
+    total["partidas"] += parcial["partidas"]
+    for clave in ("ganadores", "turnos", "puntajes", "cartas_jugadas", "cartas_ganadas"):
+        total[clave].update(parcial[clave])
+
+
+def contribucion_cartas(resumen: dict, minimo: int = 30) -> list:
+    """Calcula cuanto cambia la tasa de victoria del jugador cuando una carta esta en su mazo.
+
+    Args:
+        resumen (dict): Resumen acumulado.
+        minimo (int, optional): Partidas minimas de una carta para incluirla.
+
+    Returns:
+        list: Lista de tuplas (ruta, partidas, tasa_victoria, contribucion) ordenada
+        por contribucion descendente.
+    """
+    if resumen["partidas"] == 0:
+        return []
+
+    base = resumen["ganadores"]["player"] / resumen["partidas"]
+    filas = []
+    for ruta, jugadas in resumen["cartas_jugadas"].items():
+        if jugadas < minimo:
+            continue
+        tasa = resumen["cartas_ganadas"][ruta] / jugadas
+        filas.append((ruta, jugadas, tasa, tasa - base))
+
+    filas.sort(key=lambda f: f[3], reverse=True)
+    return filas
+
+
+def imprimir_progreso(total: dict, objetivo: int, inicio: float) -> None:
+    """Imprime una linea de progreso con los resultados parciales.
+
+    Args:
+        total (dict): Resumen acumulado hasta ahora.
+        objetivo (int): Partidas totales pedidas.
+        inicio (float): time.perf_counter() del comienzo.
+    """
+    n = total["partidas"]
+    segundos = time.perf_counter() - inicio
+    ganadas = total["ganadores"]["player"] / n * 100 if n else 0
+    print(
+        f"\r{n}/{objetivo} partidas | jugador gana {ganadas:.2f}% | "
+        f"turnos p50 {percentil_histograma(total['turnos'], 50)} | {n / segundos:.0f} partidas/s",
+        end="", file=sys.stderr, flush=True
+    )
+
+
+def imprimir_reporte(total: dict, top: int = 10) -> None:
+    """Imprime el reporte final del balance.
+
+    Args:
+        total (dict): Resumen acumulado.
+        top (int, optional): Cantidad de cartas a mostrar arriba y abajo del ranking.
+    """
+    n = total["partidas"]
+    print(f"Partidas: {n}")
+    if n == 0:
+        return
+
+    print("\nResultados:")
+    for ganador in ("player", "rival", "empate"):
+        cantidad = total["ganadores"][ganador]
+        print(f"  {ganador:<8} {cantidad:>10}  {cantidad / n * 100:6.2f}%")
+
+    print("\nTurnos:")
+    for p in (5, 25, 50, 75, 95, 99):
+        print(f"  p{p:<3} {percentil_histograma(total['turnos'], p)}")
+
+    print("\nPuntajes (bucket de %d):" % BUCKET_PUNTAJE)
+    for bucket in sorted(total["puntajes"]):
+        cantidad = total["puntajes"][bucket]
+        print(f"  {bucket:>6}  {cantidad:>10}  {cantidad / n * 100:6.2f}%")
+
+    filas = contribucion_cartas(total)
+    print(f"\nCartas que mas suman a la victoria (top {top}):")
+    for ruta, jugadas, tasa, aporte in filas[:top]:
+        print(f"  {aporte * 100:+6.2f}%  ({tasa * 100:5.1f}% en {jugadas})  {os.path.basename(ruta)}")
+    print(f"\nCartas que mas restan (top {top}):")
+    for ruta, jugadas, tasa, aporte in filas[-top:]:
+        print(f"  {aporte * 100:+6.2f}%  ({tasa * 100:5.1f}% en {jugadas})  {os.path.basename(ruta)}")
+
+
+def simular(partidas: int, workers: int = None, semilla: int = 0, lote: int = 5000,
+            distribucion: dict = var.DISTRIBUCION_MAZO, json_path: str = var.JSON_CARDS,
+            progreso: bool = True) -> dict:
+    """Reparte las partidas en lotes entre procesos y acumula los resultados.
+
+    Cada lote usa la semilla semilla + indice_de_lote, asi una corrida se puede
+    repetir con cualquier cantidad de workers. Los resultados parciales se
+    imprimen a medida que terminan los lotes.
+
+    Args:
+        partidas (int): Cantidad total de partidas.
+        workers (int, optional): Procesos a usar. Por defecto os.cpu_count().
+        semilla (int, optional): Semilla base.
+        lote (int, optional): Partidas por lote.
+        distribucion (dict, optional): Distribucion de cartas por serie del mazo.
+        json_path (str, optional): Ruta del JSON de cartas.
+        progreso (bool, optional): True para imprimir el avance por stderr.
+
+    Returns:
+        dict: Resumen acumulado.
+    """
+    total = nuevo_resumen()
+    inicio = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futuros = []
+        for i, desde in enumerate(range(0, partidas, lote)):
+            cantidad = min(lote, partidas - desde)
+            futuros.append(pool.submit(simular_lote, semilla + i, cantidad, distribucion, json_path))
+
+        for futuro in as_completed(futuros):
+            combinar(total, futuro.result())
+            if progreso:
+                imprimir_progreso(total, partidas, inicio)
+
+    if progreso:
+        print(file=sys.stderr)
+    return total
+
+
+def main() -> None:
+    """Punto de entrada de linea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulador de balance de mazos")
+    parser.add_argument("--partidas", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--lote", type=int, default=5000)
+    parser.add_argument("--distribucion", type=str, default=None,
+                        help='JSON con la distribucion, ejemplo \'{"green": 15, "blue": 8}\'')
+    parser.add_argument("--salida", type=str, default=None, help="Guardar el resumen en un JSON")
+    args = parser.parse_args()
+    if args.partidas < 1:
+        parser.error("--partidas tiene que ser al menos 1")
+    if args.lote < 1:
+        parser.error("--lote tiene que ser al menos 1")
+
+    distribucion = json.loads(args.distribucion) if args.distribucion else var.DISTRIBUCION_MAZO
+
+    total = simular(args.partidas, args.workers, args.semilla, args.lote, distribucion)
+    imprimir_reporte(total)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as file:
+            json.dump(total, file, indent=1, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
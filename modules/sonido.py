@@ -1,4 +1,14 @@
+import os
+import time
 import pygame as pg
+import modules.variables as var
+import modules.precarga as precarga
+
+# Banco de efectos de sonido precargados: ruta -> pg.mixer.Sound
+_banco_sfx = {}
+# Canales reservados para sfx y momento en que empezo a sonar cada uno
+_canales_sfx = []
+_inicio_canal = []
 
 def init_audio_state(ctx: dict) -> None:
     """Inicializa la seccion de audio en el contexto si no existe.
@@ -7,6 +17,8 @@ def init_audio_state(ctx: dict) -> None:
         - enabled (bool): si el audio esta activo.
         - volume (float): volumen de 0.0 a 1.0.
         - current_music (str | None): ruta de la musica actualmente reproducida.
+        - stream (str | io.BytesIO | None): origen cargado en el mixer (se guarda
+          para que la musica precargada en memoria siga viva mientras suena).
 
     Args:
         ctx (dict): Contexto general del juego.
@@ -18,7 +30,8 @@ def init_audio_state(ctx: dict) -> None:
         ctx["audio"] = {
             "enabled": True,
             "volume": 0.5,
-            "current_music": None
+            "current_music": None,
+            "stream": None
         }
 
 
@@ -49,7 +62,13 @@ def play_music(ctx: dict, path: str, volume: float = 0.3, loop: int = -1) -> Non
         pg.mixer.music.set_volume(audio["volume"])
         return
 
-    pg.mixer.music.load(path)
+    # Si la musica ya fue precargada se reproduce desde memoria
+    origen = precarga.musica(path)
+    if isinstance(origen, str):
+        pg.mixer.music.load(origen)
+    else:
+        pg.mixer.music.load(origen, os.path.splitext(path)[1][1:])
+    audio["stream"] = origen
     pg.mixer.music.set_volume(audio["volume"])
     pg.mixer.music.play(loop)
     audio["current_music"] = path
@@ -145,16 +164,78 @@ def set_volume_0_100(ctx: dict, vol: int) -> None:
     set_music_volume(ctx, vol / 100)
 
 
-def play_sfx(path: str, volume: float = 1.0) -> None:
-    """Reproduce un efecto de sonido sin usar caché ni manejo de errores.
+def iniciar_banco_sfx(canales: int = var.SFX_CANALES) -> None:
+    """Precarga todos los efectos *_SFX de variables y reserva canales para ellos.
+
+    Los canales reservados no los usa pygame para otros sonidos, asi los
+    efectos nunca compiten con Sound.play() sueltos.
+
+    Args:
+        canales (int, optional): Cantidad de canales a reservar para sfx.
+
+    Returns:
+        None
+    """
+    if not pg.mixer.get_init():
+        return
+
+    for nombre in dir(var):
+        if nombre.endswith("_SFX"):
+            path = getattr(var, nombre)
+            if path not in _banco_sfx:
+                _banco_sfx[path] = pg.mixer.Sound(path)
+
+    if pg.mixer.get_num_channels() < canales:
+        pg.mixer.set_num_channels(canales)
+    pg.mixer.set_reserved(canales)
+
+    _canales_sfx.clear()
+    _inicio_canal.clear()
+    for i in range(canales):
+        _canales_sfx.append(pg.mixer.Channel(i))
+        _inicio_canal.append(0.0)
+
+
+def _elegir_canal() -> int:
+    """Devuelve el indice del canal reservado a usar para el proximo sfx.
+
+    Usa el primer canal libre; si todos estan sonando, roba el que empezo
+    hace mas tiempo (voice stealing).
+
+    Returns:
+        int: Indice dentro de los canales reservados.
+    """
+    for i, canal in enumerate(_canales_sfx):
+        if not canal.get_busy():
+            return i
+    return _inicio_canal.index(min(_inicio_canal))
+
+
+def play_sfx(path: str, volume: float = 0.2) -> None:
+    """Reproduce un efecto de sonido desde el banco precargado.
+
+    Si el efecto no estaba en el banco se carga una vez y queda guardado.
+    Sin mixer inicializado (por ejemplo en modo headless) no hace nada.
 
     Args:
         path (str): Ruta del archivo de efecto de sonido.
-        volume (float, optional): Volumen de 0.0 a 1.0. Por defecto 1.0.
+        volume (float, optional): Volumen de 0.0 a 1.0. Por defecto 0.2.
 
     Returns:
         None
     """
-    sound = pg.mixer.Sound(path)
-    sound.set_volume(0.2)
-    sound.play()
+    if not pg.mixer.get_init():
+        return
+    if not _canales_sfx:
+        iniciar_banco_sfx()
+
+    sound = _banco_sfx.get(path)
+    if sound is None:
+        sound = pg.mixer.Sound(path)
+        _banco_sfx[path] = sound
+
+    i = _elegir_canal()
+    canal = _canales_sfx[i]
+    canal.play(sound)
+    canal.set_volume(volume)
+    _inicio_canal[i] = time.perf_counter()
@@ -0,0 +1,191 @@
+import numpy as np
+import modules.cartas as cartas
+
+# Tabla columnar de cartas: un array por stat y mazos representados como
+# arrays de indices, para calcular stats, daño y ataque de muchos mazos sin
+# recorrer diccionarios. Requiere numpy (dependencia opcional: el juego no la usa).
+
+
+def crear_tabla(cards: list) -> dict:
+    """Arma la tabla columnar a partir de las cartas del repositorio.
+
+    Args:
+        cards (list): Lista de Carta del repositorio.
+
+    Returns:
+        dict: {"cartas", "hp", "atk", "def", "bonus", "ataque_total", "daño",
+        "serie", "series", "por_serie"} donde por_serie mapea cada serie a un
+        array con los indices de sus cartas.
+    """
+    series = sorted({c.serie for c in cards})
+    codigo = {s: i for i, s in enumerate(series)}
+
+    hp = np.array([c.hp for c in cards], dtype=np.int64)
+    atk = np.array([c.atk for c in cards], dtype=np.int64)
+    defn = np.array([c.defensa for c in cards], dtype=np.int64)
+    bonus = np.array([c.bonus for c in cards], dtype=np.float64)
+    serie = np.array([codigo[c.serie] for c in cards], dtype=np.int16)
+
+    return {
+        "cartas": cards,
+        "hp": hp,
+        "atk": atk,
+        "def": defn,
+        "bonus": bonus,
+        # Mismas cuentas que cartas.calcular_ataque_total y cartas.calcular_daño
+        "ataque_total": atk + bonus,
+        "daño": (hp + atk + defn + 3 * bonus).astype(np.int64),
+        "serie": serie,
+        "series": series,
+        "por_serie": {s: np.flatnonzero(serie == codigo[s]) for s in series},
+    }
+
+
+def cargar_tabla(path: str) -> dict:
+    """Arma la tabla columnar con las cartas del repositorio compartido.
+
+    Args:
+        path (str): Ruta del JSON de cartas.
+
+    Returns:
+        dict: Tabla de cartas.
+    """
+    return crear_tabla(cartas.obtener_repositorio(path)["cartas"])
+
+
+def generate_random_deck(tabla: dict, distribution: dict, rng: np.random.Generator) -> np.ndarray:
+    """Genera un mazo aleatorio (como array de indices) cumpliendo la distribucion de series.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        distribution (dict): Distribucion de cartas por serie, ejemplo {"platinum":1, "black":3}
+        rng (np.random.Generator): Generador a usar.
+
+    Returns:
+        np.ndarray: Indices de las cartas del mazo, ya mezclados.
+    """
+    partes = []
+    for serie, cantidad in distribution.items():
+        indices = tabla["por_serie"].get(serie)
+        if indices is None:
+            continue
+        partes.append(rng.choice(indices, size=min(cantidad, len(indices)), replace=False))
+
+    if not partes:
+        return np.empty(0, dtype=np.int64)
+
+    deck = np.concatenate(partes)
+    rng.shuffle(deck)
+    return deck
+
+
+def generate_random_decks_lote(tabla: dict, distribution: dict, cantidad: int, rng: np.random.Generator) -> np.ndarray:
+    """Genera muchos mazos aleatorios a la vez, sin repetir cartas dentro de cada mazo.
+
+    Para cada serie se sortea una clave al azar por carta y mazo y se toman
+    las de menor clave, lo que equivale a un sample sin reemplazo por fila.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        distribution (dict): Distribucion de cartas por serie.
+        cantidad (int): Cantidad de mazos.
+        rng (np.random.Generator): Generador a usar.
+
+    Returns:
+        np.ndarray: Matriz (cantidad, tamaño_mazo) de indices, con cada fila mezclada.
+    """
+    partes = []
+    for serie, n in distribution.items():
+        indices = tabla["por_serie"].get(serie)
+        if indices is None:
+            continue
+        n = min(n, len(indices))
+        elegidas = np.argsort(rng.random((cantidad, len(indices))), axis=1)[:, :n]
+        partes.append(indices[elegidas])
+
+    if not partes:
+        return np.empty((cantidad, 0), dtype=np.int64)
+
+    decks = np.concatenate(partes, axis=1)
+    return rng.permuted(decks, axis=1)
+
+
+def calculate_average_stats(tabla: dict, deck: np.ndarray) -> dict:
+    """Calcula el promedio de HP, ATK y DEF de un mazo de indices.
+
+    Devuelve lo mismo que cartas.calculate_average_stats para las mismas cartas.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        deck (np.ndarray): Indices de las cartas del mazo.
+
+    Returns:
+        dict: Promedios de stats {"hp": ..., "atk": ..., "def": ...}
+    """
+    n = len(deck)
+    if n == 0:
+        return {"hp": 0, "atk": 0, "def": 0}
+
+    return {
+        "hp": int(tabla["hp"][deck].sum()) * 15 // n,
+        "atk": int(tabla["atk"][deck].sum()) // n,
+        "def": int(tabla["def"][deck].sum()) // n,
+    }
+
+
+def calculate_average_stats_lote(tabla: dict, decks: np.ndarray) -> dict:
+    """Calcula los promedios de muchos mazos del mismo tamaño a la vez.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        decks (np.ndarray): Matriz (cantidad_mazos, tamaño_mazo) de indices.
+
+    Returns:
+        dict: {"hp", "atk", "def"} con un array de promedios por mazo.
+    """
+    n = decks.shape[1]
+    return {
+        "hp": tabla["hp"][decks].sum(axis=1) * 15 // n,
+        "atk": tabla["atk"][decks].sum(axis=1) // n,
+        "def": tabla["def"][decks].sum(axis=1) // n,
+    }
+
+
+def calcular_ataque_total(tabla: dict, deck: np.ndarray) -> np.ndarray:
+    """Devuelve el ataque total (atk + bonus) de cada carta del mazo.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        deck (np.ndarray): Indices de las cartas.
+
+    Returns:
+        np.ndarray: Ataque total por carta.
+    """
+    return tabla["ataque_total"][deck]
+
+
+def calcular_daño(tabla: dict, deck: np.ndarray) -> np.ndarray:
+    """Devuelve el daño total (hp + atk + def + 3 * bonus) de cada carta del mazo.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        deck (np.ndarray): Indices de las cartas.
+
+    Returns:
+        np.ndarray: Daño por carta como enteros.
+    """
+    return tabla["daño"][deck]
+
+
+def cartas_de_mazo(tabla: dict, deck: np.ndarray) -> list:
+    """Convierte un mazo de indices en la lista de cartas que usa el motor de combate.
+
+    Args:
+        tabla (dict): Tabla de cartas.
+        deck (np.ndarray): Indices de las cartas.
+
+    Returns:
+        list: Lista de Carta del repositorio.
+    """
+    cards = tabla["cartas"]
+    return [cards[i] for i in deck.tolist()]
@@ -1,12 +1,29 @@
-import pygame as pg
-import modules.auxiliar as aux
 ########## Configs Juego ##########
 ASPECT_RATIO = (1000, 600)
 GAME_TITLE = 'Yu Gi Ball\nCard Trading Game'
 FPS = 30
+IDLE_WAIT_MS = 500
+IDLE_RAMP_MS = 1000
+DIRTY_RECTS = True
+# Forms que se mantienen cargados a la vez (None: todos). Minimo 2: resultados lee la partida.
+FORMS_CARGADOS_MAX = 4
+# Perfilador de frames: muestras por etapa, refresco del overlay, archivo de
+# exportacion (F4), si tambien se exporta al cerrar el juego y tamaño de la
+# fuente del overlay
+PERFIL_MUESTRAS = 600
+PERFIL_REFRESCO_MS = 500
+PERFIL_ARCHIVO = 'perfil_frames.json'
+PERFIL_EXPORTAR_AL_SALIR = False
+PERFIL_FUENTE = 16
 STAGE_TIMER = 200000
+# Semilla fija para todas las partidas (None: una semilla nueva por partida)
+SEMILLA_PARTIDA = None
 JSON_CARDS = 'modules/decks/cartas.json'
-GAME_ICON = pg.image.load("assets/img/icons/pog.png")
+GAME_ICON = "assets/img/icons/pog.png"
+IMG_CACHE_MAX = 64
+TEXT_CACHE_MAX = 256
+ASSET_CACHE_DIR = "assets/cache"
+ASSET_CACHE_VERSION = 2
 
 ########## Img Botones ##########
 WISH_HEAL = "assets/img/buttons_image/heal.png"
@@ -16,6 +33,12 @@ PLAY_HAND = "assets/img/buttons_image/btn_play_hand.png"
 ########## Fuentes ##########
 FONT_PATH = "assets/fonts/Saiyan-Sans.ttf"
 ALT_FONT_PATH = "assets/fonts/alagard.ttf"
+# Tamaños de cada fuente que usan los forms y el overlay del perfilador
+# (se crean al iniciar el juego)
+FUENTES_EN_USO = {
+    FONT_PATH: (35, 36, 40, 48),
+    ALT_FONT_PATH: (PERFIL_FUENTE, 20, 26, 28, 36),
+}
 
 ########## Fondos de formularios ##########
 FONDO_MENU = "assets/img/forms/form_main_menu.png"
@@ -28,6 +51,42 @@ FONDO_DERROTA = "assets/img/forms/form_enter_name_0.png"
 
 ########## Archivos ##########
 RANKING_CSV = 'puntajes.csv'
+# Cantidad de puntajes que guarda el indice del ranking (puntajes.csv.top)
+RANKING_TOP_K = 100
+# Filas por pagina en la pantalla de ranking
+RANKING_FILAS = 10
+# Pausa al escribir en el filtro del ranking antes de buscar (Enter busca enseguida)
+RANKING_FILTRO_MS = 300
+RANKING_DB = 'puntajes.db'
+# Donde se guardan los puntajes: "csv" (RANKING_CSV, con el indice del ranking)
+# o "sqlite" (RANKING_DB, opcional)
+SCORE_BACKEND = "csv"
+# Modo de journal de SQLite. WAL necesita que todos los procesos esten en el
+# mismo equipo; en un volumen de red compartido usar "DELETE".
+SCORE_JOURNAL = "WAL"
+# Filas por transaccion al insertar puntajes en lote
+SCORE_BATCH = 500
+# Con SCORE_BACKEND = "sqlite": si la base nueva copia los puntajes de
+# RANKING_CSV la primera vez que se usa (desde ahi el CSV deja de recibir puntajes)
+SCORE_MIGRAR_CSV = True
+# Carpeta donde se guarda la repeticion de cada partida y cuantas se conservan
+# (al pasarse se borran las mas viejas; None: sin limite)
+REPLAY_DIR = 'replays'
+REPLAY_MAX = 50
+# Benchmarks: linea de base, tolerancia antes de marcar regresion,
+# rondas por benchmark y duracion minima de cada ronda en segundos
+BENCH_BASELINE = 'bench_baseline.json'
+BENCH_UMBRAL = 0.25
+BENCH_RONDAS = 5
+BENCH_MIN_SEG = 0.1
+# Generador de carga (modules.carga_partidas): partidas totales, simultaneas,
+# ms de juego medios entre acciones, segundos reales por segundo de juego
+# y donde se guardan los puntajes de prueba segun el backend
+CARGA_PARTIDAS = 2000
+CARGA_CONCURRENCIA = 500
+CARGA_PENSAR_MS = 800
+CARGA_ESCALA = 0.01
+CARGA_DESTINO = {"sqlite": 'carga_puntajes.db', "csv": 'carga_puntajes.csv'}
 
 COLORS = {
     "grey": (70,70,70),
@@ -66,4 +125,5 @@ CLICK_SFX = "assets/audio/sounds/click_scouter.ogg"
 DANGER_SFX = "assets/audio/sounds/ssj_effect.ogg"
 WIN_SFX = "assets/audio/sounds/item.mp3"
 SHIELD_SFX = "assets/audio/sounds/shield_activated.ogg"
-SHIELD_BROKEN_SFX = "assets/audio/sounds/shield_deactivated.ogg"
\ No newline at end of file
+SHIELD_BROKEN_SFX = "assets/audio/sounds/shield_deactivated.ogg"
+SFX_CANALES = 6
\ No newline at end of file